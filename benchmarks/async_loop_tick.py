@@ -0,0 +1,84 @@
+# benchmarks/async_loop_tick.py
+"""
+Tick latency and idle CPU of the Tk event loop, with and without the
+asyncio bridge.
+
+Runs a bare Tcl interpreter (no display needed) and drives it the way
+mainloop() does, with a 200 ms after() tick like MainUI.update_ui:
+- "after() only": the current approach
+- "with bridge, idle": AsyncBridge running, nothing submitted
+- "with bridge, busy": one coroutine round trip per tick
+
+    python benchmarks/async_loop_tick.py [--seconds 10]
+"""
+import argparse
+import statistics
+import time
+import tkinter
+
+from tomatix.ui.async_bridge import AsyncBridge
+
+TICK_MS = 200
+
+
+def run(seconds, bridge_mode):
+    interp = tkinter.Tcl()
+    bridge = None
+    if bridge_mode:
+        bridge = AsyncBridge(interp)
+        bridge.start()
+
+    lateness = []
+    round_trips = []
+    state = {"expected": None, "done": False}
+
+    async def echo(sent):
+        return sent
+
+    def tick():
+        now = time.perf_counter()
+        if state["expected"] is not None:
+            lateness.append(now - state["expected"])
+        if bridge_mode == "busy":
+            bridge.submit(echo(now), on_done=lambda f: round_trips.append(time.perf_counter() - f.result()))
+        state["expected"] = now + TICK_MS / 1000
+        interp.after(TICK_MS, tick)
+
+    interp.after(TICK_MS, tick)
+    interp.after(int(seconds * 1000), lambda: state.update(done=True))
+    state["expected"] = time.perf_counter() + TICK_MS / 1000
+
+    cpu_start = time.process_time()
+    while not state["done"]:
+        interp.tk.dooneevent(0)
+    cpu = time.process_time() - cpu_start
+
+    if bridge is not None:
+        bridge.stop()
+    return lateness, round_trips, cpu
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    for label, mode in (("after() only", None), ("with bridge, idle", "idle"), ("with bridge, busy", "busy")):
+        lateness, round_trips, cpu = run(args.seconds, mode)
+        line = (
+            f"{label:>18}: tick lateness p50 {statistics.median(lateness) * 1000:6.3f} ms, "
+            f"p99 {percentile(lateness, 0.99) * 1000:6.3f} ms, "
+            f"CPU {cpu / args.seconds * 100:5.2f}% of one core"
+        )
+        if round_trips:
+            line += f", round trip p50 {statistics.median(round_trips) * 1000:.3f} ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# benchmarks/focus_view_frame_cost.py
+"""
+Frame cost of FocusView with and without the progress ring.
+
+Simulates a running phase by moving the timer's start time back one tick
+(200 ms, like MainUI.update_ui) per frame, so a whole phase replays in a
+few seconds. Each frame is update_ui() plus the idle flush Tk would run.
+Needs a display (use xvfb-run on headless machines).
+
+    python benchmarks/focus_view_frame_cost.py [--phase-minutes 25]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import customtkinter as ctk
+
+from tomatix.core.persistence import PersistenceManager
+from tomatix.core.timer_controller import TimerController
+from tomatix.ui.views.focus_view import FocusView
+
+TICK_SECONDS = 0.2
+
+
+def run(root, phase_minutes, with_ring):
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    controller = TimerController(persistence_manager=PersistenceManager(db_path=db_path))
+    controller.save_settings(phase_minutes * 60, 5 * 60, 20 * 60, 4)
+
+    view = FocusView(root, controller, colors={
+        "primary": "#E8927C", "secondary": "#A4B0B2", "background": "#2B2B2B",
+        "text": "#FFFFFF", "success": "#7CB69D", "warning": "#DEB992", "accent": "#C17F59",
+    })
+    if not with_ring:
+        # Text-only baseline: the ring is neither shown nor updated
+        view.progress_ring.pack_forget()
+        view._update_ring = lambda state: None
+    view.pack(fill="both", expand=True)
+    root.update()
+
+    controller.start()
+    frames = int(phase_minutes * 60 / TICK_SECONDS) - 1
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for _ in range(frames):
+        controller.timer.start_time -= TICK_SECONDS
+        view.update_ui()
+        root.update_idletasks()
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    ring_stats = view.progress_ring.get_redraw_stats()
+    view.destroy()
+    return frames, cpu, wall, ring_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--phase-minutes", type=int, default=25)
+    args = parser.parse_args()
+
+    root = ctk.CTk()
+    for label, with_ring in (("text only", False), ("with ring", True)):
+        frames, cpu, wall, ring_stats = run(root, args.phase_minutes, with_ring)
+        print(
+            f"{label:>10}: {frames} frames, "
+            f"{cpu / frames * 1e6:7.1f} us CPU/frame, {wall / frames * 1e6:7.1f} us wall/frame"
+        )
+        if with_ring:
+            print(
+                f"{'':>10}  ring drawn {ring_stats['drawn']} times, "
+                f"skipped {ring_stats['skipped']} sub-pixel updates "
+                f"(one redraw every {frames * TICK_SECONDS / max(1, ring_stats['drawn']):.1f} s)"
+            )
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
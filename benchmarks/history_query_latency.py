@@ -0,0 +1,147 @@
+# benchmarks/history_query_latency.py
+"""
+Query latency of PersistenceManager (and StatisticsView) against history size.
+
+For each --years value, generates a synthetic history (see
+synthetic_history.py) ending today, merging --profiles profiles into one
+database for heavier days, then times the reads behind the Focus and
+Statistics views. "cold" runs start from empty in-memory caches (as on the
+first Statistics visit after launch); "warm" runs repeat on the same caches.
+With --view and a display, StatisticsView.update_statistics() is timed too.
+
+    python benchmarks/history_query_latency.py [--years 1 5 10 20] [--profiles 1] [--repeat 5] [--view]
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+from synthetic_history import write_profile
+from tomatix.core.merge import merge_databases
+from tomatix.core.persistence import PersistenceManager
+
+
+def build_database(workdir, years, profiles, seed):
+    """One database holding `profiles` synthetic profiles of `years` years each."""
+    end_date = date.today()
+    paths = []
+    for index in range(profiles):
+        path = os.path.join(workdir, f"y{years}-p{index}.db")
+        write_profile(path, index, years, seed, end_date)
+        paths.append(path)
+    if profiles == 1:
+        return paths[0]
+    merged = os.path.join(workdir, f"y{years}-merged.db")
+    merge_databases(merged, paths)
+    return merged
+
+
+def time_call(func, repeat, before=None):
+    """Median milliseconds of `func()` over `repeat` runs, calling `before()` untimed first."""
+    timings = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def measure(db_path, repeat, view=None):
+    persistence_manager = PersistenceManager(db_path=db_path)
+    today = date.fromisoformat(persistence_manager.get_local_date())
+    month_ago = (today - timedelta(days=29)).isoformat()
+    year_ago = (today - timedelta(days=364)).isoformat()
+    today = today.isoformat()
+    cold = persistence_manager.invalidate_stats_cache
+    top_tag = (persistence_manager.get_tag_totals("0000-01-01", today, limit=1) or [(None,)])[0][0]
+
+    results = {
+        "today_stats_cold": time_call(persistence_manager.get_today_stats, repeat, cold),
+        "today_stats_warm": time_call(persistence_manager.get_today_stats, repeat),
+        "range_30d_cold": time_call(lambda: persistence_manager.get_stats(month_ago, today), repeat, cold),
+        "range_365d_cold": time_call(lambda: persistence_manager.get_stats(year_ago, today), repeat, cold),
+        "daily_minutes_365d": time_call(lambda: persistence_manager.get_daily_minutes(year_ago, today), repeat),
+        "analytics_cold": time_call(persistence_manager.get_analytics_summary, repeat, cold),
+        "analytics_warm": time_call(persistence_manager.get_analytics_summary, repeat),
+        "distributions_cold": time_call(persistence_manager.get_session_distributions, repeat, cold),
+        "distributions_warm": time_call(persistence_manager.get_session_distributions, repeat),
+        "tag_totals_30d_cold": time_call(
+            lambda: persistence_manager.get_tag_totals(month_ago, today), repeat, cold),
+        "tag_totals_30d_warm": time_call(lambda: persistence_manager.get_tag_totals(month_ago, today), repeat),
+        "tag_stats_all_time": time_call(
+            lambda: persistence_manager.get_tag_stats(top_tag, "0000-01-01", today), repeat),
+    }
+    if view is not None:
+        results["statistics_view_cold"] = time_call(
+            lambda: view.update(persistence_manager), repeat, cold)
+    sessions = persistence_manager.db_conn.execute("SELECT COUNT(*) FROM focus_sessions").fetchone()[0]
+    persistence_manager.db_conn.close()
+    return sessions, results
+
+
+class ViewHarness:
+    """A StatisticsView on a hidden root, re-pointed at each database in turn."""
+
+    def __init__(self):
+        import customtkinter as ctk
+        from tomatix.core.timer_controller import TimerController
+        from tomatix.ui.views.statistics_view import StatisticsView
+        self.root = ctk.CTk()
+        self.root.withdraw()
+        self._make_view = lambda persistence_manager: StatisticsView(
+            self.root, TimerController(persistence_manager=persistence_manager))
+        self.view = None
+        self.persistence_manager = None
+
+    def update(self, persistence_manager):
+        if persistence_manager is not self.persistence_manager:
+            if self.view is not None:
+                self.view.destroy()
+            self.view = self._make_view(persistence_manager)
+            self.persistence_manager = persistence_manager
+        # Forget the loaded heatmap range too, as on the first visit after launch
+        self.view.heatmap.end_date = None
+        self.view.update_statistics()
+        self.root.update_idletasks()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", type=float, nargs="+", default=[1, 5, 10, 20])
+    parser.add_argument("--profiles", type=int, default=1, help="profiles merged into each database")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--view", action="store_true", help="also time StatisticsView (needs a display)")
+    parser.add_argument("--json", default=None, help="write the results to this file")
+    args = parser.parse_args()
+
+    view = None
+    if args.view:
+        if not os.environ.get("DISPLAY"):
+            parser.error("--view needs a display; run under xvfb-run")
+        view = ViewHarness()
+
+    workdir = tempfile.mkdtemp()
+    columns = []
+    for years in args.years:
+        db_path = build_database(workdir, years, args.profiles, args.seed)
+        sessions, results = measure(db_path, args.repeat, view)
+        columns.append({"years": years, "sessions": sessions, "ms": results})
+
+    print(f"{'median ms':<22}" + "".join(f"{format(c['years'], 'g') + ' y':>12}" for c in columns))
+    print(f"{'sessions':<22}" + "".join(f"{c['sessions']:>12,}" for c in columns))
+    for name in columns[0]["ms"]:
+        print(f"{name:<22}" + "".join(f"{c['ms'][name]:>12.3f}" for c in columns))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(columns, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
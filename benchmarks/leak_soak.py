@@ -0,0 +1,139 @@
+# benchmarks/leak_soak.py
+"""
+Soak test: thousands of simulated timer cycles must leave memory flat.
+
+Each cycle completes the current phase at once by moving the timer's start
+back by the phase length, so completions, database writes and callbacks
+run exactly as they do at a real deadline. With the UI (the default, under
+Xvfb when there is no $DISPLAY) every cycle also shows and closes the
+completion alert and switches through every view; every --settings-every
+cycles it opens and saves the settings window. --core skips Tk entirely.
+
+After --warmup cycles a LeakMonitor baseline is taken. The run fails (exit 1)
+if traced Python memory grew by more than --max-growth-kb, or any widget,
+Tcl command or pending after() count grew at all.
+
+    python benchmarks/leak_soak.py [--cycles 2000] [--core]
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+from tomatix.app.leaks import LeakMonitor
+from tomatix.core.persistence import PersistenceManager
+from tomatix.core.shared_state import StatePublisher
+from tomatix.core.timer_controller import TimerController
+
+
+def complete_phase(controller):
+    if not controller.get_state()["running"]:
+        controller.start()
+    controller.timer.start_time -= controller.timer.get_full_time()
+    controller.update()
+
+
+def soak_core(args, persistence_manager, workdir):
+    controller = TimerController(
+        persistence_manager=persistence_manager,
+        state_publisher=StatePublisher(os.path.join(workdir, "tomatix.state")),
+    )
+    completions = []
+    controller.add_mode_complete_callback(lambda ended_mode: completions.append(ended_mode) and None)
+
+    def cycle(_):
+        complete_phase(controller)
+        completions.clear()
+
+    return cycle, None, lambda: None
+
+
+def soak_ui(args, persistence_manager, workdir):
+    import customtkinter as ctk
+    from tomatix.ui.main_ui import MainUI
+
+    root = ctk.CTk()
+    ui = MainUI(root, persistence_manager=persistence_manager)
+    controller = ui.timer_controller
+
+    def cycle(index):
+        complete_phase(controller)
+        root.update()
+        ui.alert_window.close()
+        for name in ui.views:
+            ui.switch_view(name)
+            root.update_idletasks()
+        if index % args.settings_every == 0:
+            window = ui.open_settings_window()
+            root.update_idletasks()
+            window.save_settings()
+            if window.winfo_exists():
+                window.destroy()
+        root.update()
+
+    def close():
+        ui.shutdown()
+        root.destroy()
+
+    return cycle, root, close
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=200, help="cycles before the baseline")
+    parser.add_argument("--settings-every", type=int, default=10)
+    parser.add_argument("--max-growth-kb", type=float, default=512)
+    parser.add_argument("--core", action="store_true", help="timer and database only, no Tk")
+    args = parser.parse_args()
+
+    display = None
+    if not args.core and not os.environ.get("DISPLAY"):
+        from ui_frame_time import start_virtual_display
+        display = start_virtual_display()
+
+    workdir = tempfile.mkdtemp()
+    os.environ["XDG_RUNTIME_DIR"] = workdir
+    persistence_manager = PersistenceManager(db_path=os.path.join(workdir, "soak.db"))
+    # Whole minutes, so saving the settings window unchanged keeps them
+    persistence_manager.save_settings(60, 60, 60, 4)
+
+    monitor = LeakMonitor(top=15)
+    monitor.start()
+    try:
+        cycle, root, close = (soak_core if args.core else soak_ui)(args, persistence_manager, workdir)
+        for index in range(args.warmup):
+            cycle(index)
+        baseline = monitor.take_sample(root)
+        for index in range(args.warmup, args.warmup + args.cycles):
+            cycle(index)
+        sample = monitor.take_sample(root)
+        growth = monitor.get_growth(sample, baseline)
+        print(f"{args.cycles} cycles after {args.warmup} warm-up cycles")
+        print(monitor.get_report(sample, baseline))
+        close()
+    finally:
+        monitor.stop()
+        if display is not None:
+            display.terminate()
+            display.wait()
+
+    failures = []
+    if growth["traced_bytes"] > args.max_growth_kb * 1024:
+        failures.append(f"traced memory grew {growth['traced_bytes'] / 1024:.1f} KiB "
+                        f"({growth['traced_bytes'] / args.cycles:.0f} bytes/cycle)")
+    for kind in ("live_widgets", "widget_objects"):
+        grown = {name: delta for name, delta in growth[kind].items() if delta > 0}
+        if grown:
+            failures.append(f"{kind} grew: {grown}")
+    for kind in ("tcl_commands", "pending_after"):
+        if growth[kind] > 0:
+            failures.append(f"{kind} grew by {growth[kind]}")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    print("FAIL" if failures else "PASS")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+# benchmarks/session_api_load.py
+"""
+Load generator for the HTTP/JSON session API.
+
+Starts the server on a throwaway database (or targets --url), creates
+--sessions timers, then keeps --connections keep-alive connections busy
+for --seconds with a mix of state reads, actions and batched requests.
+Reports requests per second and latency percentiles per request type.
+
+    python benchmarks/session_api_load.py [--sessions 200] [--connections 32] [--seconds 10]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlsplit
+
+# Weighted request mix: mostly status polling, as status bars and dashboards do
+MIX = [("state", 70), ("action", 20), ("batch", 10)]
+BATCH_SIZE = 10
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection."""
+
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def open(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            key, _, value = line.decode().partition(":")
+            if key.lower() == "content-length":
+                length = int(value)
+        await self.reader.readexactly(length)
+        return status
+
+    def close(self):
+        self.writer.close()
+
+
+async def worker(host, port, names, deadline, latencies, errors, seed):
+    rng = random.Random(seed)
+    kinds, weights = zip(*MIX)
+    connection = Connection(host, port)
+    await connection.open()
+    try:
+        while time.perf_counter() < deadline:
+            kind = rng.choices(kinds, weights)[0]
+            name = rng.choice(names)
+            if kind == "state":
+                request = ("GET", f"/sessions/{name}", None)
+            elif kind == "action":
+                request = ("POST", f"/sessions/{name}/{rng.choice(['start', 'pause', 'reset'])}", None)
+            else:
+                request = ("POST", "/batch", {"requests": [
+                    {"session": rng.choice(names), "action": "state"} for _ in range(BATCH_SIZE)
+                ]})
+            started = time.perf_counter()
+            status = await connection.request(*request)
+            latencies[kind].append(time.perf_counter() - started)
+            if status != 200:
+                errors[kind] += 1
+    finally:
+        connection.close()
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run(host, port, args):
+    names = [f"bench-{i}" for i in range(args.sessions)]
+    setup = Connection(host, port)
+    await setup.open()
+    for start in range(0, len(names), 100):
+        await setup.request("POST", "/batch", {"requests": [
+            {"session": name, "action": "create"} for name in names[start:start + 100]
+        ]})
+    setup.close()
+
+    latencies = {kind: [] for kind, _ in MIX}
+    errors = {kind: 0 for kind, _ in MIX}
+    started = time.perf_counter()
+    deadline = started + args.seconds
+    await asyncio.gather(*(
+        worker(host, port, names, deadline, latencies, errors, seed)
+        for seed in range(args.connections)
+    ))
+    elapsed = time.perf_counter() - started
+
+    everything = [value for values in latencies.values() for value in values]
+    print(f"{len(everything)} requests in {elapsed:.1f} s over {args.connections} connections, "
+          f"{args.sessions} sessions: {len(everything) / elapsed:,.0f} req/s")
+    for kind, values in [("all", everything)] + list(latencies.items()):
+        if values:
+            print(f"{kind:>7}: {len(values):>8} requests, p50 {statistics.median(values) * 1000:7.2f} ms, "
+                  f"p99 {percentile(values, 0.99) * 1000:7.2f} ms, errors {errors.get(kind, sum(errors.values()))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default=None, help="target a running server instead of starting one")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port
+    else:
+        db_path = os.path.join(tempfile.mkdtemp(), "load.db")
+        server = subprocess.Popen(
+            [sys.executable, "-m", "tomatix.server.http_api", "--port", "0", "--db", db_path],
+            stdout=subprocess.PIPE, text=True
+        )
+        # "Tomatix session API listening on http://host:port"
+        url = urlsplit(server.stdout.readline().split()[-1])
+        host, port = url.hostname, url.port
+    try:
+        asyncio.run(run(host, port, args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
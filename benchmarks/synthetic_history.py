@@ -0,0 +1,167 @@
+# benchmarks/synthetic_history.py
+"""
+Deterministic synthetic focus history, written straight into the Tomatix schema.
+
+Every profile is one database, like one person's (or machine's)
+tomatix_stats.db, with its own habits: rounds per day, usual start hour,
+preferred round length, weekend and vacation behaviour, how often rounds
+end early, time zone, and a handful of project tags used with Zipf-like
+frequency. Sessions, daily totals and per-tag daily totals are generated
+in Python and bulk-inserted with executemany, one transaction per chunk.
+
+The same --seed, profile index, --years and --end-date always produce the
+same rows.
+
+    python benchmarks/synthetic_history.py OUT_DIR [--profiles 20] [--years 5] [--seed 0] [--end-date 2026-10-01]
+"""
+import argparse
+import os
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from tomatix.core.persistence import PersistenceManager
+
+CHUNK_ROWS = 50_000
+FOCUS_LENGTHS = [15, 25, 30, 45, 50, 60, 90]
+UTC_OFFSET_HOURS = [-8, -7, -6, -5, -4, 0, 1, 2, 3, 5.5, 8, 9, 10]
+PROJECT_WORDS = ["thesis", "api", "frontend", "reading", "taxes", "research", "infra", "writing",
+                 "design", "hiring", "docs", "review", "ops", "study", "music", "garden"]
+
+
+def make_profile(rng):
+    """Habits of one synthetic user, drawn from `rng`."""
+    focus_length = rng.choice(FOCUS_LENGTHS)
+    tags = rng.sample(PROJECT_WORDS, rng.randint(2, 8))
+    return {
+        "utc_offset": int(rng.choice(UTC_OFFSET_HOURS) * 3600),
+        "rounds_per_day": rng.uniform(2, 12),
+        "weekday_active": rng.uniform(0.6, 0.98),
+        "weekend_active": rng.uniform(0.05, 0.6),
+        "start_hour": rng.uniform(6, 14),
+        "focus_length": focus_length,
+        "break_minutes": max(5, focus_length // 5),
+        "early_rate": rng.uniform(0.02, 0.25),
+        "vacation_rate": rng.uniform(0.002, 0.01),
+        "tags": tags,
+        # Zipf-like: the first project gets most of the time
+        "tag_weights": [1 / (rank + 1) for rank in range(len(tags))],
+        "untagged_rate": rng.uniform(0.0, 0.5),
+    }
+
+
+def generate_sessions(profile, rng, start_date, end_date):
+    """
+    Yields (ended_at, utc_offset, duration_minutes, planned_minutes,
+    ended_early, tag, local_date) per Focus Round, day by day.
+    """
+    offset = profile["utc_offset"]
+    vacation_left = 0
+    day = start_date
+    while day <= end_date:
+        if vacation_left:
+            vacation_left -= 1
+        elif rng.random() < profile["vacation_rate"]:
+            vacation_left = rng.randint(3, 14)
+        active = profile["weekend_active"] if day.weekday() >= 5 else profile["weekday_active"]
+        if not vacation_left and rng.random() < active:
+            rounds = max(1, round(rng.gauss(profile["rounds_per_day"], profile["rounds_per_day"] / 3)))
+            tag = None if rng.random() < profile["untagged_rate"] else rng.choices(
+                profile["tags"], profile["tag_weights"])[0]
+            # Local midnight as epoch seconds, then the day's first round
+            midnight = datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp() - offset
+            cursor = midnight + max(0.0, rng.gauss(profile["start_hour"], 1.0)) * 3600
+            local_date = day.isoformat()
+            for _ in range(rounds):
+                planned = profile["focus_length"]
+                early = rng.random() < profile["early_rate"]
+                duration = rng.randint(1, planned - 1) if early and planned > 1 else planned
+                cursor += duration * 60
+                if cursor - midnight >= 86400:
+                    break  # Keep every round on its own local day
+                yield cursor, offset, duration, planned, int(early), tag, local_date
+                cursor += profile["break_minutes"] * 60 + rng.expovariate(1 / 300)
+                # Switch projects now and then during the day
+                if rng.random() < 0.2:
+                    tag = rng.choices(profile["tags"], profile["tag_weights"])[0]
+        day += timedelta(days=1)
+
+
+def write_profile(path, index, years, seed, end_date):
+    """Write one profile's history to a fresh database at `path`. Returns the session count."""
+    rng = random.Random(f"{seed}-{index}")
+    profile = make_profile(rng)
+    start_date = end_date - timedelta(days=round(years * 365.25) - 1)
+
+    if os.path.exists(path):
+        os.remove(path)
+    persistence_manager = PersistenceManager(db_path=path)
+    conn = persistence_manager.db_conn
+    # A throwaway file; durability doesn't matter while filling it
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA journal_mode = MEMORY")
+
+    daily = {}
+    tag_daily = {}
+    sessions = []
+    count = 0
+
+    def flush():
+        with conn:
+            conn.executemany("""
+                INSERT INTO focus_sessions (ended_at, utc_offset, duration_minutes, planned_minutes, ended_early, tag)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, sessions)
+        sessions.clear()
+
+    for ended_at, offset, duration, planned, early, tag, local_date in generate_sessions(
+            profile, rng, start_date, end_date):
+        sessions.append((ended_at, offset, duration, planned, early, tag))
+        totals = daily.setdefault(local_date, [0, 0])
+        totals[0] += 1
+        totals[1] += duration
+        if tag is not None:
+            totals = tag_daily.setdefault((tag, local_date), [0, 0])
+            totals[0] += 1
+            totals[1] += duration
+        count += 1
+        if len(sessions) >= CHUNK_ROWS:
+            flush()
+    flush()
+
+    with conn:
+        conn.executemany("""
+            INSERT INTO focus_round_stats (date, total_focus_rounds, total_minutes) VALUES (?, ?, ?)
+        """, ((day, rounds, minutes) for day, (rounds, minutes) in sorted(daily.items())))
+        conn.executemany("""
+            INSERT INTO focus_tag_stats (tag, date, total_focus_rounds, total_minutes) VALUES (?, ?, ?, ?)
+        """, ((tag, day, rounds, minutes) for (tag, day), (rounds, minutes) in sorted(tag_daily.items())))
+    conn.execute("ANALYZE")
+    conn.close()
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("out_dir")
+    parser.add_argument("--profiles", type=int, default=20)
+    parser.add_argument("--years", type=float, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--end-date", type=date.fromisoformat, default=date.today(),
+                        help="last day of history, YYYY-MM-DD (default: today)")
+    args = parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    started = time.perf_counter()
+    total = 0
+    for index in range(args.profiles):
+        path = os.path.join(args.out_dir, f"profile-{index:03d}.db")
+        count = write_profile(path, index, args.years, args.seed, args.end_date)
+        total += count
+        print(f"{path}: {count} sessions")
+    elapsed = time.perf_counter() - started
+    print(f"{total} sessions in {elapsed:.1f} s ({total / elapsed:,.0f} sessions/s)")
+
+
+if __name__ == "__main__":
+    main()
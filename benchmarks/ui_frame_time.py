@@ -0,0 +1,258 @@
+# benchmarks/ui_frame_time.py
+"""
+Frame time, event latency and memory of the full MainUI over a long run.
+
+Starts MainUI on a throwaway database inside a virtual display (Xvfb, started
+automatically when there is no $DISPLAY) and drives it with a scripted, seeded
+mix of user actions while the timer runs with one-minute phases:
+- switch_view: show the Focus, Stats or Support view
+- toggle: start/pause the timer
+- settings: open the settings window and save it unchanged
+- alert: show the completion alert, closed again a second later
+Natural phase completions add their own alerts on top.
+
+Reports per-tick update_ui duration (and with the redraw it triggers),
+update_ui tick lateness, per-action latency from the moment the action was
+due until its redraw finished, and RSS/widget counts sampled over the run.
+Use --json to save the results and --baseline to compare against them.
+
+    python benchmarks/ui_frame_time.py [--minutes 10] [--json results.json] [--baseline old.json]
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import customtkinter as ctk
+
+from tomatix.core.metrics import _process_rss_bytes
+from tomatix.core.persistence import PersistenceManager
+from tomatix.ui.main_ui import MainUI
+
+# Weighted action mix, one action every --action-ms
+MIX = [("switch_view", 40), ("toggle", 30), ("settings", 10), ("alert", 20)]
+ALERT_VISIBLE_MS = 1000
+PHASE_SECONDS = 60
+
+# A p99 only counts as a regression if it is worse by both margins
+REGRESSION_RATIO = 1.25
+REGRESSION_MIN_MS = 1.0
+
+
+def start_virtual_display():
+    """Start Xvfb on a free display number and point $DISPLAY at it. Returns the process."""
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        sys.exit("No $DISPLAY and Xvfb is not installed; install it or run under xvfb-run")
+    read_fd, write_fd = os.pipe()
+    process = subprocess.Popen(
+        [xvfb, "-displayfd", str(write_fd), "-screen", "0", "1280x800x24", "-nolisten", "tcp"],
+        pass_fds=(write_fd,), stderr=subprocess.DEVNULL
+    )
+    os.close(write_fd)
+    # Xvfb writes the display number it picked once it is ready for clients
+    with os.fdopen(read_fd) as f:
+        display = f.readline().strip()
+    if not display:
+        process.kill()
+        sys.exit("Xvfb failed to start")
+    os.environ["DISPLAY"] = f":{display}"
+    return process
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def summarize(values):
+    if not values:
+        return None
+    ordered = sorted(values)
+    pick = lambda fraction: ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+    return {
+        "count": len(ordered),
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": pick(0.95),
+        "p99_ms": pick(0.99),
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def run(args):
+    workdir = tempfile.mkdtemp()
+    # Keep the state file away from a real Tomatix running on this machine
+    os.environ["XDG_RUNTIME_DIR"] = workdir
+    persistence_manager = PersistenceManager(db_path=os.path.join(workdir, "bench.db"))
+    # Whole minutes, so saving the settings window unchanged keeps them
+    persistence_manager.save_settings(PHASE_SECONDS, PHASE_SECONDS, PHASE_SECONDS, 4)
+
+    root = ctk.CTk()
+    root.geometry("600x700")
+    ui = MainUI(root, persistence_manager=persistence_manager)
+    rng = random.Random(args.seed)
+    kinds, weights = zip(*MIX)
+
+    series = {"update_ui": [], "frame": [], "tick_lateness": []}
+    series.update({kind: [] for kind in kinds + ("alert_close",)})
+    memory = []
+    state = {"next_tick": None}
+
+    # MainUI.update_ui reschedules itself through self.update_ui, so an
+    # instance attribute takes over from the next tick on
+    update_ui = ui.update_ui
+
+    def timed_update_ui():
+        started = time.perf_counter()
+        if state["next_tick"] is not None:
+            series["tick_lateness"].append(max(0.0, started - state["next_tick"]))
+        update_ui()
+        updated = time.perf_counter()
+        # Run the redraw this tick queued now, so it is charged to the frame
+        root.update_idletasks()
+        finished = time.perf_counter()
+        series["update_ui"].append(updated - started)
+        series["frame"].append(finished - started)
+        state["next_tick"] = updated + 0.2
+
+    ui.update_ui = timed_update_ui
+
+    def perform(kind):
+        if kind == "switch_view":
+            ui.switch_view(rng.choice(list(ui.views)))
+        elif kind == "toggle":
+            ui.toggle_timer()
+        elif kind == "settings":
+            window = ui.open_settings_window()
+            root.update_idletasks()
+            window.save_settings()
+            if window.winfo_exists():
+                # Still open means validation failed; don't let windows pile up
+                window.destroy()
+        elif kind == "alert":
+            ui.handle_timer_completion(rng.choice(["Focus Round", "Recharge"]))
+            schedule(ALERT_VISIBLE_MS, "alert_close")
+        elif kind == "alert_close":
+            ui.alert_window.close()
+
+    def schedule(delay_ms, kind):
+        due = time.perf_counter() + delay_ms / 1000
+
+        def fire():
+            perform(kind)
+            root.update_idletasks()
+            series[kind].append(time.perf_counter() - due)
+            if kind != "alert_close":
+                schedule(args.action_ms, rng.choices(kinds, weights)[0])
+
+        root.after(delay_ms, fire)
+
+    def sample_memory():
+        memory.append({
+            "seconds": time.perf_counter() - started,
+            "rss_bytes": _process_rss_bytes(),
+            "widgets": count_widgets(root),
+        })
+        root.after(int(args.sample_seconds * 1000), sample_memory)
+
+    started = time.perf_counter()
+    ui.toggle_timer()
+    schedule(args.action_ms, rng.choices(kinds, weights)[0])
+    sample_memory()
+    root.after(int(args.minutes * 60 * 1000), root.quit)
+    root.mainloop()
+    sample_memory()
+    ui.shutdown()
+    root.destroy()
+
+    results = {name: summarize(values) for name, values in series.items()}
+    results["memory"] = summarize_memory(memory)
+    results["alert_display"] = ui.alert_window.get_display_latency_stats()
+    return results
+
+
+def summarize_memory(samples):
+    """First/last/peak RSS and widget count, plus the RSS trend in MB per hour."""
+    rss = [sample["rss_bytes"] or 0 for sample in samples]
+    seconds = [sample["seconds"] for sample in samples]
+    slope = statistics.linear_regression(seconds, rss).slope if len(set(seconds)) > 1 else 0.0
+    return {
+        "samples": len(samples),
+        "rss_first_mb": rss[0] / 2**20,
+        "rss_last_mb": rss[-1] / 2**20,
+        "rss_peak_mb": max(rss) / 2**20,
+        "rss_mb_per_hour": slope * 3600 / 2**20,
+        "widgets_first": samples[0]["widgets"],
+        "widgets_last": samples[-1]["widgets"],
+    }
+
+
+def compare(results, baseline):
+    """Names of timing series whose p99 regressed against `baseline`."""
+    regressions = []
+    for name, summary in results.items():
+        old = baseline.get(name)
+        if not summary or not old or "p99_ms" not in summary or "p99_ms" not in old:
+            continue
+        if (summary["p99_ms"] > old["p99_ms"] * REGRESSION_RATIO
+                and summary["p99_ms"] - old["p99_ms"] > REGRESSION_MIN_MS):
+            regressions.append(f"{name}: p99 {old['p99_ms']:.2f} ms -> {summary['p99_ms']:.2f} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=10)
+    parser.add_argument("--action-ms", type=int, default=500, help="time between scripted actions")
+    parser.add_argument("--sample-seconds", type=float, default=10, help="time between memory samples")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--xvfb", action="store_true", help="use Xvfb even when $DISPLAY is set")
+    parser.add_argument("--json", default=None, help="write the results to this file")
+    parser.add_argument("--baseline", default=None, help="compare p99s against an earlier --json file")
+    args = parser.parse_args()
+
+    display = None
+    if args.xvfb or not os.environ.get("DISPLAY"):
+        display = start_virtual_display()
+    try:
+        results = run(args)
+    finally:
+        if display is not None:
+            display.terminate()
+            display.wait()
+
+    for name, summary in results.items():
+        if name in ("memory", "alert_display"):
+            continue
+        if summary is None:
+            print(f"{name:>13}: no samples")
+            continue
+        print(
+            f"{name:>13}: {summary['count']:>7} samples, p50 {summary['p50_ms']:7.2f} ms, "
+            f"p95 {summary['p95_ms']:7.2f} ms, p99 {summary['p99_ms']:7.2f} ms, max {summary['max_ms']:7.2f} ms"
+        )
+    memory = results["memory"]
+    print(
+        f"{'memory':>13}: RSS {memory['rss_first_mb']:.1f} -> {memory['rss_last_mb']:.1f} MB "
+        f"(peak {memory['rss_peak_mb']:.1f}, trend {memory['rss_mb_per_hour']:+.2f} MB/h), "
+        f"widgets {memory['widgets_first']} -> {memory['widgets_last']}"
+    )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f))
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# src/tomatix/app/leaks.py
+import gc
+import os
+import time
+import tkinter
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+
+
+class LeakMonitor:
+    """
+    Long-run leak detection. Every `interval` seconds it takes a tracemalloc
+    snapshot and counts Tk widgets by class, Tcl commands and pending after()
+    callbacks, then reports what grew since the baseline sample taken one
+    interval after start-up (once imports, caches and pooled windows settled).
+
+    Widgets are counted twice: "live" ones in the window tree, and every
+    tkinter object Python still holds. Destroyed windows kept alive by a
+    callback or a cache only show up in the second count.
+    """
+
+    # Traceback depth recorded per allocation; deeper is slower
+    FRAMES = 10
+    # Allocations from the snapshot machinery itself are ignored
+    IGNORED_FILES = ("<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>", "<unknown>",
+                     tracemalloc.__file__)
+
+    def __init__(self, interval=300, top=10, output=None):
+        self.interval = interval
+        self.top = top
+        # Reports are appended to this file as well as printed
+        self.output = output
+        self.root = None
+        self.baseline = None
+        self.samples = 0
+        self._after_id = None
+        self._started_tracing = False
+
+    def start(self):
+        """Start tracing allocations. Call before building the UI so its allocations have tracebacks."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.FRAMES)
+            self._started_tracing = True
+
+    def watch(self, root):
+        """Sample `root`'s interpreter every interval, the first sample becoming the baseline."""
+        self.start()
+        self.root = root
+        self._after_id = root.after(int(self.interval * 1000), self._tick)
+
+    def stop(self):
+        """Cancel sampling, print a final report if a baseline exists and stop tracing."""
+        if self._after_id is not None and self.root is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tkinter.TclError:
+                pass  # The interpreter is already gone
+            self._after_id = None
+        if self.baseline is not None and self.root is not None:
+            try:
+                self._emit(self.get_report(self.take_sample(self.root)))
+            except tkinter.TclError:
+                pass
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _tick(self):
+        self._after_id = None
+        sample = self.take_sample(self.root)
+        if self.baseline is None:
+            self.baseline = sample
+        else:
+            self._emit(self.get_report(sample))
+        self._after_id = self.root.after(int(self.interval * 1000), self._tick)
+
+    def take_sample(self, root=None):
+        """
+        Returns a dict with a filtered tracemalloc snapshot and Tk counts for
+        `root`. Without a root (no display, e.g. a core-only soak) the Tk
+        counts stay empty.
+        """
+        gc.collect()
+        self.samples += 1
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, pattern) for pattern in self.IGNORED_FILES]
+        )
+        sample = {
+            "time": time.time(),
+            "traced_bytes": tracemalloc.get_traced_memory()[0],
+            "snapshot": snapshot,
+            "live_widgets": Counter(),
+            "widget_objects": Counter(
+                type(obj).__name__ for obj in gc.get_objects() if isinstance(obj, tkinter.Misc)
+            ),
+            "tcl_commands": 0,
+            "pending_after": 0,
+        }
+        if root is not None:
+            sample["live_widgets"] = self._count_live_widgets(root)
+            sample["tcl_commands"] = len(root.tk.splitlist(root.tk.call("info", "commands")))
+            sample["pending_after"] = len(root.tk.splitlist(root.tk.call("after", "info")))
+        return sample
+
+    def _count_live_widgets(self, root):
+        counts = Counter()
+        stack = [root]
+        while stack:
+            widget = stack.pop()
+            counts[type(widget).__name__] += 1
+            stack.extend(widget.winfo_children())
+        return counts
+
+    def get_growth(self, sample, baseline=None):
+        """
+        What grew from `baseline` (default: the monitor's baseline) to `sample`:
+        a dict of traced_bytes, per-class widget deltas, Tcl command and after()
+        deltas, and the top allocation sites by size growth.
+        """
+        baseline = baseline or self.baseline
+        stats = sample["snapshot"].compare_to(baseline["snapshot"], "lineno")
+        sites = [stat for stat in stats if stat.size_diff > 0][:self.top]
+        return {
+            "seconds": sample["time"] - baseline["time"],
+            "traced_bytes": sample["traced_bytes"] - baseline["traced_bytes"],
+            "live_widgets": self._diff(sample["live_widgets"], baseline["live_widgets"]),
+            "widget_objects": self._diff(sample["widget_objects"], baseline["widget_objects"]),
+            "tcl_commands": sample["tcl_commands"] - baseline["tcl_commands"],
+            "pending_after": sample["pending_after"] - baseline["pending_after"],
+            "sites": [
+                (f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size_diff, stat.count_diff)
+                for stat in sites
+            ],
+        }
+
+    @staticmethod
+    def _diff(current, previous):
+        return {
+            name: current[name] - previous[name]
+            for name in sorted(set(current) | set(previous))
+            if current[name] != previous[name]
+        }
+
+    def get_report(self, sample, baseline=None):
+        growth = self.get_growth(sample, baseline)
+        hours = max(growth["seconds"], 1) / 3600
+        lines = [
+            f"Leak check at {datetime.now():%Y-%m-%d %H:%M:%S}, {growth['seconds'] / 60:.1f} min after baseline:",
+            f"  traced Python memory {growth['traced_bytes'] / 1024:+.1f} KiB "
+            f"({growth['traced_bytes'] / 1024 / hours:+.1f} KiB/h)",
+            f"  Tcl commands {growth['tcl_commands']:+d}, pending after() {growth['pending_after']:+d}",
+            f"  live widgets: {self._format_counts(growth['live_widgets'])}",
+            f"  widget objects: {self._format_counts(growth['widget_objects'])}",
+            f"  top {self.top} allocation sites by growth:",
+        ]
+        for site, size_diff, count_diff in growth["sites"]:
+            lines.append(f"    {size_diff / 1024:+10.1f} KiB {count_diff:+8d} blocks  {site}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_counts(deltas):
+        return ", ".join(f"{name} {delta:+d}" for name, delta in deltas.items()) or "unchanged"
+
+    def _emit(self, report):
+        print(report, flush=True)
+        if self.output:
+            os.makedirs(os.path.dirname(os.path.abspath(self.output)), exist_ok=True)
+            with open(self.output, "a") as f:
+                f.write(report + "\n\n")
@@ -1,16 +1,52 @@
 # src/tomatix/app/main.py
+import argparse
 import customtkinter as ctk
 from tomatix.ui.main_ui import MainUI
 
-def main(debug=False):
+def main(debug=False, profile=False, profile_dir=None, profile_top=20,
+         metrics_port=None, metrics_file=None, metrics_interval=15,
+         leak_check=False, leak_interval=300, leak_log=None):
     """
     Initialize the CustomTkinter environment and launch the main Tomatix UI.
     We separate this from the UI class so that future entry points
     (e.g., CLI or web) can reuse the same UI logic if needed.
+
+    With `profile`, the mainloop runs under cProfile with every after() callback
+    timed; stats files and a top-`profile_top` summary are written on exit.
+
+    Metrics are served on 127.0.0.1:`metrics_port` and/or rewritten to
+    `metrics_file` every `metrics_interval` seconds, in Prometheus text format.
+
+    With `leak_check`, memory and Tk widget counts are sampled every
+    `leak_interval` seconds and growth since the first sample is printed
+    (and appended to `leak_log`).
     """
     if debug:
         print("[DEBUG] main: starting application")
 
+    profiler = None
+    if profile:
+        from tomatix.app.profiling import AppProfiler
+        profiler = AppProfiler(output_dir=profile_dir, top=profile_top)
+        # Installed before any widget exists so no callback escapes timing
+        profiler.install()
+
+    leak_monitor = None
+    if leak_check:
+        from tomatix.app.leaks import LeakMonitor
+        leak_monitor = LeakMonitor(interval=leak_interval, output=leak_log)
+        # Traced from the start so allocations made while building the UI have tracebacks
+        leak_monitor.start()
+
+    exporter = None
+    if metrics_port is not None or metrics_file:
+        from tomatix.core.metrics import MetricsExporter
+        exporter = MetricsExporter(debug=debug)
+        if metrics_port is not None:
+            exporter.serve(metrics_port)
+        if metrics_file:
+            exporter.write_periodically(metrics_file, metrics_interval)
+
     ctk.set_appearance_mode("System")
     ctk.set_default_color_theme("blue")
 
@@ -19,10 +55,57 @@ def main(debug=False):
 
     # Create the main UI
     app = MainUI(root, debug=debug)
+    if leak_monitor:
+        leak_monitor.watch(root)
 
     if debug:
         print("[DEBUG] main: entering mainloop")
-    root.mainloop()
+    try:
+        if profiler:
+            profiler.run(root)
+        else:
+            root.mainloop()
+    finally:
+        if leak_monitor:
+            leak_monitor.stop()
+        app.shutdown()
+        if exporter:
+            exporter.stop()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Tomatix Timer")
+    parser.add_argument("--debug", action="store_true", help="print debug logs")
+    parser.add_argument("--profile", action="store_true",
+                        help="profile the session and time every after() callback")
+    parser.add_argument("--profile-dir", default=None,
+                        help="where to write profile stats (default: ./tomatix-profile-<timestamp>)")
+    parser.add_argument("--profile-top", type=int, default=20,
+                        help="number of entries in the printed summary")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="serve Prometheus metrics on 127.0.0.1:PORT/metrics")
+    parser.add_argument("--metrics-file", default=None,
+                        help="rewrite Prometheus metrics to this file periodically")
+    parser.add_argument("--metrics-interval", type=float, default=15,
+                        help="seconds between metrics file writes")
+    parser.add_argument("--leak-check", action="store_true",
+                        help="periodically report memory and Tk widget growth")
+    parser.add_argument("--leak-interval", type=float, default=300,
+                        help="seconds between leak checks")
+    parser.add_argument("--leak-log", default=None,
+                        help="also append leak reports to this file")
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
-    main(debug=False)
+    args = parse_args()
+    main(
+        debug=args.debug,
+        profile=args.profile,
+        profile_dir=args.profile_dir,
+        profile_top=args.profile_top,
+        metrics_port=args.metrics_port,
+        metrics_file=args.metrics_file,
+        metrics_interval=args.metrics_interval,
+        leak_check=args.leak_check,
+        leak_interval=args.leak_interval,
+        leak_log=args.leak_log,
+    )
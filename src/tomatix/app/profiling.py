@@ -0,0 +1,127 @@
+# src/tomatix/app/profiling.py
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import time
+import tkinter
+from datetime import datetime
+
+class AppProfiler:
+    """
+    Profiles a whole application run: cProfile around the Tk mainloop, plus
+    wall-clock timing of every after()/after_idle() callback (MainUI.update_ui,
+    the AlertWindow auto-close, debounces, customtkinter's own timers...).
+    Callbacks slower than STALL_MS are counted as UI stalls.
+    """
+
+    STALL_MS = 50
+
+    def __init__(self, output_dir=None, top=20):
+        self.output_dir = output_dir or f"tomatix-profile-{datetime.now():%Y%m%d-%H%M%S}"
+        self.top = top
+        self.profile = cProfile.Profile()
+        self.callback_stats = {}
+        self._original_after = None
+        self._started_at = None
+
+    def install(self):
+        """Start timing after() callbacks. Every Tk widget shares tkinter.Misc.after."""
+        if self._original_after is not None:
+            return
+        original_after = self._original_after = tkinter.Misc.after
+        profiler = self
+
+        def after(widget, ms, func=None, *args):
+            if func is None:
+                return original_after(widget, ms)
+            return original_after(widget, ms, profiler._wrap(func), *args)
+
+        tkinter.Misc.after = after
+
+    def uninstall(self):
+        if self._original_after is not None:
+            tkinter.Misc.after = self._original_after
+            self._original_after = None
+
+    def _wrap(self, func):
+        module = getattr(func, "__module__", None) or type(func).__module__
+        name = f"{module}.{getattr(func, '__qualname__', type(func).__qualname__)}"
+
+        @functools.wraps(func)
+        def timed(*args):
+            start = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self._record(name, (time.perf_counter() - start) * 1000)
+
+        return timed
+
+    def _record(self, name, elapsed_ms):
+        stats = self.callback_stats.get(name)
+        if stats is None:
+            stats = self.callback_stats[name] = {
+                "calls": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "stalls": 0,
+            }
+        stats["calls"] += 1
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+        if elapsed_ms > self.STALL_MS:
+            stats["stalls"] += 1
+
+    def run(self, root):
+        """Run root.mainloop() under the profiler, then dump the results."""
+        self.install()
+        self._started_at = time.perf_counter()
+        self.profile.enable()
+        try:
+            root.mainloop()
+        finally:
+            self.profile.disable()
+            self.uninstall()
+            self.dump()
+
+    def dump(self):
+        """
+        Write tomatix.prof (pstats format), callbacks.json and summary.txt to
+        output_dir and print the summary.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.profile.dump_stats(os.path.join(self.output_dir, "tomatix.prof"))
+
+        with open(os.path.join(self.output_dir, "callbacks.json"), "w") as f:
+            json.dump(self.callback_stats, f, indent=2, sort_keys=True)
+
+        summary = self.get_summary()
+        with open(os.path.join(self.output_dir, "summary.txt"), "w") as f:
+            f.write(summary)
+        print(summary)
+        print(f"Profile written to {os.path.abspath(self.output_dir)}")
+
+    def get_summary(self):
+        """Top-N after() callbacks by total time, then the top-N functions by cumulative time."""
+        lines = []
+        if self._started_at is not None:
+            lines.append(f"Session length: {time.perf_counter() - self._started_at:.1f} s")
+
+        lines.append(f"Top {self.top} after() callbacks by total time (stall > {self.STALL_MS} ms):")
+        lines.append(f"{'calls':>8} {'total ms':>10} {'mean ms':>8} {'max ms':>8} {'stalls':>6}  callback")
+        ranked = sorted(self.callback_stats.items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        for name, stats in ranked[:self.top]:
+            lines.append(
+                f"{stats['calls']:>8} {stats['total_ms']:>10.1f} "
+                f"{stats['total_ms'] / stats['calls']:>8.2f} {stats['max_ms']:>8.1f} "
+                f"{stats['stalls']:>6}  {name}"
+            )
+
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats("cumulative").print_stats(self.top)
+        lines.append("")
+        lines.append(stream.getvalue())
+        return "\n".join(lines)
@@ -0,0 +1,3 @@
+from tomatix.core.flow_score import calculate_flow_score, explore_schedules, pareto_suggestions
+
+__all__ = ["calculate_flow_score", "explore_schedules", "pareto_suggestions"]
@@ -0,0 +1,134 @@
+# src/tomatix/core/analytics.py
+from datetime import date, timedelta
+
+
+class RollingWindow:
+    """
+    Sum of daily minutes over the `days` days ending at `end`, slid forward a
+    day at a time instead of being re-summed from scratch.
+    """
+    def __init__(self, days):
+        self.days = days
+        self.end = None
+        self.total = 0
+
+    def reset(self, end, daily):
+        self.end = end
+        self.total = sum(
+            daily.get(end - timedelta(days=offset), (0, 0))[1]
+            for offset in range(self.days)
+        )
+
+    def advance(self, to, daily):
+        """Slide the window so it ends at `to`."""
+        if self.end is None or (to - self.end).days >= self.days:
+            # Nothing in the old window survives, start over
+            self.reset(to, daily)
+            return
+        while self.end < to:
+            self.end += timedelta(days=1)
+            self.total -= daily.get(self.end - timedelta(days=self.days), (0, 0))[1]
+            self.total += daily.get(self.end, (0, 0))[1]
+
+    def add(self, day, minutes):
+        if self.end is not None and self.end - timedelta(days=self.days) < day <= self.end:
+            self.total += minutes
+
+
+class FocusAnalytics:
+    """
+    Streaks, rolling averages and week-over-week trends over focus_round_stats.
+    Built once from the full history, then kept current by add() as each
+    round is logged, so opening the statistics screen never rescans years of rows.
+    """
+    def __init__(self, min_rounds=1):
+        # A day counts toward a streak once it has at least this many rounds
+        self.min_rounds = min_rounds
+
+        self.daily = {}  # date -> (total_focus_rounds, total_minutes)
+        self.streak_end = None  # last qualifying day of the most recent streak
+        self.streak_length = 0
+        self.longest_streak = 0
+
+        self.last_7 = RollingWindow(7)
+        self.last_14 = RollingWindow(14)
+        self.last_30 = RollingWindow(30)
+
+        # Set when add() can't update incrementally (e.g. a day arriving out of order)
+        self.needs_recompute = False
+
+    def recompute(self, rows, today):
+        """
+        Full recompute from (date, total_focus_rounds, total_minutes) rows,
+        dates as YYYY-MM-DD strings. This is the fallback path.
+        """
+        self.daily = {
+            date.fromisoformat(day): (rounds, minutes)
+            for day, rounds, minutes in rows
+        }
+        self.streak_end = None
+        self.streak_length = 0
+        self.longest_streak = 0
+        for day in sorted(self.daily):
+            if self._qualifies(day):
+                self._extend_streak(day)
+
+        today = self._as_date(today)
+        for window in (self.last_7, self.last_14, self.last_30):
+            window.reset(today, self.daily)
+        self.needs_recompute = False
+
+    def add(self, day, rounds, minutes):
+        """Incrementally account for `rounds` more rounds totalling `minutes` on `day`."""
+        day = self._as_date(day)
+        qualified_before = self._qualifies(day)
+        previous_rounds, previous_minutes = self.daily.get(day, (0, 0))
+        self.daily[day] = (previous_rounds + rounds, previous_minutes + minutes)
+
+        for window in (self.last_7, self.last_14, self.last_30):
+            window.add(day, minutes)
+
+        if not qualified_before and self._qualifies(day):
+            if self.streak_end is not None and day <= self.streak_end:
+                # A backfilled day can join or split streaks; leave it to recompute()
+                self.needs_recompute = True
+            else:
+                self._extend_streak(day)
+
+    def get_summary(self, today):
+        """
+        Returns a dict with current_streak, longest_streak, avg_7 and avg_30
+        (minutes per day) and week_over_week (fractional change of the last
+        7 days against the 7 before, None without a previous week).
+        """
+        today = self._as_date(today)
+        for window in (self.last_7, self.last_14, self.last_30):
+            window.advance(today, self.daily)
+
+        # A streak is still alive if it reached yesterday; today may not be done yet
+        alive = self.streak_end is not None and (today - self.streak_end).days <= 1
+        previous_week = self.last_14.total - self.last_7.total
+        return {
+            "current_streak": self.streak_length if alive else 0,
+            "longest_streak": self.longest_streak,
+            "avg_7": self.last_7.total / 7,
+            "avg_30": self.last_30.total / 30,
+            "week_over_week": (
+                (self.last_7.total - previous_week) / previous_week if previous_week else None
+            ),
+        }
+
+    def _qualifies(self, day):
+        return self.daily.get(day, (0, 0))[0] >= self.min_rounds
+
+    def _extend_streak(self, day):
+        if self.streak_end is not None and (day - self.streak_end).days == 1:
+            self.streak_length += 1
+        else:
+            self.streak_length = 1
+        self.streak_end = day
+        self.longest_streak = max(self.longest_streak, self.streak_length)
+
+    @staticmethod
+    def _as_date(day):
+        return date.fromisoformat(day) if isinstance(day, str) else day
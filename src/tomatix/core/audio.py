@@ -0,0 +1,157 @@
+# src/tomatix/core/audio.py
+import io
+import queue
+import sys
+import threading
+import time
+import wave
+import importlib.resources
+from collections import deque
+from contextlib import ExitStack
+from datetime import datetime
+from tomatix.core.metrics import summarize_latencies
+
+try:
+    import simpleaudio
+except ImportError:  # Optional backend, we fall back to the platform/playsound path
+    simpleaudio = None
+
+try:
+    import winsound
+except ImportError:
+    winsound = None
+
+
+class Sound:
+    """
+    A decoded sound kept in memory.
+    We hold both the raw file bytes (for backends that play whole WAV files)
+    and the decoded PCM frames (for backends that play raw buffers).
+    """
+    def __init__(self, name, path, data):
+        self.name = name
+        self.path = path
+        self.data = data
+
+        with wave.open(io.BytesIO(data), "rb") as wav:
+            self.channels = wav.getnchannels()
+            self.sample_width = wav.getsampwidth()
+            self.frame_rate = wav.getframerate()
+            self.frames = wav.readframes(wav.getnframes())
+
+
+class AudioEngine:
+    """
+    Plays notification sounds from an in-memory cache on one long-lived worker thread.
+    Sounds are decoded once (at preload or first use) so an alert only has to
+    enqueue a request instead of resolving, reading and decoding the file again.
+    """
+    def __init__(self, package="tomatix.resources", debug=False):
+        self.debug = debug
+        self.package = package
+        self._debug_log("__init__ called")
+
+        self._sounds = {}
+        self._sounds_lock = threading.Lock()
+        # Keeps resource files extracted (e.g. from a zip) for the engine's lifetime
+        self._resource_stack = ExitStack()
+
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+        # Time from play() to the backend starting playback, in seconds
+        self._latencies = deque(maxlen=100)
+
+    def _debug_log(self, message):
+        if self.debug:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]  # Timestamp with milliseconds
+            print(f"[DEBUG {self.__class__.__name__}] {now} - {message}")
+
+    def preload(self, *names):
+        """Decode the given sounds up front and make sure the worker is running."""
+        self._debug_log(f"preload called with {names=}")
+        for name in names:
+            try:
+                self._get_sound(name)
+            except Exception as e:
+                self._debug_log(f"Error preloading {name}: {e}")
+        self._ensure_worker()
+
+    def play(self, name):
+        """Queue a sound for playback. Never blocks the caller."""
+        self._debug_log(f"play called with {name=}")
+        self._ensure_worker()
+        self._queue.put((name, time.perf_counter()))
+
+    def shutdown(self, timeout=1.0):
+        """Stop the worker thread and release extracted resource files."""
+        self._debug_log("shutdown called")
+        with self._worker_lock:
+            worker = self._worker
+            self._worker = None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join(timeout)
+        self._resource_stack.close()
+
+    def get_latency_stats(self):
+        """
+        Returns a dict with alert latency in milliseconds:
+        time from play() until the backend started playing.
+        """
+        return summarize_latencies(self._latencies)
+
+    def _ensure_worker(self):
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name="tomatix-audio",
+                    daemon=True
+                )
+                self._worker.start()
+
+    def _get_sound(self, name):
+        with self._sounds_lock:
+            sound = self._sounds.get(name)
+            if sound is None:
+                resource = importlib.resources.files(self.package).joinpath(name)
+                path = self._resource_stack.enter_context(importlib.resources.as_file(resource))
+                sound = Sound(name, str(path), resource.read_bytes())
+                self._sounds[name] = sound
+                self._debug_log(f"decoded {name} ({len(sound.frames)} bytes of PCM)")
+            return sound
+
+    def _run(self):
+        while True:
+            request = self._queue.get()
+            if request is None:
+                break
+            name, requested_at = request
+            try:
+                self._play_sound(self._get_sound(name), requested_at)
+            except Exception as e:
+                self._debug_log(f"Error playing sound {name}: {e}")
+
+    def _play_sound(self, sound, requested_at):
+        """Hand the cached sound to the best available backend."""
+        if simpleaudio is not None:
+            play_obj = simpleaudio.play_buffer(
+                sound.frames, sound.channels, sound.sample_width, sound.frame_rate
+            )
+            self._record_latency(requested_at)
+            play_obj.wait_done()
+        elif winsound is not None and sys.platform == "win32":
+            self._record_latency(requested_at)
+            winsound.PlaySound(sound.data, winsound.SND_MEMORY)
+        else:
+            # playsound only accepts paths, but the path is resolved once and cached
+            from playsound import playsound
+            self._record_latency(requested_at)
+            playsound(sound.path)
+
+    def _record_latency(self, requested_at):
+        latency = time.perf_counter() - requested_at
+        self._latencies.append(latency)
+        self._debug_log(f"alert latency {latency * 1000:.1f} ms")
@@ -0,0 +1,212 @@
+# src/tomatix/core/cycle_plan.py
+from bisect import bisect_right
+
+FOCUS_ROUND = "Focus Round"
+RECHARGE = "Recharge"
+MICRO_BREAK = "Micro Break"
+EXTENDED_RECHARGE = "Extended Recharge"
+
+# Bump whenever compilation changes so cached plans are rebuilt
+COMPILED_PLAN_VERSION = 1
+
+# Sequence tokens: f<min> focus, r<min> recharge, m<min> micro break,
+# e<min> extended recharge (several rotate across cycles), x<n> rounds per cycle.
+# A trailing "+" makes the phase start on its own when the previous one ends.
+_PHASE_TOKENS = {
+    "f": (FOCUS_ROUND, True),
+    "r": (RECHARGE, False),
+    "m": (MICRO_BREAK, False),
+}
+
+
+def parse_sequence(text):
+    """
+    Parse a sequence like "f25 r5 x4 e20" (the classic schedule) into a spec dict:
+    {"round": [phases], "rounds": n, "extended": [phases]}. Raises ValueError on bad input.
+    """
+    spec = {"round": [], "rounds": 1, "extended": []}
+    for token in text.lower().replace(",", " ").split():
+        kind, value = token[0], token[1:]
+        auto_start = value.endswith("+")
+        value = value.rstrip("+")
+        if not value.isdigit() or int(value) < 1:
+            raise ValueError(f"Invalid sequence step '{token}'")
+        value = int(value)
+
+        if kind == "x":
+            spec["rounds"] = value
+        elif kind == "e":
+            spec["extended"].append({"mode": EXTENDED_RECHARGE, "is_focus": False,
+                                     "duration": value * 60, "auto_start": auto_start})
+        elif kind in _PHASE_TOKENS:
+            mode, is_focus = _PHASE_TOKENS[kind]
+            spec["round"].append({"mode": mode, "is_focus": is_focus,
+                                  "duration": value * 60, "auto_start": auto_start})
+        else:
+            raise ValueError(f"Unknown sequence step '{token}' (use f, r, m, e or x)")
+
+    if not any(phase["is_focus"] for phase in spec["round"]):
+        raise ValueError("A sequence needs at least one focus step (e.g. f25)")
+    return spec
+
+
+def format_sequence(spec):
+    """Inverse of parse_sequence, also used as the normalized cache key."""
+    letters = {mode: letter for letter, (mode, _) in _PHASE_TOKENS.items()}
+    letters[EXTENDED_RECHARGE] = "e"
+
+    def step(phase):
+        return f"{letters[phase['mode']]}{phase['duration'] // 60}{'+' if phase.get('auto_start') else ''}"
+
+    tokens = [step(phase) for phase in spec["round"]]
+    tokens.append(f"x{spec['rounds']}")
+    tokens.extend(step(phase) for phase in spec["extended"])
+    return " ".join(tokens)
+
+
+def settings_to_sequence(focus_round, recharge, big_recharge, cycles):
+    """The classic four settings (durations in seconds) as a sequence spec."""
+    return {
+        "round": [
+            {"mode": FOCUS_ROUND, "is_focus": True, "duration": focus_round},
+            {"mode": RECHARGE, "is_focus": False, "duration": recharge},
+        ],
+        "rounds": max(1, int(cycles)),
+        "extended": [{"mode": EXTENDED_RECHARGE, "is_focus": False, "duration": big_recharge}],
+    }
+
+
+class CyclePlan:
+    """
+    A full cycle compiled into flat, index-addressed tables.
+    Timer keeps only a phase index; everything else (mode, duration, round
+    counter, what comes next) is a list lookup instead of string comparisons.
+    """
+    def __init__(self, phases, rounds=None):
+        """
+        `phases` is a list of dicts with keys: mode, duration (seconds),
+        focus_rounds (counter shown during the phase), is_focus and
+        auto_start (the phase begins as soon as the previous one ends).
+        `rounds` is how many rounds make up one cycle, for progress display.
+        """
+        if not phases:
+            raise ValueError("A cycle plan needs at least one phase")
+
+        self.modes = [phase["mode"] for phase in phases]
+        self.durations = [phase["duration"] for phase in phases]
+        self.focus_rounds = [phase["focus_rounds"] for phase in phases]
+        self.is_focus = [phase["is_focus"] for phase in phases]
+        self.auto_start = [phase.get("auto_start", False) for phase in phases]
+        self.next_index = [(i + 1) % len(phases) for i in range(len(phases))]
+        self.rounds = rounds or max(self.focus_rounds) + 1
+
+    def __len__(self):
+        return len(self.modes)
+
+    def to_phases(self):
+        """The plan as plain phase dicts, e.g. for caching as JSON."""
+        return [
+            {
+                "mode": self.modes[i],
+                "duration": self.durations[i],
+                "focus_rounds": self.focus_rounds[i],
+                "is_focus": self.is_focus[i],
+                "auto_start": self.auto_start[i],
+            }
+            for i in range(len(self))
+        ]
+
+    @classmethod
+    def from_settings(cls, focus_round, recharge, big_recharge, cycles):
+        """
+        Compile the classic settings: `cycles` Focus Rounds separated by Recharges,
+        with an Extended Recharge instead of the last Recharge.
+        """
+        return cls.from_sequence(settings_to_sequence(focus_round, recharge, big_recharge, cycles))
+
+    @classmethod
+    def from_sequence(cls, spec):
+        """
+        Compile a sequence spec (see parse_sequence). Each cycle repeats the round
+        `rounds` times; the last round's trailing rest is replaced by the cycle's
+        extended recharge. With several extended recharges the table spans one
+        cycle per entry, so e.g. every third cycle can get a longer break.
+        """
+        round_phases = spec["round"]
+        last_focus = max(i for i, phase in enumerate(round_phases) if phase["is_focus"])
+        extended = spec["extended"] or [None]
+
+        phases = []
+        for extended_phase in extended:
+            for round_index in range(spec["rounds"]):
+                last_round = round_index == spec["rounds"] - 1
+                steps = round_phases[:last_focus + 1] if last_round else round_phases
+                for step_index, phase in enumerate(steps):
+                    phases.append({
+                        "mode": phase["mode"],
+                        "duration": phase["duration"],
+                        # Rests after the round's last focus step already count the round
+                        "focus_rounds": round_index + (step_index > last_focus),
+                        "is_focus": phase["is_focus"],
+                        "auto_start": phase.get("auto_start", False),
+                    })
+            if extended_phase is not None:
+                phases.append({
+                    "mode": extended_phase["mode"],
+                    "duration": extended_phase["duration"],
+                    "focus_rounds": 0,
+                    "is_focus": False,
+                    "auto_start": extended_phase.get("auto_start", False),
+                })
+        return cls(phases, rounds=spec["rounds"])
+
+    def find(self, mode, focus_rounds):
+        """
+        Index of the phase matching `mode` and `focus_rounds`, used to keep our
+        place when the plan is recompiled. Falls back to the closest earlier
+        phase of the same mode, then to the first one, then to the start.
+        """
+        candidates = [i for i, m in enumerate(self.modes) if m == mode]
+        for index in candidates:
+            if self.focus_rounds[index] == focus_rounds:
+                return index
+        earlier = [i for i in candidates if self.focus_rounds[i] <= focus_rounds]
+        if earlier:
+            return earlier[-1]
+        return candidates[0] if candidates else 0
+
+    def chain(self, start_index):
+        """
+        Indices of phase `start_index` followed by every phase that auto-starts
+        after it, for at most one full lap.
+        """
+        indices = [start_index]
+        index = self.next_index[start_index]
+        while self.auto_start[index] and len(indices) < len(self):
+            indices.append(index)
+            index = self.next_index[index]
+        return indices
+
+    def deadlines(self, start_index, start_time):
+        """
+        Absolute deadlines (epoch seconds) of phase `start_index`, started at
+        `start_time`, and of every phase chained after it.
+        Returns (indices, deadlines), both oldest first.
+        """
+        indices = self.chain(start_index)
+        deadlines = []
+        deadline = start_time
+        for index in indices:
+            deadline += self.durations[index]
+            deadlines.append(deadline)
+        return indices, deadlines
+
+    def locate(self, start_index, start_time, timestamp):
+        """
+        Find where `timestamp` falls in the run that started phase `start_index`
+        at `start_time`. Returns (passed, indices, deadlines): `passed` deadlines
+        are at or before `timestamp`, so indices[passed] is the phase running then
+        (if passed < len(indices)).
+        """
+        indices, deadlines = self.deadlines(start_index, start_time)
+        return bisect_right(deadlines, timestamp), indices, deadlines
@@ -0,0 +1,113 @@
+# src/tomatix/core/distributions.py
+import numpy as np
+
+# Session length histogram edges, in minutes (last bin is open-ended)
+SESSION_LENGTH_EDGES = np.array([0, 5, 10, 15, 20, 25, 30, 45, 60, 90, 120])
+
+WEEKDAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+# Maps every session length up to the last edge straight to its histogram bin
+_LENGTH_BIN_LOOKUP = np.searchsorted(
+    SESSION_LENGTH_EDGES, np.arange(SESSION_LENGTH_EDGES[-1] + 1), side="right"
+) - 1
+
+_SESSION_DTYPE = np.dtype([
+    ("ended_at", np.float64),
+    ("utc_offset", np.int64),
+    ("duration_minutes", np.int64),
+    ("ended_early", np.bool_),
+])
+
+
+class SessionHistory:
+    """
+    Focus session history held as contiguous NumPy column arrays, loaded in
+    bulk once and appended to as new sessions are logged. All distributions
+    are computed in vectorized passes over those columns, plus the rollups
+    that sessions past the retention period were folded into.
+    """
+    def __init__(self, ended_at=None, utc_offset=None, duration_minutes=None, ended_early=None, rollups=None):
+        self.ended_at = np.asarray(ended_at if ended_at is not None else [], dtype=np.float64)
+        self.utc_offset = np.asarray(utc_offset if utc_offset is not None else [], dtype=np.int64)
+        self.duration_minutes = np.asarray(
+            duration_minutes if duration_minutes is not None else [], dtype=np.int64
+        )
+        self.ended_early = np.asarray(ended_early if ended_early is not None else [], dtype=np.bool_)
+        # New sessions are buffered and concatenated once, on the next read
+        self._pending = []
+
+        # (hour_of_week, duration_minutes, sessions, early_sessions) columns from focus_session_rollups
+        rollups = np.asarray(rollups if rollups is not None else np.empty((0, 4)), dtype=np.int64)
+        self.rollup_hour_of_week, self.rollup_minutes, self.rollup_sessions, self.rollup_early = (
+            np.ascontiguousarray(column) for column in rollups.reshape(-1, 4).T
+        )
+
+    def __len__(self):
+        return len(self.ended_at) + len(self._pending) + int(self.rollup_sessions.sum())
+
+    @classmethod
+    def load(cls, db_conn):
+        """Bulk-load every row of focus_sessions and focus_session_rollups."""
+        cursor = db_conn.execute("""
+            SELECT ended_at, utc_offset, duration_minutes, ended_early
+            FROM focus_sessions
+        """)
+        rows = np.fromiter(cursor, dtype=_SESSION_DTYPE)
+        rollups = db_conn.execute("""
+            SELECT hour_of_week, duration_minutes, sessions, early_sessions
+            FROM focus_session_rollups
+        """).fetchall()
+        return cls(*(np.ascontiguousarray(rows[name]) for name in _SESSION_DTYPE.names), rollups=rollups)
+
+    def append(self, ended_at, utc_offset, duration_minutes, ended_early):
+        self._pending.append((ended_at, utc_offset, duration_minutes, ended_early))
+
+    def _flush_pending(self):
+        if not self._pending:
+            return
+        pending = np.array(self._pending, dtype=_SESSION_DTYPE)
+        self._pending = []
+        for name in _SESSION_DTYPE.names:
+            setattr(self, name, np.concatenate((getattr(self, name), pending[name])))
+
+    def compute_distributions(self):
+        """
+        Returns a dict of distributions:
+        - minutes_by_hour: focus minutes by local hour the session started (24 floats)
+        - minutes_by_weekday: focus minutes by local weekday, Monday first (7 floats)
+        - length_counts: session counts per SESSION_LENGTH_EDGES bin
+        - early_fraction: share of rounds ended early with mark_done (None without sessions)
+        - sessions: number of sessions
+        """
+        self._flush_pending()
+        minutes = self.duration_minutes
+
+        # Local start, in whole hours since the epoch; no per-row time zone work needed
+        local_start = self.ended_at.astype(np.int64) + self.utc_offset - minutes * 60
+        local_hours = local_start // 3600
+
+        # One pass over hour-of-week (1970-01-01 was a Thursday, 72 hours after
+        # Monday 00:00), then fold it into hour of day and weekday
+        hour_of_week = (local_hours + 72) % 168
+        minutes_by_hour_of_week = np.bincount(
+            hour_of_week, weights=minutes, minlength=168
+        ) + np.bincount(
+            self.rollup_hour_of_week, weights=self.rollup_minutes * self.rollup_sessions, minlength=168
+        )
+        minutes_by_hour_of_week = minutes_by_hour_of_week.reshape(7, 24)
+
+        length_bins = _LENGTH_BIN_LOOKUP[np.clip(minutes, 0, SESSION_LENGTH_EDGES[-1])]
+        rollup_length_bins = _LENGTH_BIN_LOOKUP[np.clip(self.rollup_minutes, 0, SESSION_LENGTH_EDGES[-1])]
+        length_counts = np.bincount(length_bins, minlength=len(SESSION_LENGTH_EDGES)) + np.bincount(
+            rollup_length_bins, weights=self.rollup_sessions, minlength=len(SESSION_LENGTH_EDGES)
+        ).astype(np.int64)
+
+        sessions = len(minutes) + int(self.rollup_sessions.sum())
+        early = int(self.ended_early.sum()) + int(self.rollup_early.sum())
+        return {
+            "minutes_by_hour": minutes_by_hour_of_week.sum(axis=0),
+            "minutes_by_weekday": minutes_by_hour_of_week.sum(axis=1),
+            "length_counts": length_counts,
+            "early_fraction": early / sessions if sessions else None,
+            "sessions": sessions,
+        }
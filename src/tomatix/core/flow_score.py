@@ -0,0 +1,133 @@
+# src/tomatix/core/flow_score.py
+"""
+Flow Score: how focus-intensive a schedule is compared to the classic
+25/5/15/4 pattern (1.0 = same work-to-rest ratio).
+
+The arithmetic is written so it works unchanged on plain numbers and on
+NumPy arrays, which lets the schedule explorer score every combination
+of settings in one vectorized pass.
+"""
+
+# Baseline ratio (25/5/15/4 pattern): 100 minutes of work, 30 minutes of rest
+BASELINE_WORK_MINS = 25 * 4
+BASELINE_REST_MINS = (5 * 3) + 15
+BASELINE_RATIO = BASELINE_WORK_MINS / BASELINE_REST_MINS
+
+# Default grid explored by the settings window (minutes / rounds), kept coarse
+# enough to stay well under a few milliseconds
+DEFAULT_FOCUS_RANGE = range(5, 121, 5)
+DEFAULT_RECHARGE_RANGE = range(1, 31)
+DEFAULT_BIG_RECHARGE_RANGE = range(5, 61, 5)
+DEFAULT_CYCLES_RANGE = range(1, 11)
+
+
+def schedule_totals(focus_mins, recharge_mins, big_recharge_mins, cycles):
+    """Returns (total_work_mins, total_rest_mins) for one full cycle."""
+    total_work_mins = focus_mins * cycles
+    total_rest_mins = (recharge_mins * (cycles - 1)) + big_recharge_mins
+    return total_work_mins, total_rest_mins
+
+
+def flow_score(total_work_mins, total_rest_mins):
+    """Normalized work-to-rest ratio (1.0 = baseline ratio), unrounded."""
+    return (total_work_mins / total_rest_mins) / BASELINE_RATIO
+
+
+def calculate_flow_score(focus_mins, recharge_mins, big_recharge_mins, cycles):
+    """
+    Calculate normalized flow score based on work-to-rest ratio.
+    Returns tuple of (score, total_work_mins, total_rest_mins)
+    """
+    try:
+        # Convert all inputs to integers
+        focus_mins = int(focus_mins)
+        recharge_mins = int(recharge_mins)
+        big_recharge_mins = int(big_recharge_mins)
+        cycles = int(cycles)
+
+        total_work_mins, total_rest_mins = schedule_totals(
+            focus_mins, recharge_mins, big_recharge_mins, cycles
+        )
+        score = round(flow_score(total_work_mins, total_rest_mins), 2)
+
+        return score, total_work_mins, total_rest_mins
+    except (ValueError, ZeroDivisionError):
+        return None, 0, 0
+
+
+def explore_schedules(
+    focus_range=DEFAULT_FOCUS_RANGE,
+    recharge_range=DEFAULT_RECHARGE_RANGE,
+    big_recharge_range=DEFAULT_BIG_RECHARGE_RANGE,
+    cycles_range=DEFAULT_CYCLES_RANGE
+):
+    """
+    Score every focus/recharge/extended/cycles combination in one NumPy pass.
+    Returns a dict of flat, equally long arrays: focus, recharge, big_recharge,
+    cycles, total_work, total_rest and score (NaN where there is no rest).
+    """
+    # Imported here so the timer and UI don't pay for NumPy unless it's needed
+    import numpy as np
+
+    focus, recharge, big_recharge, cycles = (
+        axis.ravel() for axis in np.meshgrid(
+            np.asarray(focus_range, dtype=np.int64),
+            np.asarray(recharge_range, dtype=np.int64),
+            np.asarray(big_recharge_range, dtype=np.int64),
+            np.asarray(cycles_range, dtype=np.int64),
+            indexing="ij"
+        )
+    )
+    total_work, total_rest = schedule_totals(focus, recharge, big_recharge, cycles)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        score = np.where(total_rest > 0, flow_score(total_work, total_rest), np.nan)
+
+    return {
+        "focus": focus,
+        "recharge": recharge,
+        "big_recharge": big_recharge,
+        "cycles": cycles,
+        "total_work": total_work,
+        "total_rest": total_rest,
+        "score": np.round(score, 2),
+    }
+
+
+def pareto_suggestions(grid, target_score, total_work=None, tolerance=0.05, limit=3):
+    """
+    Pick Pareto-optimal schedules from an explore_schedules() grid whose flow
+    score is within `tolerance` of `target_score`: no other candidate gives
+    more work for the same or less rest. Returns up to `limit` dicts, the ones
+    closest to `total_work` minutes of work per cycle when it is given,
+    otherwise spread evenly from the shortest cycle to the longest.
+    """
+    import numpy as np
+
+    score = grid["score"]
+    candidates = np.flatnonzero(np.abs(score - target_score) <= tolerance)
+    if candidates.size == 0:
+        return []
+
+    work = grid["total_work"][candidates]
+    rest = grid["total_rest"][candidates]
+
+    # Least rest first, most work first within equal rest; a candidate is on the
+    # front when it beats the best work of everything with less or equal rest
+    order = np.lexsort((-work, rest))
+    work, rest = work[order], rest[order]
+    best_before = np.concatenate(([-1], np.maximum.accumulate(work)[:-1]))
+    on_front = work > best_before
+    front, front_work = candidates[order][on_front], work[on_front]
+
+    if front.size > limit:
+        if total_work is not None:
+            nearest = np.argsort(np.abs(front_work - total_work), kind="stable")[:limit]
+            front = front[np.sort(nearest)]
+        else:
+            front = front[np.linspace(0, front.size - 1, limit).round().astype(int)]
+
+    return [
+        {key: values[index].item() for key, values in grid.items()}
+        for index in front
+    ]
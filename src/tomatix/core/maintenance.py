@@ -0,0 +1,222 @@
+# src/tomatix/core/maintenance.py
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+
+class DatabaseMaintenance:
+    """
+    Keeps the statistics database compact and its query plans fresh:
+    rolls focus_sessions past the retention period into focus_session_rollups,
+    reclaims free pages with incremental vacuum and refreshes ANALYZE stats.
+
+    Runs on a worker thread with its own connection, only while the timer is
+    idle (a break, or paused), at most once per MIN_INTERVAL of completed
+    runs. Work is done in small transactions and stops between steps as soon
+    as focus resumes, so the UI thread's writes are never held up for long;
+    an interrupted pass is picked up again in the next idle period. The one
+    step that can't be split, the full VACUUM that switches an older database
+    to incremental auto_vacuum, is left to enable_incremental_vacuum() at
+    shutdown.
+    """
+
+    RETENTION_DAYS = 365
+    MIN_INTERVAL = 24 * 60 * 60
+    ROLLUP_BATCH = 5000
+    VACUUM_PAGES = 256
+    # Rows sampled per index by ANALYZE, which keeps it short on large histories
+    ANALYSIS_LIMIT = 1000
+
+    # Representative reads, timed before and after maintenance
+    PROBE_QUERIES = {
+        "stats_range": """
+            SELECT COALESCE(SUM(total_focus_rounds), 0), COALESCE(SUM(total_minutes), 0)
+            FROM focus_round_stats WHERE date BETWEEN date('now', '-30 days') AND date('now')
+        """,
+        "sessions_scan": """
+            SELECT ended_at, utc_offset, duration_minutes, ended_early FROM focus_sessions
+        """,
+        "recent_sessions": """
+            SELECT COUNT(*) FROM focus_sessions WHERE ended_at >= strftime('%s', 'now', '-7 days')
+        """,
+    }
+
+    def __init__(self, db_path, retention_days=None, debug=False):
+        self.db_path = db_path
+        self.retention_days = retention_days or self.RETENTION_DAYS
+        self.debug = debug
+        self._debug_log("__init__ called")
+
+        self._thread = None
+        self._stop = threading.Event()
+        # Skip re-checking the database until then; 0 means check on the next idle period
+        self._next_check_at = 0
+        self.last_report = None
+
+    def _debug_log(self, message):
+        if self.debug:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            print(f"[DEBUG {self.__class__.__name__}] {now} - {message}")
+
+    def handle_state_change(self, state):
+        """TimerController state-change callback: start when idle, stop when focus resumes."""
+        idle = not state["running"] or not state["is_focus"]
+        if not idle:
+            self._stop.set()
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if time.time() < self._next_check_at:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="tomatix-maintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        """Ask a running pass to stop after its current step and wait for it."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        conn = sqlite3.connect(self.db_path, timeout=1.0)
+        try:
+            last_run = conn.execute("SELECT MAX(ran_at) FROM maintenance_runs WHERE completed").fetchone()[0]
+            if last_run is not None and time.time() - last_run < self.MIN_INTERVAL:
+                self._next_check_at = last_run + self.MIN_INTERVAL
+                return
+            report = self.run(conn)
+            if report["completed"]:
+                self._next_check_at = time.time() + self.MIN_INTERVAL
+        except sqlite3.Error as e:
+            # Most likely the database was busy; try again in the next idle period
+            self._debug_log(f"Maintenance stopped: {e}")
+        finally:
+            conn.close()
+
+    def run(self, conn):
+        """
+        Run every maintenance step on `conn` and record a report of file size
+        and probe query times before and after. Returns the report dict.
+        """
+        started = time.perf_counter()
+        report = {
+            "size_before": self._file_size(conn),
+            "query_ms_before": self._time_queries(conn),
+            "rolled_up": 0,
+            "pages_freed": 0,
+            "analyzed": False,
+            "completed": False,
+        }
+
+        steps = (self._roll_up_old_sessions, self._vacuum, self._analyze)
+        for step in steps:
+            if self._stop.is_set():
+                break
+            step(conn, report)
+        else:
+            report["completed"] = True
+
+        report["size_after"] = self._file_size(conn)
+        report["query_ms_after"] = self._time_queries(conn)
+        report["duration_ms"] = (time.perf_counter() - started) * 1000
+        with conn:
+            conn.execute(
+                "INSERT INTO maintenance_runs (ran_at, report, completed) VALUES (?, ?, ?)",
+                (time.time(), json.dumps(report), int(report["completed"])),
+            )
+        self.last_report = report
+        self._debug_log(f"maintenance report: {report}")
+        return report
+
+    def _roll_up_old_sessions(self, conn, report):
+        """Fold sessions past retention into rollups, a batch per transaction."""
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).timestamp()
+        while not self._stop.is_set():
+            with conn:
+                # Upper ended_at of the next batch; ties at the boundary simply join it
+                boundary = conn.execute("""
+                    SELECT MAX(ended_at) FROM (
+                        SELECT ended_at FROM focus_sessions WHERE ended_at < ? ORDER BY ended_at LIMIT ?
+                    )
+                """, (cutoff, self.ROLLUP_BATCH)).fetchone()[0]
+                if boundary is None:
+                    return
+                # Same local hour-of-week arithmetic as SessionHistory.compute_distributions
+                conn.execute("""
+                    INSERT INTO focus_session_rollups (hour_of_week, duration_minutes, sessions, early_sessions)
+                    SELECT ((CAST(ended_at AS INTEGER) + utc_offset - duration_minutes * 60) / 3600 + 72) % 168,
+                           duration_minutes, COUNT(*), SUM(ended_early)
+                    FROM focus_sessions
+                    WHERE ended_at <= ?
+                    GROUP BY 1, 2
+                    ON CONFLICT (hour_of_week, duration_minutes) DO UPDATE
+                    SET sessions = sessions + excluded.sessions,
+                        early_sessions = early_sessions + excluded.early_sessions
+                """, (boundary,))
+                deleted = conn.execute("DELETE FROM focus_sessions WHERE ended_at <= ?", (boundary,)).rowcount
+            report["rolled_up"] += deleted
+
+    def enable_incremental_vacuum(self):
+        """
+        Switch a database created before incremental auto_vacuum over to it,
+        which takes one full VACUUM. That blocks every other writer until it
+        finishes, so MainUI calls this at shutdown rather than while the timer
+        runs. Returns True if the database was converted.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=1.0)
+        try:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                return False
+            started = time.perf_counter()
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            self._debug_log(f"Switched to incremental vacuum in {(time.perf_counter() - started) * 1000:.0f} ms")
+            return True
+        except sqlite3.Error as e:
+            self._debug_log(f"Full VACUUM skipped: {e}")
+            return False
+        finally:
+            conn.close()
+
+    def _vacuum(self, conn, report):
+        """Return free pages to the file system a chunk at a time."""
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            # Not convertible without a full VACUUM; see enable_incremental_vacuum()
+            return
+        while not self._stop.is_set():
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if not free_pages:
+                return
+            conn.execute(f"PRAGMA incremental_vacuum({self.VACUUM_PAGES})").fetchall()
+            report["pages_freed"] += min(free_pages, self.VACUUM_PAGES)
+
+    def _analyze(self, conn, report):
+        # Approximate statistics are enough for the planner and bound the time the lock is held
+        conn.execute(f"PRAGMA analysis_limit = {self.ANALYSIS_LIMIT}")
+        conn.execute("ANALYZE")
+        conn.commit()
+        report["analyzed"] = True
+
+    def _file_size(self, conn):
+        try:
+            return os.path.getsize(self.db_path)
+        except OSError:
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            return conn.execute("PRAGMA page_count").fetchone()[0] * page_size
+
+    def _time_queries(self, conn):
+        """Best-of-three time of each probe query, in milliseconds."""
+        timings = {}
+        for name, query in self.PROBE_QUERIES.items():
+            best = None
+            for _ in range(3):
+                started = time.perf_counter()
+                conn.execute(query).fetchall()
+                elapsed = (time.perf_counter() - started) * 1000
+                best = elapsed if best is None else min(best, elapsed)
+            timings[name] = best
+        return timings
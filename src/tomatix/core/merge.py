@@ -0,0 +1,287 @@
+# src/tomatix/core/merge.py
+"""
+Merge and report across several Tomatix databases, e.g. one per machine.
+
+    python -m tomatix.core.merge merge combined.db laptop.db desktop.db ...
+    python -m tomatix.core.merge report machines/*.db [--from 2026-01-01] [--to 2026-06-30] [--jobs 8] [--json]
+
+Merging adds every source's focus history into the destination with the
+same additive upserts as PersistenceManager.log_focus_rounds, so merging a
+file twice counts it twice. Reports never write: each file is aggregated
+read-only in a worker process and the partial results are summed.
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+
+from tomatix.core.analytics import FocusAnalytics
+from tomatix.core.metrics import DB_WRITE_SECONDS
+from tomatix.core.persistence import PersistenceManager
+
+# Columns copied from focus_sessions, with the value used when a source predates one
+_SESSION_COLUMNS = {
+    "ended_at": None,
+    "utc_offset": "0",
+    "duration_minutes": None,
+    "planned_minutes": "duration_minutes",
+    "ended_early": "0",
+    "tag": "NULL",
+}
+
+# Same local hour-of-week arithmetic as SessionHistory.compute_distributions
+_HOUR_OF_WEEK = "((CAST(ended_at AS INTEGER) + utc_offset - duration_minutes * 60) / 3600 + 72) % 168"
+
+
+def merge_databases(dest_path, source_paths, debug=False):
+    """
+    Add the focus history of every database in `source_paths` into `dest_path`
+    (created if missing), one transaction per source. Rows are copied by
+    INSERT ... SELECT over an attached database, so nothing is loaded into
+    Python. Returns a list of {"path", "days", "sessions", "rollups",
+    "tag_days"} row counts, or {"path", "error"} for sources that couldn't
+    be merged.
+    """
+    persistence_manager = PersistenceManager(db_path=dest_path, debug=debug)
+    conn = persistence_manager.db_conn
+    results = []
+    try:
+        for path in source_paths:
+            if os.path.abspath(path) == os.path.abspath(dest_path):
+                results.append({"path": path, "error": "is the destination"})
+                continue
+            if not os.path.isfile(path):
+                # ATTACH would silently create an empty database instead
+                results.append({"path": path, "error": "no such file"})
+                continue
+            try:
+                results.append(dict(_merge_one(conn, path), path=path))
+            except sqlite3.Error as e:
+                results.append({"path": path, "error": str(e)})
+    finally:
+        conn.close()
+    return results
+
+
+def _merge_one(conn, path):
+    conn.execute("ATTACH DATABASE ? AS source", (path,))
+    try:
+        tables = {row[0] for row in conn.execute("SELECT name FROM source.sqlite_master WHERE type = 'table'")}
+        counts = {"days": 0, "sessions": 0, "rollups": 0, "tag_days": 0}
+        with DB_WRITE_SECONDS.time(op="merge"), conn:
+            if "focus_round_stats" in tables:
+                # "WHERE true" keeps ON CONFLICT from being parsed as part of the SELECT
+                counts["days"] = conn.execute("""
+                    INSERT INTO main.focus_round_stats (date, total_focus_rounds, total_minutes)
+                    SELECT date, total_focus_rounds, total_minutes FROM source.focus_round_stats WHERE true
+                    ON CONFLICT(date) DO UPDATE
+                    SET total_focus_rounds = total_focus_rounds + excluded.total_focus_rounds,
+                        total_minutes = total_minutes + excluded.total_minutes
+                """).rowcount
+            if "focus_sessions" in tables:
+                present = {row[1] for row in conn.execute("PRAGMA source.table_info(focus_sessions)")}
+                selected = ", ".join(
+                    column if column in present else fallback
+                    for column, fallback in _SESSION_COLUMNS.items()
+                )
+                counts["sessions"] = conn.execute(f"""
+                    INSERT INTO main.focus_sessions ({", ".join(_SESSION_COLUMNS)})
+                    SELECT {selected} FROM source.focus_sessions ORDER BY ended_at
+                """).rowcount
+            if "focus_tag_stats" in tables:
+                counts["tag_days"] = conn.execute("""
+                    INSERT INTO main.focus_tag_stats (tag, date, total_focus_rounds, total_minutes)
+                    SELECT tag, date, total_focus_rounds, total_minutes FROM source.focus_tag_stats WHERE true
+                    ON CONFLICT(tag, date) DO UPDATE
+                    SET total_focus_rounds = total_focus_rounds + excluded.total_focus_rounds,
+                        total_minutes = total_minutes + excluded.total_minutes
+                """).rowcount
+            if "focus_session_rollups" in tables:
+                counts["rollups"] = conn.execute("""
+                    INSERT INTO main.focus_session_rollups (hour_of_week, duration_minutes, sessions, early_sessions)
+                    SELECT hour_of_week, duration_minutes, sessions, early_sessions
+                    FROM source.focus_session_rollups WHERE true
+                    ON CONFLICT(hour_of_week, duration_minutes) DO UPDATE
+                    SET sessions = sessions + excluded.sessions,
+                        early_sessions = early_sessions + excluded.early_sessions
+                """).rowcount
+        return counts
+    finally:
+        conn.execute("DETACH DATABASE source")
+
+
+def summarize_database(path, start_date=None, end_date=None):
+    """
+    Aggregate one database, read-only. Runs in a worker process, so it only
+    takes and returns plain data: daily totals, per-tag totals and session
+    counts grouped by (hour_of_week, duration_minutes), optionally limited to
+    the inclusive local date range. Rollups have no dates and are only
+    counted without a range.
+    """
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        start_date, end_date = start_date or "0000-01-01", end_date or "9999-12-31"
+        daily = []
+        if "focus_round_stats" in tables:
+            daily = conn.execute("""
+                SELECT date, total_focus_rounds, total_minutes FROM focus_round_stats
+                WHERE date BETWEEN ? AND ?
+            """, (start_date, end_date)).fetchall()
+
+        tags = []
+        if "focus_tag_stats" in tables:
+            tags = conn.execute("""
+                SELECT tag, SUM(total_focus_rounds), SUM(total_minutes) FROM focus_tag_stats
+                WHERE date BETWEEN ? AND ?
+                GROUP BY tag
+            """, (start_date, end_date)).fetchall()
+
+        groups = []
+        if "focus_sessions" in tables:
+            groups = conn.execute(f"""
+                SELECT {_HOUR_OF_WEEK}, duration_minutes, COUNT(*), SUM(ended_early)
+                FROM focus_sessions
+                WHERE date(ended_at + utc_offset, 'unixepoch') BETWEEN ? AND ?
+                GROUP BY 1, 2
+            """, (start_date, end_date)).fetchall()
+        if "focus_session_rollups" in tables and (start_date, end_date) == ("0000-01-01", "9999-12-31"):
+            groups += conn.execute("""
+                SELECT hour_of_week, duration_minutes, sessions, early_sessions FROM focus_session_rollups
+            """).fetchall()
+        return {"path": path, "daily": daily, "tags": tags, "groups": groups}
+    finally:
+        conn.close()
+
+
+def build_report(paths, start_date=None, end_date=None, jobs=None):
+    """
+    Combined report over every database in `paths`: each file is summarized
+    in a process pool of `jobs` workers (default: all cores) and the partial
+    results are summed as they arrive. Returns a JSON-able dict.
+    """
+    daily = {}  # date -> [total_focus_rounds, total_minutes]
+    groups = {}  # (hour_of_week, duration_minutes) -> [sessions, early_sessions]
+    tags = {}  # tag -> [total_focus_rounds, total_minutes]
+    sources = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(summarize_database, path, start_date, end_date): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                partial = future.result()
+            except sqlite3.Error as e:
+                sources.append({"path": futures[future], "error": str(e)})
+                continue
+            rounds = minutes = 0
+            for day, day_rounds, day_minutes in partial["daily"]:
+                totals = daily.setdefault(day, [0, 0])
+                totals[0] += day_rounds
+                totals[1] += day_minutes
+                rounds += day_rounds
+                minutes += day_minutes
+            for tag, tag_rounds, tag_minutes in partial["tags"]:
+                totals = tags.setdefault(tag, [0, 0])
+                totals[0] += tag_rounds
+                totals[1] += tag_minutes
+            for hour_of_week, duration_minutes, sessions, early_sessions in partial["groups"]:
+                counts = groups.setdefault((hour_of_week, duration_minutes), [0, 0])
+                counts[0] += sessions
+                counts[1] += early_sessions or 0
+            sources.append({"path": partial["path"], "focus_rounds": rounds, "minutes": minutes})
+
+    sources.sort(key=lambda source: source["path"])
+    return _combine(daily, groups, tags, sources, end_date)
+
+
+def _combine(daily, groups, tags, sources, end_date):
+    days = sorted(daily)
+    today = min(end_date or date.today().isoformat(), date.today().isoformat())
+    analytics = FocusAnalytics(min_rounds=PersistenceManager.STREAK_MIN_ROUNDS)
+    analytics.recompute([(day, *daily[day]) for day in days], today)
+
+    # Grouped counts have the same shape as focus_session_rollups, so SessionHistory
+    # computes the combined distributions without any per-session rows
+    from tomatix.core.distributions import SessionHistory
+    history = SessionHistory(rollups=[(*key, *counts) for key, counts in groups.items()])
+    distributions = {
+        key: value.tolist() if hasattr(value, "tolist") else value
+        for key, value in history.compute_distributions().items()
+    }
+
+    return {
+        "sources": sources,
+        "total_focus_rounds": sum(rounds for rounds, _ in daily.values()),
+        "total_minutes": sum(minutes for _, minutes in daily.values()),
+        "active_days": len(days),
+        "first_day": days[0] if days else None,
+        "last_day": days[-1] if days else None,
+        "analytics": analytics.get_summary(today),
+        "distributions": distributions,
+        "tags": sorted(([tag, *totals] for tag, totals in tags.items()), key=lambda row: (-row[2], row[0])),
+    }
+
+
+def format_report(report):
+    lines = []
+    for source in report["sources"]:
+        if "error" in source:
+            lines.append(f"{source['path']}: skipped ({source['error']})")
+        else:
+            lines.append(f"{source['path']}: {source['focus_rounds']} rounds, {source['minutes']} min")
+    lines.append(
+        f"Total: {report['total_focus_rounds']} rounds, {report['total_minutes']} min "
+        f"over {report['active_days']} days ({report['first_day']} to {report['last_day']})"
+    )
+    analytics = report["analytics"]
+    lines.append(
+        f"Streak: {analytics['current_streak']} days (longest {analytics['longest_streak']}), "
+        f"7-day avg {analytics['avg_7']:.1f} min, 30-day avg {analytics['avg_30']:.1f} min"
+    )
+    distributions = report["distributions"]
+    if distributions["sessions"]:
+        by_hour = distributions["minutes_by_hour"]
+        peak_hour = max(range(24), key=by_hour.__getitem__)
+        lines.append(
+            f"Sessions: {distributions['sessions']}, busiest hour {peak_hour:02d}:00, "
+            f"ended early {distributions['early_fraction']:.0%}"
+        )
+    for tag, rounds, minutes in report["tags"][:10]:
+        lines.append(f"  {tag}: {rounds} rounds, {minutes} min")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge and report across Tomatix databases")
+    commands = parser.add_subparsers(dest="command", required=True)
+    merge = commands.add_parser("merge", help="add the focus history of SOURCES into DEST")
+    merge.add_argument("dest")
+    merge.add_argument("sources", nargs="+")
+    report = commands.add_parser("report", help="combined statistics over DATABASES")
+    report.add_argument("databases", nargs="+")
+    report.add_argument("--from", dest="start_date", default=None, help="first local date, YYYY-MM-DD")
+    report.add_argument("--to", dest="end_date", default=None, help="last local date, YYYY-MM-DD")
+    report.add_argument("--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    report.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "merge":
+        failed = False
+        for result in merge_databases(args.dest, args.sources):
+            if "error" in result:
+                failed = True
+                print(f"{result['path']}: skipped ({result['error']})", file=sys.stderr)
+            else:
+                print(f"{result['path']}: {result['days']} days, {result['sessions']} sessions, "
+                      f"{result['rollups']} rollups, {result['tag_days']} tag days")
+        return 1 if failed else 0
+
+    result = build_report(args.databases, args.start_date, args.end_date, args.jobs)
+    print(json.dumps(result, indent=2) if args.json else format_report(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+# src/tomatix/core/metrics.py
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Seconds; tuned for sub-millisecond ticks up to multi-second stalls
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+# Seconds a completion was handled after its deadline (ticks are 200 ms apart)
+LATENESS_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.0, 5.0, 30.0, 300.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    escaped = (
+        (key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """A monotonically increasing count, optionally split by labels."""
+    type_name = "counter"
+
+    def __init__(self, name, help_text, lock):
+        self.name = name
+        self.help_text = help_text
+        self._lock = lock
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        if not self._values:
+            yield self.name, (), 0
+        for labels, value in self._values.items():
+            yield self.name, labels, value
+
+
+class Gauge:
+    """A value read from `read()` at exposition time; skipped when it returns None."""
+    type_name = "gauge"
+
+    def __init__(self, name, help_text, read):
+        self.name = name
+        self.help_text = help_text
+        self._read = read
+
+    def samples(self):
+        value = self._read()
+        if value is not None:
+            yield self.name, (), value
+
+
+class CallbackCounter(Gauge):
+    """A monotonic total read from `read()` at exposition time, e.g. CPU seconds."""
+    type_name = "counter"
+
+
+class Histogram:
+    """Cumulative-bucket histogram, optionally split by labels."""
+    type_name = "histogram"
+
+    def __init__(self, name, help_text, lock, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._lock = lock
+        self._values = {}  # labels -> [bucket counts..., sum, count]
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, upper in enumerate(self.buckets):
+                if value <= upper:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe how long the with-block took, in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self):
+        for labels, series in self._values.items():
+            cumulative = 0
+            for upper, count in zip(self.buckets, series):
+                cumulative += count
+                yield f"{self.name}_bucket", labels + (("le", _format_value(upper)),), cumulative
+            yield f"{self.name}_sum", labels, series[-2]
+            yield f"{self.name}_count", labels, series[-1]
+
+
+class MetricsRegistry:
+    """
+    The set of metrics a process exposes, rendered in the Prometheus text
+    exposition format. Recording is a dict update under one lock, so the
+    timer loop pays next to nothing when nobody scrapes.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = []
+
+    def counter(self, name, help_text):
+        return self._add(Counter(name, help_text, self._lock))
+
+    def histogram(self, name, help_text, buckets=LATENCY_BUCKETS):
+        return self._add(Histogram(name, help_text, self._lock, buckets))
+
+    def gauge(self, name, help_text, read):
+        return self._add(Gauge(name, help_text, read))
+
+    def callback_counter(self, name, help_text, read):
+        return self._add(CallbackCounter(name, help_text, read))
+
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        with self._lock:
+            for metric in self._metrics:
+                lines.append(f"# HELP {metric.name} {metric.help_text}")
+                lines.append(f"# TYPE {metric.name} {metric.type_name}")
+                for name, labels, value in metric.samples():
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def summarize_latencies(latencies):
+    """
+    Summary of recent latencies given in seconds, as a dict of count and
+    last/mean/max in milliseconds (None while there are none).
+    """
+    latencies = list(latencies)
+    if not latencies:
+        return {"count": 0, "last_ms": None, "mean_ms": None, "max_ms": None}
+    return {
+        "count": len(latencies),
+        "last_ms": latencies[-1] * 1000,
+        "mean_ms": sum(latencies) / len(latencies) * 1000,
+        "max_ms": max(latencies) * 1000,
+    }
+
+
+def _process_rss_bytes():
+    """Current resident set size, or the peak where only that is available (macOS/BSD)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+REGISTRY = MetricsRegistry()
+
+PHASES_COMPLETED = REGISTRY.counter(
+    "tomatix_phases_completed_total", "Phases completed, by mode and whether ended early.")
+ROUNDS_LOGGED = REGISTRY.counter(
+    "tomatix_focus_rounds_logged_total", "Focus Rounds written to the database.")
+TICK_SECONDS = REGISTRY.histogram(
+    "tomatix_tick_seconds", "Time spent in TimerController.update().")
+COMPLETION_LATENESS_SECONDS = REGISTRY.histogram(
+    "tomatix_completion_lateness_seconds", "Delay between a phase deadline and its completion handling.",
+    buckets=LATENESS_BUCKETS)
+DB_WRITE_SECONDS = REGISTRY.histogram(
+    "tomatix_db_write_seconds", "PersistenceManager write transaction latency, by operation.")
+CALLBACK_ERRORS = REGISTRY.counter(
+    "tomatix_callback_errors_total", "Exceptions raised by TimerController callbacks, by kind.")
+REGISTRY.gauge(
+    "process_resident_memory_bytes", "Resident memory size in bytes.", _process_rss_bytes)
+REGISTRY.callback_counter(
+    "process_cpu_seconds_total", "Total user and system CPU time spent in seconds.", time.process_time)
+
+
+class MetricsExporter:
+    """
+    Publishes a registry for scraping: over HTTP on a local port, and/or by
+    rewriting a file every `interval` seconds (e.g. for node_exporter's
+    textfile collector). Both run on daemon threads, off the Tk thread.
+    """
+    def __init__(self, registry=REGISTRY, debug=False):
+        self.registry = registry
+        self.debug = debug
+        self._server = None
+        self._stop = threading.Event()
+        self._threads = []
+
+    def _debug_log(self, message):
+        if self.debug:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            print(f"[DEBUG {self.__class__.__name__}] {now} - {message}")
+
+    def serve(self, port, host="127.0.0.1"):
+        """Serve GET /metrics on host:port. Returns the bound port (useful with port=0)."""
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._start_thread(self._server.serve_forever, "tomatix-metrics-http")
+        bound_port = self._server.server_address[1]
+        self._debug_log(f"serving metrics on http://{host}:{bound_port}/metrics")
+        return bound_port
+
+    def write_periodically(self, path, interval=15):
+        """Rewrite `path` atomically every `interval` seconds until stop()."""
+        def loop():
+            while True:
+                self.write_file(path)
+                if self._stop.wait(interval):
+                    return
+
+        self._start_thread(loop, "tomatix-metrics-file")
+
+    def write_file(self, path):
+        # Write then rename, so scrapers never read a half-written file
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "w") as f:
+                f.write(self.registry.render())
+            os.replace(temp_path, path)
+        except OSError as e:
+            self._debug_log(f"Error writing metrics to {path}: {e}")
+
+    def _start_thread(self, target, name):
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def stop(self):
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -1,14 +1,28 @@
 # src/tomatix/core/persistence.py
 import sqlite3
 import os
-from datetime import datetime
+import json
+import time
+from datetime import datetime, timedelta
 from tzlocal import get_localzone
+from tomatix.core.analytics import FocusAnalytics
+from tomatix.core.metrics import DB_WRITE_SECONDS, ROUNDS_LOGGED
 
 class PersistenceManager:
     """
     Handles reading/writing Focus Round-related data to a local SQLite database.
     We keep DB logic here so the rest of the app doesn't worry about SQL details.
     """
+
+    # sqlite3's default wait for a locked database, and the much shorter one
+    # for checkpoint writes, which must never stall the timer
+    BUSY_TIMEOUT_MS = 5000
+    CHECKPOINT_BUSY_TIMEOUT_MS = 50
+    # Date ranges kept by the stats and tag totals caches
+    STATS_CACHE_SIZE = 64
+    # Rounds a day needs to count toward a streak
+    STREAK_MIN_ROUNDS = 1
+
     def __init__(self, db_path=None, debug=False):
         self.debug = debug
 
@@ -17,9 +31,26 @@ class PersistenceManager:
             db_path = os.path.join(script_dir, "../../../tomatix_stats.db")
 
         self._debug_log(f"__init__ called with db_path={db_path}")
+        self.db_path = db_path
         self.db_conn = sqlite3.connect(db_path)
         self._initialize_db()
 
+        # Local day bucketing, valid until the next local midnight
+        self._local_zone = None
+        self._local_date = None
+        self._next_midnight = 0
+
+        # (start_date, end_date) -> [total_focus_rounds, total_minutes], kept
+        # current by log_focus_rounds instead of being re-queried
+        self._stats_cache = {}
+        # (start_date, end_date) -> {tag: [total_focus_rounds, total_minutes]}, kept the same way
+        self._tag_totals_cache = {}
+
+        # Streak/rolling-average metrics, loaded on first use and then fed by log_focus_rounds
+        self._analytics = None
+        # Session arrays for distributions, bulk-loaded on first use and appended to afterwards
+        self._session_history = None
+
     def _debug_log(self, message):
         if self.debug:
             now = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]  # Timestamp with milliseconds
@@ -32,6 +63,8 @@ class PersistenceManager:
         This ensures a minimal schema is always in place.
         """
         self._debug_log("_initialize_db called")
+        # Only takes effect on a new, empty database; DatabaseMaintenance converts older ones
+        self.db_conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
         with self.db_conn:
             # Create tables if they don't exist
             self.db_conn.execute("""
@@ -43,6 +76,132 @@ class PersistenceManager:
                     cycles INTEGER
                 )
             """)
+            # Databases created before custom sequences lack the column
+            columns = [row[1] for row in self.db_conn.execute("PRAGMA table_info(settings)")]
+            if "sequence" not in columns:
+                self.db_conn.execute("ALTER TABLE settings ADD COLUMN sequence TEXT")
+            self.db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS phase_sequences (
+                    sequence TEXT PRIMARY KEY,
+                    version INTEGER,
+                    compiled TEXT
+                )
+            """)
+            # Single-row checkpoint of the running timer, rewritten on state transitions
+            self.db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS timer_checkpoint (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    phase_index INTEGER,
+                    mode TEXT,
+                    focus_rounds INTEGER,
+                    running INTEGER,
+                    start_time REAL,
+                    elapsed_time REAL,
+                    saved_at REAL
+                )
+            """)
+            # Named timers hosted by the session API: one settings row and one checkpoint each
+            self.db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS timer_sessions (
+                    name TEXT PRIMARY KEY,
+                    focus_round_duration INTEGER,
+                    recharge INTEGER,
+                    big_recharge INTEGER,
+                    cycles INTEGER,
+                    sequence TEXT,
+                    tag TEXT
+                )
+            """)
+            # Each named timer has its own task/project tag, apart from the app's current_tag
+            columns = [row[1] for row in self.db_conn.execute("PRAGMA table_info(timer_sessions)")]
+            if "tag" not in columns:
+                self.db_conn.execute("ALTER TABLE timer_sessions ADD COLUMN tag TEXT")
+            self.db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS timer_session_checkpoints (
+                    name TEXT PRIMARY KEY,
+                    phase_index INTEGER,
+                    mode TEXT,
+                    focus_rounds INTEGER,
+                    running INTEGER,
+                    start_time REAL,
+                    elapsed_time REAL,
+                    saved_at REAL
+                )
+            """)
+            # Notifier plugins to run on completion, with their options as JSON
+            self.db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS notifiers (
+                    name TEXT PRIMARY KEY,
+                    enabled INTEGER DEFAULT 1,
+                    options TEXT,
+                    timeout REAL
+                )
+            """)
+            # One row per completed Focus Round, for distributions over time of day etc.
+            self.db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS focus_sessions (
+                    id INTEGER PRIMARY KEY,
+                    ended_at REAL,
+                    utc_offset INTEGER,
+                    duration_minutes INTEGER,
+                    planned_minutes INTEGER,
+                    ended_early INTEGER DEFAULT 0
+                )
+            """)
+            # Databases created before task tagging lack the column
+            columns = [row[1] for row in self.db_conn.execute("PRAGMA table_info(focus_sessions)")]
+            if "tag" not in columns:
+                self.db_conn.execute("ALTER TABLE focus_sessions ADD COLUMN tag TEXT")
+            self.db_conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_focus_sessions_ended_at
+                ON focus_sessions (ended_at)
+            """)
+            # Daily totals per task/project tag, clustered by tag so one tag's
+            # range is a single index range scan
+            self.db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS focus_tag_stats (
+                    tag TEXT,
+                    date DATE,
+                    total_focus_rounds INTEGER DEFAULT 0,
+                    total_minutes INTEGER DEFAULT 0,
+                    PRIMARY KEY (tag, date)
+                ) WITHOUT ROWID
+            """)
+            # Covering index for every tag's totals over a date range
+            self.db_conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_focus_tag_stats_date
+                ON focus_tag_stats (date, tag, total_focus_rounds, total_minutes)
+            """)
+            # The tag attached to the round in progress, kept across restarts
+            self.db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS current_tag (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    tag TEXT
+                )
+            """)
+            # focus_sessions past the retention period, rolled up by local hour of week and length
+            self.db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS focus_session_rollups (
+                    hour_of_week INTEGER,
+                    duration_minutes INTEGER,
+                    sessions INTEGER DEFAULT 0,
+                    early_sessions INTEGER DEFAULT 0,
+                    PRIMARY KEY (hour_of_week, duration_minutes)
+                )
+            """)
+            # One row per DatabaseMaintenance run, with its before/after report
+            self.db_conn.execute("""
+                CREATE TABLE IF NOT EXISTS maintenance_runs (
+                    id INTEGER PRIMARY KEY,
+                    ran_at REAL,
+                    report TEXT,
+                    completed INTEGER
+                )
+            """)
+            # Earlier runs didn't record whether they finished; they count as interrupted
+            columns = [row[1] for row in self.db_conn.execute("PRAGMA table_info(maintenance_runs)")]
+            if "completed" not in columns:
+                self.db_conn.execute("ALTER TABLE maintenance_runs ADD COLUMN completed INTEGER")
             self.db_conn.execute("""
                 CREATE TABLE IF NOT EXISTS focus_round_stats (
                     date DATE PRIMARY KEY,
@@ -51,13 +210,13 @@ class PersistenceManager:
                 )
             """)
 
-    def save_settings(self, focus_round, recharge, big_recharge, cycles):
-        self._debug_log(f"save_settings called with {focus_round=}, {recharge=}, {big_recharge=}, {cycles=}")
-        with self.db_conn:
+    def save_settings(self, focus_round, recharge, big_recharge, cycles, sequence=None):
+        self._debug_log(f"save_settings called with {focus_round=}, {recharge=}, {big_recharge=}, {cycles=}, {sequence=}")
+        with DB_WRITE_SECONDS.time(op="settings"), self.db_conn:
             self.db_conn.execute("""
-                INSERT OR REPLACE INTO settings (id, focus_round_duration, recharge, big_recharge, cycles)
-                VALUES (1, ?, ?, ?, ?)
-            """, (focus_round, recharge, big_recharge, cycles))
+                INSERT OR REPLACE INTO settings (id, focus_round_duration, recharge, big_recharge, cycles, sequence)
+                VALUES (1, ?, ?, ?, ?, ?)
+            """, (focus_round, recharge, big_recharge, cycles, sequence))
 
     def load_settings(self):
         self._debug_log("load_settings called")
@@ -66,26 +225,415 @@ class PersistenceManager:
         """)
         return cursor.fetchone()
 
-    def get_local_date(self):
-        self._debug_log("get_local_date called")
-        local_zone = get_localzone()
-        local_time = datetime.now(local_zone)
-        return local_time.strftime("%Y-%m-%d")
+    def load_sequence(self):
+        """Returns the saved custom sequence string, or None for the classic schedule."""
+        self._debug_log("load_sequence called")
+        row = self.db_conn.execute("SELECT sequence FROM settings WHERE id = 1").fetchone()
+        return row[0] if row else None
 
-    def log_focus_round(self, duration_minutes):
+    def load_compiled_sequence(self, sequence, version):
         """
-        Log the completion of a Focus Round for the current day.
+        Returns the cached compiled phases for a normalized sequence string,
+        or None if it was never compiled (or compiled by another plan version).
         """
-        self._debug_log(f"log_focus_round called with {duration_minutes=}")
-        today = self.get_local_date()
-        with self.db_conn:
+        self._debug_log(f"load_compiled_sequence called with {sequence=}")
+        row = self.db_conn.execute("""
+            SELECT compiled FROM phase_sequences WHERE sequence = ? AND version = ?
+        """, (sequence, version)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def cache_compiled_sequence(self, sequence, version, phases):
+        self._debug_log(f"cache_compiled_sequence called with {sequence=}")
+        with DB_WRITE_SECONDS.time(op="compiled_sequence"), self.db_conn:
+            self.db_conn.execute("""
+                INSERT OR REPLACE INTO phase_sequences (sequence, version, compiled)
+                VALUES (?, ?, ?)
+            """, (sequence, version, json.dumps(phases)))
+
+    def save_checkpoint(self, phase_index, mode, focus_rounds, running, start_time, elapsed_time):
+        """
+        Upsert the one-row timer checkpoint. The record has a fixed size, so
+        the cost of a write doesn't grow with history.
+        """
+        self._debug_log(f"save_checkpoint called with {phase_index=}, {mode=}, {running=}")
+        # Written on the UI thread: if another connection (DatabaseMaintenance)
+        # holds the write lock, give up quickly with sqlite3.OperationalError
+        # instead of waiting out the default 5 s busy timeout
+        self.db_conn.execute(f"PRAGMA busy_timeout = {self.CHECKPOINT_BUSY_TIMEOUT_MS}")
+        try:
+            with DB_WRITE_SECONDS.time(op="checkpoint"), self.db_conn:
+                self.db_conn.execute("""
+                    INSERT INTO timer_checkpoint
+                        (id, phase_index, mode, focus_rounds, running, start_time, elapsed_time, saved_at)
+                    VALUES (1, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE
+                    SET phase_index = excluded.phase_index,
+                        mode = excluded.mode,
+                        focus_rounds = excluded.focus_rounds,
+                        running = excluded.running,
+                        start_time = excluded.start_time,
+                        elapsed_time = excluded.elapsed_time,
+                        saved_at = excluded.saved_at
+                """, (phase_index, mode, focus_rounds, int(running), start_time, elapsed_time, time.time()))
+        finally:
+            self.db_conn.execute(f"PRAGMA busy_timeout = {self.BUSY_TIMEOUT_MS}")
+
+    def load_checkpoint(self):
+        """
+        Returns the last checkpoint as a tuple
+        (phase_index, mode, focus_rounds, running, start_time, elapsed_time), or None.
+        """
+        self._debug_log("load_checkpoint called")
+        row = self.db_conn.execute("""
+            SELECT phase_index, mode, focus_rounds, running, start_time, elapsed_time
+            FROM timer_checkpoint WHERE id = 1
+        """).fetchone()
+        if row is None:
+            return None
+        phase_index, mode, focus_rounds, running, start_time, elapsed_time = row
+        return phase_index, mode, focus_rounds, bool(running), start_time, elapsed_time
+
+    def list_timer_sessions(self):
+        """Names of all named timers, in name order."""
+        self._debug_log("list_timer_sessions called")
+        return [row[0] for row in self.db_conn.execute("SELECT name FROM timer_sessions ORDER BY name")]
+
+    def save_timer_session_settings(self, name, focus_round, recharge, big_recharge, cycles, sequence=None):
+        self._debug_log(f"save_timer_session_settings called with {name=}, {focus_round=}, {recharge=}, {big_recharge=}, {cycles=}, {sequence=}")
+        with DB_WRITE_SECONDS.time(op="timer_session_settings"), self.db_conn:
+            # An upsert rather than a replace, so the timer's tag survives
+            self.db_conn.execute("""
+                INSERT INTO timer_sessions (name, focus_round_duration, recharge, big_recharge, cycles, sequence)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE
+                SET focus_round_duration = excluded.focus_round_duration,
+                    recharge = excluded.recharge,
+                    big_recharge = excluded.big_recharge,
+                    cycles = excluded.cycles,
+                    sequence = excluded.sequence
+            """, (name, focus_round, recharge, big_recharge, cycles, sequence))
+
+    def load_timer_session_settings(self, name):
+        self._debug_log(f"load_timer_session_settings called with {name=}")
+        cursor = self.db_conn.execute("""
+            SELECT focus_round_duration, recharge, big_recharge, cycles FROM timer_sessions WHERE name = ?
+        """, (name,))
+        return cursor.fetchone()
+
+    def load_timer_session_sequence(self, name):
+        self._debug_log(f"load_timer_session_sequence called with {name=}")
+        row = self.db_conn.execute("SELECT sequence FROM timer_sessions WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def save_timer_session_tag(self, name, tag):
+        """Tag of one named timer (see save_current_tag)."""
+        self._debug_log(f"save_timer_session_tag called with {name=}, {tag=}")
+        with DB_WRITE_SECONDS.time(op="timer_session_tag"), self.db_conn:
+            self.db_conn.execute("""
+                INSERT INTO timer_sessions (name, tag) VALUES (?, ?)
+                ON CONFLICT(name) DO UPDATE SET tag = excluded.tag
+            """, (name, tag))
+
+    def load_timer_session_tag(self, name):
+        self._debug_log(f"load_timer_session_tag called with {name=}")
+        row = self.db_conn.execute("SELECT tag FROM timer_sessions WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def save_timer_session_checkpoint(self, name, phase_index, mode, focus_rounds, running, start_time, elapsed_time):
+        """Upsert the checkpoint of one named timer (see save_checkpoint)."""
+        self._debug_log(f"save_timer_session_checkpoint called with {name=}, {phase_index=}, {mode=}, {running=}")
+        with DB_WRITE_SECONDS.time(op="timer_session_checkpoint"), self.db_conn:
             self.db_conn.execute("""
+                INSERT INTO timer_session_checkpoints
+                    (name, phase_index, mode, focus_rounds, running, start_time, elapsed_time, saved_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE
+                SET phase_index = excluded.phase_index,
+                    mode = excluded.mode,
+                    focus_rounds = excluded.focus_rounds,
+                    running = excluded.running,
+                    start_time = excluded.start_time,
+                    elapsed_time = excluded.elapsed_time,
+                    saved_at = excluded.saved_at
+            """, (name, phase_index, mode, focus_rounds, int(running), start_time, elapsed_time, time.time()))
+
+    def load_timer_session_checkpoint(self, name):
+        """Same tuple as load_checkpoint, for one named timer, or None."""
+        self._debug_log(f"load_timer_session_checkpoint called with {name=}")
+        row = self.db_conn.execute("""
+            SELECT phase_index, mode, focus_rounds, running, start_time, elapsed_time
+            FROM timer_session_checkpoints WHERE name = ?
+        """, (name,)).fetchone()
+        if row is None:
+            return None
+        phase_index, mode, focus_rounds, running, start_time, elapsed_time = row
+        return phase_index, mode, focus_rounds, bool(running), start_time, elapsed_time
+
+    def save_notifier(self, name, enabled=True, options=None, timeout=None):
+        """Enable/disable a notifier plugin; `timeout` None uses the plugin's default."""
+        self._debug_log(f"save_notifier called with {name=}, {enabled=}, {timeout=}")
+        with DB_WRITE_SECONDS.time(op="notifier"), self.db_conn:
+            self.db_conn.execute("""
+                INSERT OR REPLACE INTO notifiers (name, enabled, options, timeout)
+                VALUES (?, ?, ?, ?)
+            """, (name, int(enabled), json.dumps(options or {}), timeout))
+
+    def load_notifiers(self, enabled_only=True):
+        """Returns notifier configs as dicts with name, enabled, options and timeout."""
+        self._debug_log("load_notifiers called")
+        cursor = self.db_conn.execute("""
+            SELECT name, enabled, options, timeout FROM notifiers ORDER BY name
+        """)
+        return [
+            {"name": name, "enabled": bool(enabled), "options": json.loads(options or "{}"), "timeout": timeout}
+            for name, enabled, options, timeout in cursor
+            if enabled or not enabled_only
+        ]
+
+    def get_local_date(self, timestamp=None):
+        """
+        Returns the local calendar day (YYYY-MM-DD) of `timestamp` (epoch seconds),
+        or of now when no timestamp is given.
+        """
+        now = time.time()
+        if now >= self._next_midnight:
+            self._refresh_local_day(now)
+        if timestamp is None:
+            return self._local_date
+        return datetime.fromtimestamp(timestamp, self._local_zone).strftime("%Y-%m-%d")
+
+    def get_utc_offset(self, timestamp):
+        """Local UTC offset in seconds at `timestamp`, so local hours can be derived later without tz lookups."""
+        if self._local_zone is None:
+            self._refresh_local_day(time.time())
+        offset = datetime.fromtimestamp(timestamp, self._local_zone).utcoffset()
+        return int(offset.total_seconds()) if offset else 0
+
+    def _refresh_local_day(self, now):
+        """
+        Look up the local zone and today's date, and remember when they expire.
+        Only runs once per day (or after a time zone change is picked up at midnight).
+        """
+        self._debug_log("_refresh_local_day called")
+        self._local_zone = get_localzone()
+        local_time = datetime.fromtimestamp(now, self._local_zone)
+        self._local_date = local_time.strftime("%Y-%m-%d")
+        midnight = (local_time + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        self._next_midnight = midnight.timestamp()
+
+    def log_focus_round(self, duration_minutes, completed_at=None, planned_minutes=None, ended_early=False, tag=None):
+        """
+        Log the completion of a Focus Round for the day it ended
+        (`completed_at`, epoch seconds), defaulting to the current day.
+        """
+        self._debug_log(f"log_focus_round called with {duration_minutes=}, {completed_at=}, {ended_early=}, {tag=}")
+        self.log_focus_rounds([(duration_minutes, completed_at, planned_minutes, ended_early)], tag=tag)
+
+    def log_focus_rounds(self, rounds, tag=None):
+        """
+        Log several Focus Round completions in one transaction.
+        `rounds` is a list of (duration_minutes, completed_at, planned_minutes, ended_early)
+        tuples; completed_at (epoch seconds) and planned_minutes may be None.
+        All of them are attributed to the task/project `tag`, if given.
+        """
+        self._debug_log(f"log_focus_rounds called with {len(rounds)} rounds, {tag=}")
+        now = time.time()
+        sessions = []
+        for duration_minutes, completed_at, planned_minutes, ended_early in rounds:
+            ended_at = now if completed_at is None else completed_at
+            sessions.append((
+                ended_at,
+                self.get_utc_offset(ended_at),
+                duration_minutes,
+                duration_minutes if planned_minutes is None else planned_minutes,
+                int(bool(ended_early)),
+                tag,
+            ))
+        rows = [
+            (self.get_local_date(ended_at), duration_minutes, duration_minutes)
+            for ended_at, _, duration_minutes, _, _, _ in sessions
+        ]
+        with DB_WRITE_SECONDS.time(op="focus_rounds"), self.db_conn:
+            self.db_conn.executemany("""
                 INSERT INTO focus_round_stats (date, total_focus_rounds, total_minutes)
                 VALUES (?, 1, ?)
                 ON CONFLICT(date) DO UPDATE
                 SET total_focus_rounds = total_focus_rounds + 1,
                     total_minutes = total_minutes + ?
-            """, (today, duration_minutes, duration_minutes))
+            """, rows)
+            self.db_conn.executemany("""
+                INSERT INTO focus_sessions (ended_at, utc_offset, duration_minutes, planned_minutes, ended_early, tag)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, sessions)
+            if tag is not None:
+                self.db_conn.executemany("""
+                    INSERT INTO focus_tag_stats (tag, date, total_focus_rounds, total_minutes)
+                    VALUES (?, ?, 1, ?)
+                    ON CONFLICT(tag, date) DO UPDATE
+                    SET total_focus_rounds = total_focus_rounds + 1,
+                        total_minutes = total_minutes + ?
+                """, [(tag, *row) for row in rows])
+        ROUNDS_LOGGED.inc(len(sessions))
+
+        if self._session_history is not None:
+            for ended_at, utc_offset, duration_minutes, _, ended_early, _ in sessions:
+                self._session_history.append(ended_at, utc_offset, duration_minutes, ended_early)
+
+        # Write-through: bump every cached range the new rounds fall into
+        for date, duration_minutes, _ in rows:
+            for (start_date, end_date), totals in self._stats_cache.items():
+                if start_date <= date <= end_date:
+                    totals[0] += 1
+                    totals[1] += duration_minutes
+            if tag is not None:
+                for (start_date, end_date), by_tag in self._tag_totals_cache.items():
+                    if start_date <= date <= end_date:
+                        totals = by_tag.setdefault(tag, [0, 0])
+                        totals[0] += 1
+                        totals[1] += duration_minutes
+            if self._analytics is not None:
+                self._analytics.add(date, 1, duration_minutes)
+
+    def get_stats(self, start_date, end_date):
+        """
+        Fetch totals for the inclusive date range (YYYY-MM-DD strings).
+        Returns a tuple: (total_focus_rounds, total_minutes).
+        Served from the in-memory cache after the first query.
+        """
+        key = (start_date, end_date)
+        totals = self._stats_cache.get(key)
+        if totals is None:
+            self._debug_log(f"get_stats cache miss for {key}")
+            cursor = self.db_conn.execute("""
+                SELECT COALESCE(SUM(total_focus_rounds), 0), COALESCE(SUM(total_minutes), 0)
+                FROM focus_round_stats
+                WHERE date BETWEEN ? AND ?
+            """, key)
+            totals = list(cursor.fetchone())
+            if len(self._stats_cache) >= self.STATS_CACHE_SIZE:
+                # Drop the oldest range (dicts keep insertion order)
+                del self._stats_cache[next(iter(self._stats_cache))]
+            self._stats_cache[key] = totals
+        return tuple(totals)
+
+    def get_daily_minutes(self, start_date, end_date):
+        """
+        Focus minutes per day for the inclusive date range, in one query.
+        Returns a dict {YYYY-MM-DD: total_minutes} containing only days with data.
+        """
+        self._debug_log(f"get_daily_minutes called with {start_date=}, {end_date=}")
+        cursor = self.db_conn.execute("""
+            SELECT date, total_minutes
+            FROM focus_round_stats
+            WHERE date BETWEEN ? AND ?
+        """, (start_date, end_date))
+        return dict(cursor.fetchall())
+
+    def get_tag_stats(self, tag, start_date, end_date):
+        """
+        Totals for one task/project tag over the inclusive date range.
+        Returns a tuple: (total_focus_rounds, total_minutes).
+        """
+        self._debug_log(f"get_tag_stats called with {tag=}, {start_date=}, {end_date=}")
+        cursor = self.db_conn.execute("""
+            SELECT COALESCE(SUM(total_focus_rounds), 0), COALESCE(SUM(total_minutes), 0)
+            FROM focus_tag_stats
+            WHERE tag = ? AND date BETWEEN ? AND ?
+        """, (tag, start_date, end_date))
+        return cursor.fetchone()
+
+    def get_tag_totals(self, start_date, end_date, limit=None):
+        """
+        Totals per tag over the inclusive date range, most minutes first.
+        Returns a list of (tag, total_focus_rounds, total_minutes) tuples.
+        Served from the in-memory cache after the first query, like get_stats.
+        """
+        key = (start_date, end_date)
+        by_tag = self._tag_totals_cache.get(key)
+        if by_tag is None:
+            self._debug_log(f"get_tag_totals cache miss for {key}")
+            cursor = self.db_conn.execute("""
+                SELECT tag, SUM(total_focus_rounds), SUM(total_minutes)
+                FROM focus_tag_stats
+                WHERE date BETWEEN ? AND ?
+                GROUP BY tag
+            """, key)
+            by_tag = {tag: [rounds, minutes] for tag, rounds, minutes in cursor}
+            if len(self._tag_totals_cache) >= self.STATS_CACHE_SIZE:
+                del self._tag_totals_cache[next(iter(self._tag_totals_cache))]
+            self._tag_totals_cache[key] = by_tag
+        totals = sorted(
+            ((tag, rounds, minutes) for tag, (rounds, minutes) in by_tag.items()),
+            key=lambda row: (-row[2], row[0])
+        )
+        return totals if limit is None else totals[:limit]
+
+    def list_recent_tags(self, days=90, limit=20):
+        """Tags used in the last `days` days, most recently used first."""
+        self._debug_log("list_recent_tags called")
+        since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        cursor = self.db_conn.execute("""
+            SELECT tag FROM focus_tag_stats
+            WHERE date >= ?
+            GROUP BY tag
+            ORDER BY MAX(date) DESC, tag
+            LIMIT ?
+        """, (since, limit))
+        return [row[0] for row in cursor]
+
+    def save_current_tag(self, tag):
+        self._debug_log(f"save_current_tag called with {tag=}")
+        with DB_WRITE_SECONDS.time(op="current_tag"), self.db_conn:
+            self.db_conn.execute("INSERT OR REPLACE INTO current_tag (id, tag) VALUES (1, ?)", (tag,))
+
+    def load_current_tag(self):
+        """Returns the tag attached to the round in progress, or None."""
+        self._debug_log("load_current_tag called")
+        row = self.db_conn.execute("SELECT tag FROM current_tag WHERE id = 1").fetchone()
+        return row[0] if row else None
+
+    def invalidate_stats_cache(self):
+        """Forget cached totals, e.g. after the database was changed behind our back."""
+        self._debug_log("invalidate_stats_cache called")
+        self._stats_cache.clear()
+        self._tag_totals_cache.clear()
+        self._analytics = None
+        self._session_history = None
+
+    def get_analytics_summary(self):
+        """
+        Returns streaks, 7/30-day rolling averages and the week-over-week trend
+        (see FocusAnalytics.get_summary). Kept up to date incrementally; the full
+        history is only scanned on first use or when an update can't be applied in place.
+        """
+        self._debug_log("get_analytics_summary called")
+        today = self.get_local_date()
+        if self._analytics is None or self._analytics.needs_recompute:
+            self._analytics = self._recompute_analytics(today)
+
+        return self._analytics.get_summary(today)
+
+    def get_session_distributions(self):
+        """
+        Returns focus-time distributions by hour, weekday, session length and
+        the early-finish fraction (see SessionHistory.compute_distributions).
+        """
+        self._debug_log("get_session_distributions called")
+        if self._session_history is None:
+            # NumPy is only needed once somebody asks for distributions
+            from tomatix.core.distributions import SessionHistory
+            self._session_history = SessionHistory.load(self.db_conn)
+        return self._session_history.compute_distributions()
+
+    def _recompute_analytics(self, today):
+        analytics = FocusAnalytics(min_rounds=self.STREAK_MIN_ROUNDS)
+        cursor = self.db_conn.execute("""
+            SELECT date, total_focus_rounds, total_minutes
+            FROM focus_round_stats
+            ORDER BY date
+        """)
+        analytics.recompute(cursor, today)
+        return analytics
 
     def get_today_stats(self):
         """
@@ -94,10 +642,4 @@ class PersistenceManager:
         """
         self._debug_log("get_today_stats called")
         today = self.get_local_date()
-        cursor = self.db_conn.execute("""
-            SELECT total_focus_rounds, total_minutes
-            FROM focus_round_stats
-            WHERE date = ?
-        """, (today,))
-        result = cursor.fetchone()
-        return result or (0, 0)
+        return self.get_stats(today, today)
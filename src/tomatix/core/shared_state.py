@@ -0,0 +1,221 @@
+# src/tomatix/core/shared_state.py
+"""
+Timer state published to a small memory-mapped file, so status bars and
+widgets can show the countdown without Tk, a TimerController or any IPC.
+
+The writer only touches the file on state transitions; readers compute the
+remaining time from the published deadline themselves. A seqlock-style
+version counter (odd while a write is in progress) lets readers detect and
+retry torn reads without any locking.
+
+On a clean exit the writer clears the record. After a crash, readers notice
+that the writer's pid is gone, or that a running phase's deadline passed
+long ago without the transition being published, and report "not running".
+
+Stdlib only, so readers can import it cheaply:
+
+    from tomatix.core.shared_state import read_state
+    state = read_state()  # None when Tomatix isn't publishing
+
+or from a shell: python -m tomatix.core.shared_state
+"""
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+
+MAGIC = b"TMTX"
+LAYOUT_VERSION = 1
+
+# magic, layout version, sequence counter
+_HEADER = struct.Struct("<4sIQ")
+_SEQUENCE = struct.Struct("<Q")
+_SEQUENCE_OFFSET = 8
+# pid, updated_at, deadline, remaining_time, full_time, phase_index,
+# focus_rounds, rounds, running, is_focus, mode
+_PAYLOAD = struct.Struct("<IddddIIIBB32s")
+SIZE = _HEADER.size + _PAYLOAD.size
+
+READ_RETRIES = 100
+# A running phase whose deadline passed this long ago without a newer record
+# means the writer stopped publishing (hung, or killed on a platform without
+# a pid check)
+STALE_SECONDS = 60
+
+
+def default_state_path():
+    """Per-user state file in the runtime dir (or the temp dir where there is none)."""
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    return os.path.join(directory, f"tomatix-{user}.state")
+
+
+class StatePublisher:
+    """Writer side: owned by the TimerController of the running app."""
+
+    def __init__(self, path=None, debug=False):
+        self.path = path or default_state_path()
+        self.debug = debug
+        self._sequence = 0
+        self._last_payload = None
+        self.publish_count = 0
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size < SIZE:
+                os.ftruncate(fd, SIZE)
+            self._map = mmap.mmap(fd, SIZE)
+        finally:
+            os.close(fd)
+
+        # Carry on from an earlier run's counter so readers never see it go backwards
+        magic, version, sequence = _HEADER.unpack_from(self._map, 0)
+        if magic == MAGIC and version == LAYOUT_VERSION:
+            self._sequence = sequence + (sequence & 1)
+        _HEADER.pack_into(self._map, 0, MAGIC, LAYOUT_VERSION, self._sequence)
+
+    def publish(self, state, deadline, full_time, phase_index, rounds):
+        """
+        Publish a get_state() snapshot plus the running phase's deadline (epoch
+        seconds, None while stopped). Unchanged snapshots are not rewritten.
+        """
+        payload = (
+            deadline or 0.0,
+            0.0 if state["running"] else state["remaining_time"],
+            full_time,
+            phase_index,
+            state["current_focus_rounds"],
+            rounds,
+            state["running"],
+            state["is_focus"],
+            state["mode"],
+        )
+        if payload == self._last_payload:
+            return False
+        self._last_payload = payload
+
+        # Odd sequence: write in progress
+        self._sequence += 1
+        _SEQUENCE.pack_into(self._map, _SEQUENCE_OFFSET, self._sequence)
+        _PAYLOAD.pack_into(
+            self._map, _HEADER.size,
+            os.getpid(), time.time(), *payload[:6],
+            int(payload[6]), int(payload[7]), payload[8].encode("utf-8")[:32]
+        )
+        self._sequence += 1
+        _SEQUENCE.pack_into(self._map, _SEQUENCE_OFFSET, self._sequence)
+        self.publish_count += 1
+        return True
+
+    def clear(self):
+        """Publish an empty record (pid 0), which readers report as not running."""
+        self._sequence += 1
+        _SEQUENCE.pack_into(self._map, _SEQUENCE_OFFSET, self._sequence)
+        _PAYLOAD.pack_into(self._map, _HEADER.size, 0, time.time(), 0.0, 0.0, 0.0, 0, 0, 0, 0, 0, b"")
+        self._sequence += 1
+        _SEQUENCE.pack_into(self._map, _SEQUENCE_OFFSET, self._sequence)
+        self._last_payload = None
+
+    def close(self):
+        """Clear the record and unmap the file; call when the app exits."""
+        if self._map.closed:
+            return
+        self.clear()
+        self._map.close()
+
+
+def _writer_alive(pid):
+    """False if no process `pid` exists. Only checked on POSIX, where signal 0 is a no-op probe."""
+    if os.name != "posix":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, owned by someone else
+    return True
+
+
+class StateReader:
+    """Reader side: keeps the mapping open, so each read is a few memory loads."""
+
+    def __init__(self, path=None):
+        self.path = path or default_state_path()
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), SIZE, access=mmap.ACCESS_READ)
+
+    def read(self, now=None):
+        """
+        Returns a dict with mode, is_focus, running, remaining_time, deadline,
+        full_time, current_focus_rounds, phase_index, rounds, pid, updated_at
+        and sequence, or None if the file holds no valid state or its writer
+        is no longer running.
+        """
+        for _ in range(READ_RETRIES):
+            magic, version, before = _HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC or version != LAYOUT_VERSION:
+                return None
+            if before & 1:
+                continue
+            fields = _PAYLOAD.unpack_from(self._map, _HEADER.size)
+            if _SEQUENCE.unpack_from(self._map, _SEQUENCE_OFFSET)[0] == before:
+                break
+        else:
+            return None
+
+        (pid, updated_at, deadline, remaining_time, full_time, phase_index,
+         focus_rounds, rounds, running, is_focus, mode) = fields
+        if before == 0 or pid == 0:
+            return None
+        now = time.time() if now is None else now
+        if running and updated_at < deadline < now - STALE_SECONDS:
+            return None
+        if not _writer_alive(pid):
+            return None
+        if running:
+            remaining_time = max(0.0, deadline - now)
+        return {
+            "mode": mode.rstrip(b"\0").decode("utf-8", "replace"),
+            "is_focus": bool(is_focus),
+            "running": bool(running),
+            "remaining_time": remaining_time,
+            "deadline": deadline if running else None,
+            "full_time": full_time,
+            "current_focus_rounds": focus_rounds,
+            "phase_index": phase_index,
+            "rounds": rounds,
+            "pid": pid,
+            "updated_at": updated_at,
+            "sequence": before,
+        }
+
+    def close(self):
+        self._map.close()
+
+
+def read_state(path=None, now=None):
+    """One-shot read; returns None when nothing is published at `path` or Tomatix has exited."""
+    try:
+        reader = StateReader(path)
+    except (OSError, ValueError):
+        return None
+    try:
+        return reader.read(now)
+    finally:
+        reader.close()
+
+
+def format_status(state):
+    """Short status-bar text, e.g. 'Focus Round 12:34' or 'Recharge 05:00 (paused)'."""
+    if state is None:
+        return "Tomatix not running"
+    minutes, seconds = divmod(int(state["remaining_time"]), 60)
+    paused = "" if state["running"] else " (paused)"
+    return f"{state['mode']} {minutes:02d}:{seconds:02d}{paused}"
+
+
+if __name__ == "__main__":
+    print(format_status(read_state(sys.argv[1] if len(sys.argv) > 1 else None)))
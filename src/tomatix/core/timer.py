@@ -1,6 +1,7 @@
 # src/tomatix/core/timer.py
 import time
 from datetime import datetime
+from tomatix.core.cycle_plan import CyclePlan
 
 class Timer:
     """
@@ -20,14 +21,15 @@ class Timer:
         self.big_recharge = big_recharge
         self.cycles = cycles
 
-        self.current_mode = "Focus Round"
+        # The whole cycle compiled into a table; we only track our index in it
+        self.plan = CyclePlan.from_settings(focus_round_duration, recharge, big_recharge, cycles)
+        self.phase_index = 0
+
         self.running = False
         self.start_time = 0
         self.elapsed_time = 0
         self.remaining_time = self.focus_round_duration
 
-        self.current_focus_rounds = 0
-
         self.debug = debug
         self._debug_log("__init__ completed")
 
@@ -38,6 +40,14 @@ class Timer:
             print(f"[DEBUG {self.__class__.__name__}] {now} - {message}")
 
 
+    @property
+    def current_mode(self):
+        return self.plan.modes[self.phase_index]
+
+    @property
+    def current_focus_rounds(self):
+        return self.plan.focus_rounds[self.phase_index]
+
     def set_durations(self, focus_round, recharge, big_recharge, cycles):
         """
         Update durations and cycles mid-run if the user changes settings.
@@ -48,6 +58,18 @@ class Timer:
         self.recharge = recharge
         self.big_recharge = big_recharge
         self.cycles = cycles
+
+        self.set_plan(CyclePlan.from_settings(focus_round, recharge, big_recharge, cycles))
+
+    def set_plan(self, plan):
+        """
+        Switch to a compiled CyclePlan (e.g. a custom sequence), keeping our
+        place in the cycle as closely as the new plan allows.
+        """
+        self._debug_log(f"set_plan called with {len(plan)} phases")
+        mode, focus_rounds = self.current_mode, self.current_focus_rounds
+        self.plan = plan
+        self.phase_index = self.plan.find(mode, focus_rounds)
         self.reset()
 
     def start(self):
@@ -89,6 +111,43 @@ class Timer:
         self.elapsed_time = 0
         self.remaining_time = self._get_duration()
 
+    def snapshot(self):
+        """
+        Returns the running state as a tuple
+        (phase_index, mode, focus_rounds, running, start_time, elapsed_time),
+        enough to pick up where we left off after a restart.
+        """
+        if self.running:
+            self.elapsed_time = time.time() - self.start_time
+        return (
+            self.phase_index,
+            self.current_mode,
+            self.current_focus_rounds,
+            self.running,
+            self.start_time,
+            self.elapsed_time,
+        )
+
+    def restore(self, phase_index, mode, focus_rounds, running, start_time, elapsed_time):
+        """
+        Restore a snapshot() taken by an earlier process. A running phase keeps
+        its original start time, so the next catch_up() fast-forwards through
+        any deadlines that passed while we were gone.
+        """
+        self._debug_log(f"restore called with {phase_index=}, {mode=}, {running=}")
+        if not (0 <= phase_index < len(self.plan) and self.plan.modes[phase_index] == mode
+                and self.plan.focus_rounds[phase_index] == focus_rounds):
+            # The plan changed since the snapshot; find the closest phase instead
+            phase_index = self.plan.find(mode, focus_rounds)
+        self.phase_index = phase_index
+        self.reset()
+
+        self.elapsed_time = min(elapsed_time, self._get_duration())
+        self.remaining_time = max(0, self._get_duration() - self.elapsed_time)
+        if running:
+            self.running = True
+            self.start_time = start_time
+
     def get_state(self):
         """
         Returns a dict describing the current timer status.
@@ -101,6 +160,7 @@ class Timer:
 
         state = {
             "mode": self.current_mode,
+            "is_focus": self.plan.is_focus[self.phase_index],
             "remaining_time": self.remaining_time,
             "current_focus_rounds": self.current_focus_rounds,
             "running": self.running,
@@ -108,6 +168,19 @@ class Timer:
         # self._debug_log(f"get_state returning {state}")
         return state
 
+    def get_deadline(self):
+        """
+        Returns the wall-clock time (epoch seconds) at which the current cycle ends,
+        or None if the timer isn't running.
+        """
+        if not self.running:
+            return None
+        return self.start_time + self._get_duration()
+
+    def get_full_time(self):
+        """Returns how many seconds the current phase lasts in total."""
+        return self._get_duration()
+
     def get_elapsed_minutes(self):
         """
         Returns how many whole minutes have been used in this cycle.
@@ -120,34 +193,63 @@ class Timer:
         clamped_elapsed_time = min(self.elapsed_time, self._get_duration())
         return int(clamped_elapsed_time // 60)
 
+    def catch_up(self, now=None):
+        """
+        Process every phase boundary passed by `now` in one go, e.g. after the
+        machine slept through one or more deadlines. Phases that auto-start are
+        chained, so several can end at once; the run stops at the first phase
+        that waits for the user. Returns a list of completions, oldest first,
+        each a dict with mode, is_focus, elapsed_minutes, planned_minutes,
+        ended_early and deadline.
+        """
+        if not self.running:
+            return []
+        now = now or time.time()
+
+        completions = []
+        while self.running:
+            # Bisect the absolute deadlines of this phase and everything chained after it
+            passed, indices, deadlines = self.plan.locate(self.phase_index, self.start_time, now)
+            if passed == 0:
+                break
+
+            for index, deadline in zip(indices[:passed], deadlines[:passed]):
+                completions.append({
+                    "mode": self.plan.modes[index],
+                    "is_focus": self.plan.is_focus[index],
+                    "elapsed_minutes": int(self.plan.durations[index] // 60),
+                    "planned_minutes": int(self.plan.durations[index] // 60),
+                    "ended_early": False,
+                    "deadline": deadline,
+                })
+
+            last_deadline = deadlines[passed - 1]
+            self.phase_index = indices[passed - 1]
+            self._advance(last_deadline)
+
+        self._debug_log(f"catch_up processed {len(completions)} completions, new_mode={self.current_mode}")
+        return completions
+
     def next_mode(self):
         """
-        Move to the next mode in the cycle. If we just finished a Focus Round,
-        we either go to Recharge or Extended Recharge. If we finished a recharge,
-        we return to Focus Round. The cycle resets when we've completed 'cycles' focus_rounds.
+        Move to the phase that follows the current one in the compiled CyclePlan
+        (plan.next_index), as if it ended now; see _advance.
         """
         self._debug_log(f"next_mode called, current_mode={self.current_mode}")
-        if self.current_mode == "Focus Round":
-            self.current_focus_rounds += 1
-            # After 'cycles' focus_rounds, move to an extended recharge
-            if self.current_focus_rounds >= self.cycles:
-                self.current_mode = "Extended Recharge"
-                self.current_focus_rounds = 0
-            else:
-                self.current_mode = "Recharge"
-        else:
-            # Any recharge leads back to a Focus Round
-            self.current_mode = "Focus Round"
+        self._advance(time.time())
+        self._debug_log(f"next_mode completed, new_mode={self.current_mode}")
 
+    def _advance(self, ended_at):
+        """
+        Step to the next phase in the plan. A phase that auto-starts is
+        running from `ended_at`; any other waits for the user.
+        """
+        self.phase_index = self.plan.next_index[self.phase_index]
         self.reset()
-        self._debug_log(f"next_mode completed, new_mode={self.current_mode}")
+        if self.plan.auto_start[self.phase_index]:
+            self.running = True
+            self.start_time = ended_at
 
     def _get_duration(self):
-        # Return how many seconds this cycle should run based on current_mode
-        if self.current_mode == "Focus Round":
-            return self.focus_round_duration
-        elif self.current_mode == "Recharge":
-            return self.recharge
-        elif self.current_mode == "Extended Recharge":
-            return self.big_recharge
-        return 0
+        # Return how many seconds this cycle should run based on the current phase
+        return self.plan.durations[self.phase_index]
@@ -1,7 +1,10 @@
 # src/tomatix/core/timer_controller.py
+import asyncio
 import time
 from tomatix.core.timer import Timer
+from tomatix.core.cycle_plan import CyclePlan, COMPILED_PLAN_VERSION, parse_sequence, format_sequence
 from tomatix.core.persistence import PersistenceManager
+from tomatix.core.metrics import CALLBACK_ERRORS, COMPLETION_LATENESS_SECONDS, PHASES_COMPLETED, TICK_SECONDS
 from datetime import datetime
 
 class TimerController:
@@ -9,6 +12,9 @@ class TimerController:
     Orchestrates the Timer (pure logic) and Persistence (database).
     The UI should call this controller rather than the raw Timer.
     """
+
+    # Longest task/project tag kept; longer ones are cut
+    MAX_TAG_LENGTH = 64
     def __init__(
         self,
         persistence_manager=None,
@@ -16,6 +22,8 @@ class TimerController:
         recharge=5*60,
         big_recharge=20*60,
         cycles=4,
+        state_publisher=None,
+        async_runner=None,
         debug=False
     ):
         self.debug = debug
@@ -34,6 +42,12 @@ class TimerController:
         self.mode_complete_callbacks = []
         self.state_change_callbacks = []
 
+        # Wall-clock deadline of the most recently completed cycle, so the UI
+        # can measure how late its completion handling is
+        self.last_deadline = None
+        # Every completion of the last batch (several after a catch-up), oldest first
+        self.last_completions = []
+
         # Initialize last state for change detection
         self._last_comparable_state = {
             "running": False,
@@ -41,7 +55,25 @@ class TimerController:
             "current_focus_rounds": 0,
         }
 
+        # Cost of the crash-safe checkpoint, written only on state transitions
+        self._last_checkpoint = None
+        self.checkpoint_stats = {
+            "writes": 0,
+            "skipped": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+        }
+
+        # Optional StatePublisher mirroring transitions into shared memory for external readers
+        self.state_publisher = state_publisher
+        # Runs coroutines returned by callbacks; anything with submit(coro, on_done)
+        self.async_runner = async_runner
+
         self._load_or_init_settings()
+        self._restore_checkpoint()
+        # Task/project the Focus Rounds completed from now on are attributed to
+        self.current_tag = self.persistence_manager.load_current_tag()
+        self._publish_state(self.get_state())
 
     def _debug_log(self, message):
         if self.debug:
@@ -58,6 +90,91 @@ class TimerController:
         if settings:
             self.timer.set_durations(*settings)
 
+        sequence = self.persistence_manager.load_sequence()
+        if sequence:
+            try:
+                self.timer.set_plan(self._compile_sequence(sequence))
+            except ValueError as e:
+                self._debug_log(f"Ignoring invalid saved sequence {sequence!r}: {e}")
+
+    def _restore_checkpoint(self):
+        """
+        Pick up the timer where the previous process left it. A round that was
+        running keeps counting from its original start; the first update()
+        fast-forwards through anything that ended while we were down.
+        """
+        self._debug_log("_restore_checkpoint called")
+        checkpoint = self.persistence_manager.load_checkpoint()
+        if checkpoint is None:
+            return
+        self.timer.restore(*checkpoint)
+        self._last_checkpoint = self._get_comparable_checkpoint(self.timer.snapshot())
+        self._last_comparable_state = self._get_comparable_state(self.get_state())
+
+    def _save_checkpoint(self):
+        """Write the running state if it changed since the last checkpoint."""
+        snapshot = self.timer.snapshot()
+        comparable = self._get_comparable_checkpoint(snapshot)
+        if comparable == self._last_checkpoint:
+            self.checkpoint_stats["skipped"] += 1
+            return
+
+        started = time.perf_counter()
+        try:
+            self.persistence_manager.save_checkpoint(*snapshot)
+        except Exception as e:
+            self._debug_log(f"Error saving checkpoint: {e}")
+            return
+        cost_ms = (time.perf_counter() - started) * 1000
+
+        self._last_checkpoint = comparable
+        self.checkpoint_stats["writes"] += 1
+        self.checkpoint_stats["total_ms"] += cost_ms
+        self.checkpoint_stats["max_ms"] = max(self.checkpoint_stats["max_ms"], cost_ms)
+        self._debug_log(f"checkpoint written in {cost_ms:.2f} ms")
+
+    def _get_comparable_checkpoint(self, snapshot):
+        # Elapsed time only matters while paused; while running it's implied by start_time
+        running = snapshot[3]
+        return snapshot[:5] + ((None,) if running else (snapshot[5],))
+
+    def _publish_state(self, state):
+        """Mirror the state and deadline to the shared state file, if publishing."""
+        if self.state_publisher is None:
+            return
+        try:
+            self.state_publisher.publish(
+                state,
+                self.timer.get_deadline(),
+                self.timer.get_full_time(),
+                self.timer.phase_index,
+                self.timer.plan.rounds,
+            )
+        except (OSError, ValueError) as e:
+            self._debug_log(f"Error publishing state: {e}")
+
+    def get_checkpoint_stats(self):
+        """Returns checkpoint write counts and timings (mean/max in milliseconds)."""
+        stats = dict(self.checkpoint_stats)
+        stats["mean_ms"] = stats["total_ms"] / stats["writes"] if stats["writes"] else 0.0
+        return stats
+
+    def _compile_sequence(self, sequence):
+        """
+        Compile a sequence string into a CyclePlan, reusing the compiled table
+        cached in the database when there is one.
+        """
+        spec = parse_sequence(sequence)
+        key = format_sequence(spec)
+        phases = self.persistence_manager.load_compiled_sequence(key, COMPILED_PLAN_VERSION)
+        if phases is not None:
+            self._debug_log(f"_compile_sequence reusing cached plan for {key!r}")
+            return CyclePlan(phases, rounds=spec["rounds"])
+
+        plan = CyclePlan.from_sequence(spec)
+        self.persistence_manager.cache_compiled_sequence(key, COMPILED_PLAN_VERSION, plan.to_phases())
+        return plan
+
     def start(self):
         self._debug_log("start called")
         self.timer.start()
@@ -70,26 +187,56 @@ class TimerController:
 
     def mark_done(self):
         self._debug_log("mark_done called")
+        mode = self.timer.current_mode
+        is_focus = self.timer.plan.is_focus[self.timer.phase_index]
         self.timer.mark_done()
-        self._handle_completion()
+        # Ending early means the deadline is right now
+        completion = {
+            "mode": mode,
+            "is_focus": is_focus,
+            "elapsed_minutes": self.timer.get_elapsed_minutes(),
+            "planned_minutes": int(self.timer.get_full_time() // 60),
+            "ended_early": True,
+            "deadline": time.time(),
+        }
+        self.timer.next_mode()
+        self._handle_completions([completion])
+        self._check_and_notify_state_change()
 
     def reset(self):
         self._debug_log("reset called")
         self.timer.reset()
         self._check_and_notify_state_change()
 
+    def set_tag(self, tag):
+        """
+        Attach a task/project tag to the current and following Focus Rounds,
+        or clear it with None/"". Returns the normalized tag.
+        """
+        tag = (tag or "").strip()[:self.MAX_TAG_LENGTH] or None
+        self._debug_log(f"set_tag called with {tag=}")
+        if tag != self.current_tag:
+            self.current_tag = tag
+            self.persistence_manager.save_current_tag(tag)
+        return tag
+
     def get_state(self):
         #self._debug_log("get_state called")
         return self.timer.get_state()
 
-    def save_settings(self, focus_round, recharge, big_recharge, cycles):
+    def save_settings(self, focus_round, recharge, big_recharge, cycles, sequence=None):
         """
         Persist user-updated durations in the DB so we can restore
-        them next time the app launches.
+        them next time the app launches. A custom `sequence` (e.g. "f50 r10 x3 e30")
+        takes precedence over the four durations; it raises ValueError if invalid.
         """
-        self._debug_log(f"save_settings called with {focus_round=}, {recharge=}, {big_recharge=}, {cycles=}")
+        self._debug_log(f"save_settings called with {focus_round=}, {recharge=}, {big_recharge=}, {cycles=}, {sequence=}")
+        plan = self._compile_sequence(sequence) if sequence else None
+
         self.timer.set_durations(focus_round, recharge, big_recharge, cycles)
-        self.persistence_manager.save_settings(focus_round, recharge, big_recharge, cycles)
+        if plan is not None:
+            self.timer.set_plan(plan)
+        self.persistence_manager.save_settings(focus_round, recharge, big_recharge, cycles, sequence)
         self._check_and_notify_state_change()
 
     def update(self):
@@ -98,12 +245,16 @@ class TimerController:
         If the timer hits 0, we handle the completion logic here.
         """
         # self._debug_log("update called")  # too frequent
-        previous_mode = self.timer.current_mode
-        state = self.get_state()
+        with TICK_SECONDS.time():
+            state = self.get_state()
 
-        # If the Timer just finished
-        if state["remaining_time"] == 0:
-            self._handle_completion(previous_mode)
+            # If the Timer just finished, process every deadline we passed at once
+            if state["remaining_time"] == 0 and state["running"]:
+                completions = self.timer.catch_up()
+                if completions:
+                    self._handle_completions(completions)
+                    self._check_and_notify_state_change()
+                    state = self.get_state()
 
         return state
 
@@ -131,54 +282,95 @@ class TimerController:
         if callback in self.state_change_callbacks:
             self.state_change_callbacks.remove(callback)
 
-    def _handle_completion(self, previous_mode=None):
-        """Called when a cycle ends."""
-        previous_mode = previous_mode or self.timer.current_mode
-        elapsed_minutes = self.timer.get_elapsed_minutes()
-
-        self._debug_log(f"_handle_completion called, previous_mode={previous_mode}, elapsed_minutes={elapsed_minutes}")
+    def _handle_completions(self, completions):
+        """
+        Called when one or more cycles end. Focus Rounds are logged in a single
+        write, attributed to the day each one actually ended. Subscribers are
+        notified once per batch, with the mode that ended last, so a catch-up
+        across several deadlines shows one alert and sends one notification.
+        """
+        self._debug_log(f"_handle_completions called with {completions}")
 
-        if previous_mode == "Focus Round":
-            self.persistence_manager.log_focus_round(elapsed_minutes)
+        focus_rounds = [
+            (
+                completion["elapsed_minutes"],
+                completion["deadline"],
+                completion["planned_minutes"],
+                completion["ended_early"],
+            )
+            for completion in completions
+            if completion["is_focus"]
+        ]
+        if focus_rounds:
+            self.persistence_manager.log_focus_rounds(focus_rounds, tag=self.current_tag)
 
-        self.timer.next_mode()
+        now = time.time()
+        for completion in completions:
+            PHASES_COMPLETED.inc(mode=completion["mode"], ended_early=str(completion["ended_early"]).lower())
+            COMPLETION_LATENESS_SECONDS.observe(max(0.0, now - completion["deadline"]))
 
+        final = completions[-1]
+        self.last_deadline = final["deadline"]
+        self.last_completions = completions
         # Notify all subscribers
         for callback in self.mode_complete_callbacks:
             try:
-                callback(previous_mode)
+                self._run_if_coroutine(callback(final["mode"]), "mode_complete")
             except Exception as e:
+                CALLBACK_ERRORS.inc(kind="mode_complete")
                 self._debug_log(f"Error in mode complete callback: {e}")
 
-        self._check_and_notify_state_change()
-
     def get_full_time(self):
         """
-        Returns the full time for the current mode.
+        Returns the full time for the current mode. Called on every UI tick, so it doesn't log.
         """
-        self._debug_log("get_full_time called")
-        if self.timer.current_mode == "Focus Round":
-            return self.timer.focus_round_duration
-        elif self.timer.current_mode == "Recharge":
-            return self.timer.recharge
-        elif self.timer.current_mode == "Extended Recharge":
-            return self.timer.big_recharge
-        return 0  # Fallback
+        return self.timer.get_full_time()
 
     def _check_and_notify_state_change(self):
         """Detects meaningful state changes and triggers callbacks."""
         self._debug_log("_check_and_notify_state_change called")
         state = self.get_state()
-        comparable_state = {
-            "running": state["running"],
-            "mode": state["mode"],
-            "current_focus_rounds": state["current_focus_rounds"],
-        }
+        # Also covers changes that aren't "meaningful" below, e.g. new durations
+        self._publish_state(state)
+
+        comparable_state = self._get_comparable_state(state)
         if comparable_state != self._last_comparable_state:
             self._last_comparable_state = comparable_state
             # Notify all subscribers
             for callback in self.state_change_callbacks:
                 try:
-                    callback(state)
+                    self._run_if_coroutine(callback(state), "state_change")
                 except Exception as e:
+                    CALLBACK_ERRORS.inc(kind="state_change")
                     self._debug_log(f"Error in state change callback: {e}")
+
+        # Only ever called on transitions, so this is where we checkpoint. It
+        # comes after the callbacks so background database work (maintenance)
+        # has been told to stop before we need the write lock.
+        self._save_checkpoint()
+
+    def _run_if_coroutine(self, result, kind):
+        """
+        Callbacks may be coroutine functions (e.g. network notifications); their
+        coroutines run on the async runner instead of blocking the tick.
+        """
+        if not asyncio.iscoroutine(result):
+            return
+        if self.async_runner is None:
+            result.close()
+            self._debug_log(f"Dropping {kind} coroutine, no async runner")
+            return
+
+        def on_done(future):
+            if future.exception() is not None:
+                CALLBACK_ERRORS.inc(kind=kind)
+                self._debug_log(f"Error in async {kind} callback: {future.exception()}")
+
+        self.async_runner.submit(result, on_done=on_done)
+
+    def _get_comparable_state(self, state):
+        return {
+            "running": state["running"],
+            "mode": state["mode"],
+            "current_focus_rounds": state["current_focus_rounds"],
+        }
@@ -0,0 +1,152 @@
+# src/tomatix/notifiers/__init__.py
+"""
+Notifier plugins: extra ways to announce a completed phase (desktop popup,
+sound, webhook, shell command, or anything registered by another package
+under the "tomatix.notifiers" entry point group).
+
+Only enabled notifiers are ever looked up, and they are imported on the
+first completion, not at startup. Deliveries run off the Tk thread, each
+with its own timeout, so a slow or hanging notifier never delays the tick.
+"""
+import asyncio
+import importlib
+import time
+from datetime import datetime
+
+ENTRY_POINT_GROUP = "tomatix.notifiers"
+
+# Used when tomatix runs from a source tree without installed entry points
+BUILTIN_NOTIFIERS = {
+    "popup": "tomatix.notifiers.popup:PopupNotifier",
+    "sound": "tomatix.notifiers.sound:SoundNotifier",
+    "webhook": "tomatix.notifiers.webhook:WebhookNotifier",
+    "shell": "tomatix.notifiers.shell:ShellNotifier",
+}
+
+
+class Notifier:
+    """
+    Base class for notifier plugins, constructed with the options saved for it.
+    Subclasses implement notify(event) either as a coroutine (run on the
+    asyncio loop) or as a plain method (run on a worker thread). `event` is a
+    dict with mode, message and deadline (epoch seconds).
+    """
+
+    # Seconds a delivery may take before it is abandoned; overridable per plugin and in settings
+    timeout = 5.0
+
+    def __init__(self, **options):
+        self.options = options
+
+    def notify(self, event):
+        raise NotImplementedError
+
+
+async def run_process(command, env=None, shell=False):
+    """Run a command to completion without blocking the loop; killed if the delivery times out."""
+    if shell:
+        process = await asyncio.create_subprocess_shell(
+            command, env=env, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+        )
+    else:
+        process = await asyncio.create_subprocess_exec(
+            *command, env=env, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+        )
+    try:
+        returncode = await process.wait()
+    except asyncio.CancelledError:
+        process.kill()
+        raise
+    if returncode:
+        raise RuntimeError(f"{command if shell else command[0]} exited with status {returncode}")
+
+
+def load_notifier_class(name):
+    """Resolve a notifier name through entry points, falling back to the built-ins."""
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name == name:
+            return entry_point.load()
+    if name in BUILTIN_NOTIFIERS:
+        module_name, _, class_name = BUILTIN_NOTIFIERS[name].partition(":")
+        return getattr(importlib.import_module(module_name), class_name)
+    raise LookupError(f"No notifier plugin named {name!r}")
+
+
+class NotificationDispatcher:
+    """
+    Delivers completion events to the enabled notifiers.
+    dispatch() returns a coroutine for TimerController's async runner, or
+    None when no notifier is enabled, so the default setup costs nothing.
+    """
+    def __init__(self, configs, debug=False):
+        """`configs` is a list of dicts with name, options and timeout (None for the plugin default)."""
+        self.configs = list(configs)
+        self.debug = debug
+        self._debug_log(f"__init__ called with {len(self.configs)} notifiers")
+
+        self._notifiers = None  # name -> (notifier, timeout), built on first dispatch
+        self.stats = {
+            config["name"]: {"sent": 0, "failed": 0, "timed_out": 0, "total_ms": 0.0, "max_ms": 0.0}
+            for config in self.configs
+        }
+
+    def _debug_log(self, message):
+        if self.debug:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            print(f"[DEBUG {self.__class__.__name__}] {now} - {message}")
+
+    def dispatch(self, event):
+        if not self.configs:
+            return None
+        return self._deliver(event)
+
+    async def _deliver(self, event):
+        if self._notifiers is None:
+            self._notifiers = self._load_notifiers()
+        await asyncio.gather(*(
+            self._deliver_one(name, notifier, timeout, event)
+            for name, (notifier, timeout) in self._notifiers.items()
+        ))
+
+    def _load_notifiers(self):
+        notifiers = {}
+        for config in self.configs:
+            try:
+                notifier = load_notifier_class(config["name"])(**config["options"])
+            except Exception as e:
+                self.stats[config["name"]]["failed"] += 1
+                self._debug_log(f"Error loading notifier {config['name']!r}: {e}")
+                continue
+            if config["timeout"] is not None:
+                notifier.timeout = config["timeout"]
+            notifiers[config["name"]] = (notifier, notifier.timeout)
+        return notifiers
+
+    async def _deliver_one(self, name, notifier, timeout, event):
+        stats = self.stats[name]
+        started = time.perf_counter()
+        try:
+            if asyncio.iscoroutinefunction(notifier.notify):
+                await asyncio.wait_for(notifier.notify(event), timeout)
+            else:
+                loop = asyncio.get_running_loop()
+                await asyncio.wait_for(loop.run_in_executor(None, notifier.notify, event), timeout)
+        except asyncio.TimeoutError:
+            stats["timed_out"] += 1
+            self._debug_log(f"Notifier {name!r} timed out after {timeout} s")
+            return
+        except Exception as e:
+            stats["failed"] += 1
+            self._debug_log(f"Error in notifier {name!r}: {e}")
+            return
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        stats["sent"] += 1
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    def get_stats(self):
+        """Per-notifier delivery counts and timings (milliseconds)."""
+        return {name: dict(stats) for name, stats in self.stats.items()}
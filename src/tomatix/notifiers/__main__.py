@@ -0,0 +1,57 @@
+# src/tomatix/notifiers/__main__.py
+"""
+Configure notifier plugins:
+
+    python -m tomatix.notifiers list
+    python -m tomatix.notifiers enable webhook --option url=http://127.0.0.1:9000/hook --timeout 2
+    python -m tomatix.notifiers enable shell --option "command=say 'Break time'"
+    python -m tomatix.notifiers disable webhook
+"""
+import argparse
+
+from tomatix.core.persistence import PersistenceManager
+from tomatix.notifiers import BUILTIN_NOTIFIERS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Configure Tomatix notifier plugins")
+    parser.add_argument("--db", default=None, help="database path (default: the app's database)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="show configured notifiers")
+    enable = commands.add_parser("enable", help="enable a notifier, replacing its options")
+    enable.add_argument("name")
+    enable.add_argument("--option", action="append", default=[], metavar="KEY=VALUE")
+    enable.add_argument("--timeout", type=float, default=None, help="seconds per delivery")
+    disable = commands.add_parser("disable", help="disable a notifier, keeping its options")
+    disable.add_argument("name")
+    args = parser.parse_args(argv)
+
+    persistence_manager = PersistenceManager(db_path=args.db)
+    configs = {config["name"]: config for config in persistence_manager.load_notifiers(enabled_only=False)}
+
+    if args.command == "list":
+        for name in sorted(set(BUILTIN_NOTIFIERS) | set(configs)):
+            config = configs.get(name)
+            if config is None:
+                print(f"{name:<10} off")
+            else:
+                state = "on" if config["enabled"] else "off"
+                timeout = "default" if config["timeout"] is None else f"{config['timeout']} s"
+                print(f"{name:<10} {state:<4} timeout {timeout:<8} {config['options']}")
+    elif args.command == "enable":
+        options = {}
+        for option in args.option:
+            key, separator, value = option.partition("=")
+            if not separator:
+                parser.error(f"--option expects KEY=VALUE, got {option!r}")
+            options[key] = value
+        persistence_manager.save_notifier(args.name, True, options, args.timeout)
+    elif args.command == "disable":
+        config = configs.get(args.name)
+        if config is None:
+            parser.error(f"{args.name!r} is not configured")
+        persistence_manager.save_notifier(args.name, False, config["options"], config["timeout"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+# src/tomatix/notifiers/popup.py
+import json
+import sys
+
+from tomatix.notifiers import Notifier, run_process
+
+
+class PopupNotifier(Notifier):
+    """
+    Desktop notification through notify-send (Linux/BSD) or osascript (macOS).
+    Options: title (default "Tomatix").
+    """
+
+    async def notify(self, event):
+        title = self.options.get("title", "Tomatix")
+        if sys.platform == "darwin":
+            script = f"display notification {json.dumps(event['message'])} with title {json.dumps(title)}"
+            await run_process(["osascript", "-e", script])
+        elif sys.platform.startswith("win"):
+            raise RuntimeError("Desktop popups are not supported on Windows; the in-app alert still shows")
+        else:
+            await run_process(["notify-send", "--app-name=Tomatix", title, event["message"]])
@@ -0,0 +1,20 @@
+# src/tomatix/notifiers/shell.py
+import os
+
+from tomatix.notifiers import Notifier, run_process
+
+
+class ShellNotifier(Notifier):
+    """
+    Runs a shell command, with the event in TOMATIX_MODE, TOMATIX_MESSAGE
+    and TOMATIX_DEADLINE. Options: command (required).
+    """
+
+    async def notify(self, event):
+        env = dict(
+            os.environ,
+            TOMATIX_MODE=event["mode"],
+            TOMATIX_MESSAGE=event["message"],
+            TOMATIX_DEADLINE="" if event["deadline"] is None else str(event["deadline"]),
+        )
+        await run_process(self.options["command"], env=env, shell=True)
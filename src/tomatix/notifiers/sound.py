@@ -0,0 +1,19 @@
+# src/tomatix/notifiers/sound.py
+from tomatix.core.audio import AudioEngine
+from tomatix.notifiers import Notifier
+
+
+class SoundNotifier(Notifier):
+    """
+    Plays a sound through its own AudioEngine, e.g. a louder or different
+    sound than the alert's. Options: name (default "notification.wav") and
+    package (default "tomatix.resources").
+    """
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.audio_engine = AudioEngine(package=self.options.get("package", "tomatix.resources"))
+
+    def notify(self, event):
+        # Only enqueues; the engine's worker thread does the playback
+        self.audio_engine.play(self.options.get("name", "notification.wav"))
@@ -0,0 +1,23 @@
+# src/tomatix/notifiers/webhook.py
+import json
+import urllib.request
+
+from tomatix.notifiers import Notifier
+
+
+class WebhookNotifier(Notifier):
+    """
+    POSTs the event as JSON to a (typically local) endpoint.
+    Options: url (required) and headers (dict).
+    """
+
+    def notify(self, event):
+        request = urllib.request.Request(
+            self.options["url"],
+            data=json.dumps(event).encode("utf-8"),
+            headers={"Content-Type": "application/json", **self.options.get("headers", {})},
+            method="POST",
+        )
+        # The socket timeout matches the delivery timeout, so the worker thread is freed too
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
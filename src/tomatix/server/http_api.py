@@ -0,0 +1,214 @@
+# src/tomatix/server/http_api.py
+"""
+Local HTTP/JSON API over many named timers.
+
+    GET  /sessions                      list timer names
+    POST /sessions/<name>               create (body: optional settings)
+    GET  /sessions/<name>               state
+    POST /sessions/<name>/<action>      start, pause, reset, mark_done or state
+    PUT  /sessions/<name>/settings      focus_round, recharge, big_recharge (seconds),
+                                        cycles, sequence, tag
+    POST /batch                         {"requests": [{"session", "action", "settings"}]}
+    GET  /metrics                       Prometheus text format
+
+Runs on one asyncio loop with HTTP/1.1 keep-alive; every timer shares one
+PersistenceManager. Start it with:
+
+    python -m tomatix.server.http_api --port 8765 [--db tomatix_server.db]
+"""
+import argparse
+import asyncio
+import json
+from datetime import datetime
+from http import HTTPStatus
+
+from tomatix.core.metrics import REGISTRY, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from tomatix.core.persistence import PersistenceManager
+from tomatix.server.sessions import SessionManager
+
+MAX_BODY_BYTES = 1024 * 1024
+BATCH_ACTIONS = SessionManager.ACTIONS + ("create", "settings")
+
+
+class SessionAPIServer:
+    """Minimal HTTP/1.1 server (asyncio streams) routing requests to a SessionManager."""
+
+    def __init__(self, session_manager, debug=False):
+        self.sessions = session_manager
+        self.debug = debug
+        self._server = None
+        self.request_count = 0
+
+    def _debug_log(self, message):
+        if self.debug:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            print(f"[DEBUG {self.__class__.__name__}] {now} - {message}")
+
+    async def start(self, host="127.0.0.1", port=8765):
+        """Start listening; returns the bound port (useful with port=0)."""
+        self._server = await asyncio.start_server(self._serve_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _serve_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    self._write_response(writer, HTTPStatus.BAD_REQUEST, {"error": "Malformed request line"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                if "transfer-encoding" in headers:
+                    self._write_response(writer, HTTPStatus.LENGTH_REQUIRED, {"error": "Send a Content-Length"}, False)
+                    break
+                # No Content-Length means no body; a bad one leaves us unable to find the next request
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    self._write_response(writer, HTTPStatus.BAD_REQUEST, {"error": "Invalid Content-Length"}, False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    self._write_response(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                status, payload = self.handle(method, target, body)
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            self._debug_log(f"Connection dropped: {e}")
+        finally:
+            writer.close()
+
+    def _write_response(self, writer, status, payload, keep_alive):
+        if isinstance(payload, str):
+            body, content_type = payload.encode("utf-8"), METRICS_CONTENT_TYPE
+        else:
+            body, content_type = json.dumps(payload).encode("utf-8"), "application/json"
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+
+    def handle(self, method, target, body):
+        """Route one request. Returns (HTTPStatus, JSON-able payload or text)."""
+        self.request_count += 1
+        parts = [part for part in target.split("?")[0].split("/") if part]
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST, {"error": "Body is not valid JSON"}
+
+        try:
+            if parts == ["metrics"] and method == "GET":
+                return HTTPStatus.OK, REGISTRY.render()
+            if parts == ["batch"] and method == "POST":
+                return HTTPStatus.OK, self._handle_batch(data)
+            if parts == ["sessions"] and method == "GET":
+                return HTTPStatus.OK, {"sessions": self.sessions.list()}
+            if len(parts) == 2 and parts[0] == "sessions":
+                if method == "GET":
+                    return HTTPStatus.OK, self.sessions.describe(parts[1])
+                if method == "POST":
+                    return HTTPStatus.OK, self.sessions.create(parts[1], data)
+            if len(parts) == 3 and parts[0] == "sessions":
+                if parts[2] == "settings" and method == "PUT":
+                    return HTTPStatus.OK, self.sessions.update_settings(parts[1], data or {})
+                if method == "POST":
+                    return HTTPStatus.OK, self.sessions.perform(parts[1], parts[2])
+        except KeyError as e:
+            return HTTPStatus.NOT_FOUND, {"error": f"No session {e.args[0]!r}"}
+        except ValueError as e:
+            return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        except Exception as e:
+            # Anything else is our bug; answer it rather than dropping the connection
+            self._debug_log(f"Error handling {method} {target}: {e!r}")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error"}
+        return HTTPStatus.NOT_FOUND, {"error": f"No route for {method} {target}"}
+
+    def _handle_batch(self, data):
+        """
+        Run several session requests in order, in one round trip. Each result
+        carries its own status, so one bad entry doesn't fail the batch.
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("requests"), list):
+            raise ValueError('Batch body must be {"requests": [...]}')
+
+        results = []
+        for request in data["requests"]:
+            try:
+                name, action = request["session"], request.get("action", "state")
+                if action == "create":
+                    state = self.sessions.create(name, request.get("settings"))
+                elif action == "settings":
+                    state = self.sessions.update_settings(name, request.get("settings") or {})
+                elif action in BATCH_ACTIONS:
+                    state = self.sessions.perform(name, action)
+                else:
+                    raise ValueError(f"Unknown action {action!r}")
+                results.append({"status": HTTPStatus.OK.value, "state": state})
+            except KeyError as e:
+                results.append({"status": HTTPStatus.NOT_FOUND.value, "error": f"No session {e.args[0]!r}"})
+            except (ValueError, TypeError) as e:
+                results.append({"status": HTTPStatus.BAD_REQUEST.value, "error": str(e)})
+            except Exception as e:
+                self._debug_log(f"Error in batch request {request!r}: {e!r}")
+                results.append({"status": HTTPStatus.INTERNAL_SERVER_ERROR.value, "error": "Internal server error"})
+        return {"results": results}
+
+
+async def serve(host="127.0.0.1", port=8765, db_path=None, debug=False):
+    # The sqlite connection is created on, and only used from, the loop's thread
+    persistence_manager = PersistenceManager(db_path=db_path, debug=debug)
+    sessions = SessionManager(persistence_manager, asyncio.get_running_loop(), debug=debug)
+    sessions.load_all()
+
+    server = SessionAPIServer(sessions, debug=debug)
+    bound_port = await server.start(host, port)
+    print(f"Tomatix session API listening on http://{host}:{bound_port}", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        sessions.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tomatix HTTP/JSON session API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--db", default=None, help="database path (default: the app's database)")
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.db, args.debug))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# src/tomatix/server/sessions.py
+import re
+import time
+from datetime import datetime
+
+from tomatix.core.timer_controller import TimerController
+
+SESSION_NAME = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+
+
+class SessionPersistence:
+    """
+    A PersistenceManager as seen by one named timer: settings, checkpoint and
+    current tag go to that timer's own rows, everything else (focus round stats, compiled
+    sequences) is shared by all timers through the same connection.
+    """
+    def __init__(self, persistence_manager, name):
+        self.persistence_manager = persistence_manager
+        self.name = name
+
+    def __getattr__(self, attr):
+        return getattr(self.persistence_manager, attr)
+
+    def save_settings(self, focus_round, recharge, big_recharge, cycles, sequence=None):
+        self.persistence_manager.save_timer_session_settings(
+            self.name, focus_round, recharge, big_recharge, cycles, sequence
+        )
+
+    def load_settings(self):
+        return self.persistence_manager.load_timer_session_settings(self.name)
+
+    def load_sequence(self):
+        return self.persistence_manager.load_timer_session_sequence(self.name)
+
+    def save_checkpoint(self, *checkpoint):
+        self.persistence_manager.save_timer_session_checkpoint(self.name, *checkpoint)
+
+    def load_checkpoint(self):
+        return self.persistence_manager.load_timer_session_checkpoint(self.name)
+
+    def save_current_tag(self, tag):
+        self.persistence_manager.save_timer_session_tag(self.name, tag)
+
+    def load_current_tag(self):
+        return self.persistence_manager.load_timer_session_tag(self.name)
+
+
+class SessionManager:
+    """
+    Many named TimerControllers sharing one PersistenceManager.
+    Timers are never polled: each running timer has one event-loop call
+    scheduled at its deadline, and every request brings its timer up to date.
+    All methods must be called from the event loop's thread.
+    """
+
+    ACTIONS = ("start", "pause", "reset", "mark_done", "state")
+
+    def __init__(self, persistence_manager, loop, debug=False):
+        self.persistence_manager = persistence_manager
+        self.loop = loop
+        self.debug = debug
+        self._debug_log("__init__ called")
+
+        self.controllers = {}
+        # name -> (deadline, TimerHandle) of the one wake-up armed per running timer
+        self._deadline_handles = {}
+
+    def _debug_log(self, message):
+        if self.debug:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            print(f"[DEBUG {self.__class__.__name__}] {now} - {message}")
+
+    def load_all(self):
+        """Bring back every saved timer, so ones left running keep counting."""
+        for name in self.persistence_manager.list_timer_sessions():
+            self._load(name)
+
+    def _load(self, name):
+        controller = TimerController(
+            persistence_manager=SessionPersistence(self.persistence_manager, name),
+            debug=self.debug
+        )
+        self.controllers[name] = controller
+        self._schedule_deadline(name)
+        return controller
+
+    def create(self, name, settings=None):
+        """
+        Create the timer `name` (idempotent) and apply optional `settings`.
+        Raises ValueError for an invalid name or settings.
+        """
+        if not SESSION_NAME.match(name):
+            raise ValueError(f"Invalid session name {name!r}")
+        controller = self.controllers.get(name)
+        if controller is None:
+            controller = self._load(name)
+            if settings is None:
+                # Every timer gets its own settings row, starting from the defaults
+                timer = controller.timer
+                settings = {
+                    "focus_round": timer.focus_round_duration,
+                    "recharge": timer.recharge,
+                    "big_recharge": timer.big_recharge,
+                    "cycles": timer.cycles,
+                }
+        if settings is not None:
+            return self.update_settings(name, settings)
+        return self.describe(name)
+
+    def update_settings(self, name, settings):
+        """
+        Settings are durations in seconds: focus_round, recharge, big_recharge,
+        cycles, sequence; plus the timer's task/project tag (null clears it).
+        """
+        controller = self._get(name)
+        timer = controller.timer
+        try:
+            if "tag" in settings:
+                controller.set_tag(settings["tag"])
+            controller.save_settings(
+                int(settings.get("focus_round", timer.focus_round_duration)),
+                int(settings.get("recharge", timer.recharge)),
+                int(settings.get("big_recharge", timer.big_recharge)),
+                int(settings.get("cycles", timer.cycles)),
+                settings.get("sequence") or None,
+            )
+        except (TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid settings: {e}")
+        return self.describe(name)
+
+    def perform(self, name, action):
+        """Run `action` (one of ACTIONS) on timer `name` and return its state."""
+        if action not in self.ACTIONS:
+            raise ValueError(f"Unknown action {action!r}")
+        controller = self._get(name)
+        if action != "state":
+            getattr(controller, action)()
+        return self.describe(name)
+
+    def describe(self, name):
+        controller = self._get(name)
+        state = controller.update()
+        self._schedule_deadline(name)
+        return dict(
+            state,
+            name=name,
+            deadline=controller.timer.get_deadline(),
+            full_time=controller.get_full_time(),
+            tag=controller.current_tag,
+        )
+
+    def list(self):
+        return sorted(self.controllers)
+
+    def _get(self, name):
+        # KeyError for unknown timers, reported as 404 by the API
+        return self.controllers[name]
+
+    def _schedule_deadline(self, name):
+        """(Re)arm the single wake-up for this timer's current deadline, if it moved."""
+        deadline = self.controllers[name].timer.get_deadline()
+        armed = self._deadline_handles.get(name)
+        if armed is not None:
+            if armed[0] == deadline:
+                return
+            armed[1].cancel()
+            del self._deadline_handles[name]
+        if deadline is not None:
+            handle = self.loop.call_later(max(0.0, deadline - time.time()), self._on_deadline, name)
+            self._deadline_handles[name] = (deadline, handle)
+
+    def _on_deadline(self, name):
+        self._deadline_handles.pop(name, None)
+        controller = self.controllers.get(name)
+        if controller is None:
+            return
+        controller.update()
+        self._schedule_deadline(name)
+
+    def close(self):
+        for _, handle in self._deadline_handles.values():
+            handle.cancel()
+        self._deadline_handles.clear()
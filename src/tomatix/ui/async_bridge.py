@@ -0,0 +1,140 @@
+# src/tomatix/ui/async_bridge.py
+import asyncio
+import os
+import queue
+import threading
+import tkinter
+from datetime import datetime
+
+class AsyncBridge:
+    """
+    An asyncio event loop running alongside the Tk mainloop.
+
+    Tk keeps the UI thread; the asyncio loop runs on its own thread and
+    sleeps in select() until it has work. Results come back to Tk through a
+    self-pipe registered as a Tk file handler, so Tk only wakes when there is
+    something to deliver. Neither side polls.
+    On Windows, where Tk has no file handlers, results are drained on a slow
+    after() timer instead.
+    """
+
+    FALLBACK_POLL_MS = 50
+
+    def __init__(self, root, debug=False):
+        self.root = root
+        self.debug = debug
+        self._debug_log("__init__ called")
+
+        self.loop = None
+        self._thread = None
+        self._callbacks = queue.SimpleQueue()
+        self._wake_read = None
+        self._wake_write = None
+        self._poll_id = None
+        self.stats = {
+            "submitted": 0,
+            "delivered": 0,
+            "wakeups": 0,
+        }
+
+    def _debug_log(self, message):
+        if self.debug:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            print(f"[DEBUG {self.__class__.__name__}] {now} - {message}")
+
+    def start(self):
+        """Start the loop thread and hook the wake-up pipe into Tk."""
+        if self.loop is not None:
+            return
+        self.loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_loop, args=(ready,), name="tomatix-asyncio", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+
+        if hasattr(self.root.tk, "createfilehandler"):
+            self._wake_read, self._wake_write = os.pipe()
+            os.set_blocking(self._wake_read, False)
+            os.set_blocking(self._wake_write, False)
+            self.root.tk.createfilehandler(self._wake_read, tkinter.READABLE, self._on_wake)
+        else:
+            self._poll_id = self.root.after(self.FALLBACK_POLL_MS, self._poll)
+
+    def _run_loop(self, ready):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(ready.set)
+        self.loop.run_forever()
+
+    def submit(self, coro, on_done=None):
+        """
+        Schedule `coro` on the asyncio loop from the Tk thread. `on_done(future)`
+        is then called back on the Tk thread; future.result() returns the
+        coroutine's result or raises its exception.
+        Returns a concurrent.futures.Future.
+        """
+        self.stats["submitted"] += 1
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        if on_done is not None:
+            future.add_done_callback(lambda f: self.call_in_tk(on_done, f))
+        return future
+
+    def call_in_tk(self, callback, *args):
+        """Run `callback(*args)` on the Tk thread soon. Safe to call from any thread."""
+        self._callbacks.put((callback, args))
+        if self._wake_write is not None:
+            try:
+                os.write(self._wake_write, b"\0")
+            except OSError:
+                # Pipe full (a pending wake-up will drain everything) or bridge stopped
+                pass
+
+    def _on_wake(self, fd, mask):
+        self.stats["wakeups"] += 1
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._drain()
+
+    def _poll(self):
+        self._drain()
+        self._poll_id = self.root.after(self.FALLBACK_POLL_MS, self._poll)
+
+    def _drain(self):
+        while True:
+            try:
+                callback, args = self._callbacks.get_nowait()
+            except queue.Empty:
+                return
+            self.stats["delivered"] += 1
+            try:
+                callback(*args)
+            except Exception as e:
+                self._debug_log(f"Error in async callback: {e}")
+
+    def stop(self):
+        """Stop the loop thread and unhook from Tk."""
+        if self.loop is None:
+            return
+        self._debug_log("stop called")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=2)
+        if not self._thread.is_alive():
+            self.loop.close()
+        self.loop = None
+
+        try:
+            if self._wake_read is not None:
+                self.root.tk.deletefilehandler(self._wake_read)
+            if self._poll_id is not None:
+                self.root.after_cancel(self._poll_id)
+        except tkinter.TclError:
+            # Root already destroyed
+            pass
+        for fd in (self._wake_read, self._wake_write):
+            if fd is not None:
+                os.close(fd)
+        self._wake_read = self._wake_write = self._poll_id = None
@@ -9,23 +9,61 @@ from tomatix.ui.views.support_view import SupportView
 from tomatix.ui.windows.settings_window import SettingsWindow
 from tomatix.ui.windows.alert_window import AlertWindow
 from tomatix.core.timer_controller import TimerController
+from tomatix.core.audio import AudioEngine
+from tomatix.core.maintenance import DatabaseMaintenance
+from tomatix.core.shared_state import StatePublisher
+from tomatix.ui.async_bridge import AsyncBridge
+from tomatix.notifiers import NotificationDispatcher
 
 class MainUI:
     """
     The primary UI coordinator for the Tomatix timer.
     Manages different views and handles high-level UI events.
     """
-    def __init__(self, root, debug=False):
+    def __init__(self, root, persistence_manager=None, debug=False):
         self.debug = debug
         self.root = root
         self._debug_log("__init__ called")
 
-        # Core components
-        self.timer_controller = TimerController(debug=self.debug)
+        # Core components; status-bar scripts read the timer from the shared state file
+        try:
+            state_publisher = StatePublisher(debug=self.debug)
+        except OSError as e:
+            self._debug_log(f"State publishing disabled: {e}")
+            state_publisher = None
+
+        # Coroutine callbacks (network notifications, front-ends) run here, off the Tk thread
+        self.async_bridge = AsyncBridge(self.root, debug=self.debug)
+        self.async_bridge.start()
+
+        self.timer_controller = TimerController(
+            persistence_manager=persistence_manager,
+            state_publisher=state_publisher,
+            async_runner=self.async_bridge,
+            debug=self.debug
+        )
+
+        # Decode alert sounds once and keep a single playback thread around
+        self.audio_engine = AudioEngine(debug=self.debug)
+        self.audio_engine.preload(AlertWindow.NOTIFICATION_SOUND)
+
+        # Optional notifier plugins; nothing is imported until a notifier is actually used
+        self.notifications = NotificationDispatcher(
+            self.timer_controller.persistence_manager.load_notifiers(),
+            debug=self.debug
+        )
+
+        # Compacts and re-analyzes the database on a worker thread during breaks and pauses
+        self.maintenance = DatabaseMaintenance(
+            self.timer_controller.persistence_manager.db_path,
+            debug=self.debug
+        )
 
         # Hook up event handlers
         self.timer_controller.add_mode_complete_callback(self.handle_timer_completion)
+        self.timer_controller.add_mode_complete_callback(self.notify_plugins)
         self.timer_controller.add_state_change_callback(self.handle_state_change)
+        self.timer_controller.add_state_change_callback(self.maintenance.handle_state_change)
 
         # Custom colors for consistency
         self.COLORS = {
@@ -44,6 +82,15 @@ class MainUI:
         self._setup_views()
         self._setup_menu()
 
+        # Build the fullscreen alert once; completions only re-populate and show it
+        self.alert_window = AlertWindow(
+            self.root,
+            self.switch_view,
+            colors=self.COLORS,
+            audio_engine=self.audio_engine,
+            debug=self.debug
+        )
+
         # Initialize the UI update loop
         self.update_ui()
 
@@ -153,13 +200,25 @@ class MainUI:
 
         # Show completion alert
         message = self._get_completion_message(ended_mode)
-        AlertWindow(self.root, message, self.switch_view, colors=self.COLORS, debug=self.debug)
+        self.alert_window.show(message, deadline=self.timer_controller.last_deadline)
+
+    def notify_plugins(self, ended_mode):
+        """
+        Hand the completion to the notifier plugins. Returns a coroutine that
+        the timer controller runs on the async bridge (or None if none are enabled).
+        """
+        return self.notifications.dispatch({
+            "mode": ended_mode,
+            "message": self._get_completion_message(ended_mode),
+            "deadline": self.timer_controller.last_deadline,
+        })
 
     def _get_completion_message(self, ended_mode):
         """Get the appropriate message for the completion alert."""
         messages = {
             "Focus Round": "Focus Round complete! Time for a recharge!",
             "Recharge": "Recharge over! Back to work!",
+            "Micro Break": "Micro break over! Back to it!",
             "Extended Recharge": "Extended Recharge over! Let's get productive!"
         }
         return messages.get(ended_mode, "Timer complete!")
@@ -177,7 +236,19 @@ class MainUI:
             self.views["Focus"].update_ui()
         self.root.after(200, self.update_ui)
 
+    def shutdown(self):
+        """Stop background workers once the mainloop has exited."""
+        self._debug_log("shutdown called")
+        # Status bars should show "not running" rather than the last state
+        if self.timer_controller.state_publisher is not None:
+            self.timer_controller.state_publisher.close()
+        self.maintenance.stop()
+        # The one blocking maintenance step, done once the timer no longer needs the database
+        self.maintenance.enable_incremental_vacuum()
+        self.async_bridge.stop()
+        self.audio_engine.shutdown()
+
     def open_settings_window(self):
-        """Opens the settings window for timer configuration."""
+        """Opens the settings window for timer configuration and returns it."""
         self._debug_log("open_settings_window called")
-        SettingsWindow(self.root, self.timer_controller, colors=self.COLORS, debug=self.debug)
+        return SettingsWindow(self.root, self.timer_controller, colors=self.COLORS, debug=self.debug)
@@ -1,6 +1,9 @@
 import customtkinter as ctk
 from datetime import datetime
 
+# Marks a property the rendering layer has never pushed to Tk
+_UNSET = object()
+
 class BaseView(ctk.CTkFrame):
     """Base class for all views with common functionality."""
 
@@ -15,6 +18,34 @@ class BaseView(ctk.CTkFrame):
         self.bottom_padding.pack(side="bottom", fill="x")
         self.bottom_padding.pack_propagate(False)
 
+        # Rendering layer: last values pushed to Tk and changes waiting for the next flush
+        self._applied_props = {}
+        self._pending_props = {}
+        self._applied_layout = {}
+        self._pending_layout = {}
+        self._render_id = None
+        self.render_stats = {
+            "configure_requested": 0,
+            "configure_applied": 0,
+            "configure_skipped": 0,
+            "layout_requested": 0,
+            "layout_applied": 0,
+            "layout_skipped": 0,
+        }
+
+        # Coalesced layout: at most one geometry pass per idle cycle
+        self._geometry_id = None
+        self.layout_stats = {
+            "configure_events": 0,
+            "geometry_passes": 0,
+            "geometry_applied": 0,
+        }
+
+        # (sequence, funcid) of the root bindings made by bind_keys. unbind()
+        # only deletes a binding's Tcl command when given its funcid, so
+        # without these every view switch would leak one per key
+        self._key_bindings = []
+
         # Bind to configure event to handle resizing
         self.bind("<Configure>", self._on_configure)
 
@@ -36,27 +67,135 @@ class BaseView(ctk.CTkFrame):
     def bind_keys(self, root):
         """Bind view-specific keyboard shortcuts."""
         if self.on_back:  # Only bind Escape if there's a back action
-            root.bind("<Escape>", lambda e: self.on_back())
+            self._bind_key(root, "<Escape>", lambda e: self.on_back())
 
     def unbind_keys(self, root):
         """Unbind view-specific keyboard shortcuts."""
-        if self.on_back:
-            root.unbind("<Escape>")
+        for sequence, funcid in self._key_bindings:
+            root.unbind(sequence, funcid)
+        self._key_bindings = []
+
+    def _bind_key(self, root, sequence, func):
+        self._key_bindings.append((sequence, root.bind(sequence, func)))
+
+    def _set_props(self, widget, **props):
+        """
+        Request widget.configure(**props) on the next frame.
+        Properties that already hold the requested value never reach Tk.
+        """
+        self.render_stats["configure_requested"] += 1
+        applied = self._applied_props.get(widget, {})
+        pending = self._pending_props.get(widget, {})
+        changes = {
+            key: value for key, value in props.items()
+            if pending.get(key, applied.get(key, _UNSET)) != value
+        }
+        if not changes:
+            self.render_stats["configure_skipped"] += 1
+            return
+        self._pending_props.setdefault(widget, {}).update(changes)
+        self._schedule_render()
+
+    def _set_layout(self, widget, manager=None, **options):
+        """
+        Request that widget be laid out with `manager` ("grid" or "pack") and options
+        on the next frame, or hidden when manager is None.
+        """
+        self.render_stats["layout_requested"] += 1
+        layout = (manager, tuple(sorted(options.items()))) if manager else None
+        current = self._pending_layout.get(widget, self._applied_layout.get(widget))
+        if layout == current:
+            self.render_stats["layout_skipped"] += 1
+            return
+        self._pending_layout[widget] = layout
+        self._schedule_render()
+
+    def _schedule_render(self):
+        """Batch all pending changes into one flush per idle cycle."""
+        if self._render_id is None:
+            self._render_id = self.after_idle(self._flush_render)
+
+    def _flush_render(self):
+        """Push the net differences accumulated this frame to Tk."""
+        self._render_id = None
+
+        pending_layout, self._pending_layout = self._pending_layout, {}
+        # Hide before showing so grid cells are free for their new occupants
+        for widget, layout in sorted(pending_layout.items(), key=lambda item: item[1] is not None):
+            previous = self._applied_layout.get(widget)
+            if layout == previous:
+                self.render_stats["layout_skipped"] += 1
+                continue
+            if previous is not None:
+                getattr(widget, f"{previous[0]}_forget")()
+            if layout is not None:
+                manager, options = layout
+                getattr(widget, manager)(**dict(options))
+            self._applied_layout[widget] = layout
+            self.render_stats["layout_applied"] += 1
+
+        pending_props, self._pending_props = self._pending_props, {}
+        for widget, props in pending_props.items():
+            applied = self._applied_props.setdefault(widget, {})
+            changes = {
+                key: value for key, value in props.items()
+                if applied.get(key, _UNSET) != value
+            }
+            if not changes:
+                self.render_stats["configure_skipped"] += 1
+                continue
+            widget.configure(**changes)
+            applied.update(changes)
+            self.render_stats["configure_applied"] += 1
+
+    def get_render_stats(self):
+        """Returns a copy of the applied/skipped counters of the rendering layer."""
+        return dict(self.render_stats)
+
+    def pack(self, *args, **kwargs):
+        # Layout counters are per view switch
+        self.reset_layout_stats()
+        super().pack(*args, **kwargs)
+
+    def reset_layout_stats(self):
+        for key in self.layout_stats:
+            self.layout_stats[key] = 0
+
+    def get_layout_stats(self):
+        """Returns a copy of the layout counters since the view was last shown."""
+        return dict(self.layout_stats)
 
     def _on_configure(self, event):
-        """Handle resize events by updating window size."""
+        """Handle resize events by scheduling one window size update for the next idle cycle."""
         if event.widget == self:
-            # Get the required size for all widgets
-            required_width = self.winfo_reqwidth()
-            required_height = self.winfo_reqheight()
+            self.layout_stats["configure_events"] += 1
+            if self._geometry_id is None:
+                self._geometry_id = self.after_idle(self._apply_geometry)
+
+    def _apply_geometry(self):
+        """Fit the window to the view's requested size."""
+        self._geometry_id = None
+        # A view that was switched away from must not resize the window
+        if not self.winfo_ismapped():
+            return
+
+        self.layout_stats["geometry_passes"] += 1
 
-            # Add some padding
-            width = required_width + 20
-            height = required_height + 20
+        # Get the required size for all widgets, plus some padding
+        width = self.winfo_reqwidth() + 20
+        height = self.winfo_reqheight() + 20
+        geometry = f"{width}x{height}"
 
-            # Update window geometry if needed
-            current_width = self.winfo_width()
-            current_height = self.winfo_height()
+        # The Configure triggered by our own geometry() call comes back here with
+        # the window already at the target; skipping it is what breaks the
+        # feedback loop. A window resized by hand no longer matches, so it
+        # still snaps back to fit.
+        if (self.master.winfo_width(), self.master.winfo_height()) != (width, height):
+            self.master.geometry(geometry)
+            self.layout_stats["geometry_applied"] += 1
 
-            if width != current_width or height != current_height:
-                self.master.geometry(f"{width}x{height}")
\ No newline at end of file
+        self._debug_log(
+            f"geometry pass {self.layout_stats['geometry_passes']} since shown, "
+            f"{self.layout_stats['geometry_applied']} applied "
+            f"for {self.layout_stats['configure_events']} Configure events"
+        )
@@ -1,6 +1,8 @@
 import customtkinter as ctk
+import tkinter
 from datetime import datetime
 from tomatix.ui.views.base_view import BaseView
+from tomatix.ui.widgets.progress_ring import ProgressRing
 
 class FocusView(BaseView):
     """Main timer view showing the countdown and controls."""
@@ -26,6 +28,7 @@ class FocusView(BaseView):
             "running": False,
             "remaining_time": self.timer_controller.get_full_time(),
             "mode": "Focus Round",
+            "is_focus": True,
             "current_focus_rounds": 1
         }
         self._update_buttons(initial_state)
@@ -41,6 +44,16 @@ class FocusView(BaseView):
         content = ctk.CTkFrame(self, fg_color="transparent")
         content.pack(padx=10, pady=10, expand=True)
 
+        # Progress through the current phase
+        self.progress_ring = ProgressRing(
+            content,
+            color=self.colors["primary"],
+            track_color=self.colors["secondary"],
+            background=self.colors["background"],
+            debug=self.debug
+        )
+        self.progress_ring.pack(pady=(0, 10))
+
         # Compact timer display
         self.time_label = ctk.CTkLabel(
             content,
@@ -72,6 +85,23 @@ class FocusView(BaseView):
         )
         self.progress_label.pack()
 
+        # Task/project the round is attributed to, typed or picked from recent ones
+        self.tag_entry = ctk.CTkComboBox(
+            content,
+            width=180,
+            values=self.timer_controller.persistence_manager.list_recent_tags(),
+            command=self._commit_tag,
+            font=("SF Pro Display", 12),
+            dropdown_font=("SF Pro Display", 12),
+            border_color=self.colors["secondary"],
+            button_color=self.colors["secondary"],
+            text_color=self.colors["text"]
+        )
+        self.tag_entry.set(self.timer_controller.current_tag or "")
+        self.tag_entry.pack(pady=(0, 10))
+        self.tag_entry.bind("<Return>", self._commit_tag)
+        self.tag_entry.bind("<FocusOut>", self._commit_tag)
+
         # Fixed-size button container
         button_container = ctk.CTkFrame(content, fg_color="transparent", height=40)
         button_container.pack(pady=(0, 10), fill="x")
@@ -114,16 +144,29 @@ class FocusView(BaseView):
         if self.on_mark_done:
             self.on_mark_done()
 
+    def _commit_tag(self, *args):
+        """Attach the typed or picked tag to the round and keep it at the top of the list."""
+        tag = self.timer_controller.set_tag(self.tag_entry.get())
+        self.tag_entry.set(tag or "")
+        values = self.tag_entry.cget("values") or []
+        if tag and (not values or values[0] != tag):
+            self.tag_entry.configure(values=[tag] + [value for value in values if value != tag])
+
+    def _on_key_toggle(self, event):
+        # Return and Space typed into the tag field belong to the field, not the timer
+        if isinstance(event.widget, tkinter.Entry):
+            return
+        if self.on_toggle:
+            self.on_toggle(event)
+
     def _handle_reset(self):
         """Local handler for reset button."""
         self.timer_controller.reset()
 
     def _update_buttons(self, state):
         """Update button visibility based on timer state."""
-        # Hide all buttons first
-        for button in [self.start_button, self.pause_button, self.resume_button,
-                      self.reset_button, self.done_button]:
-            button.grid_forget()
+        # Work out which buttons should be visible and where
+        columns = {}
 
         running = state.get("running", False)  # Default to False if not present
         remaining_time = state.get("remaining_time", self.timer_controller.get_full_time())
@@ -133,37 +176,54 @@ class FocusView(BaseView):
         if not running:
             if not timer_started:
                 # Timer hasn't started yet - show Start
-                self.start_button.grid(row=0, column=0, padx=5)
+                columns[self.start_button] = 0
             else:
                 # Timer is paused - show Resume and Done
-                self.resume_button.grid(row=0, column=0, padx=5)
-                self.done_button.grid(row=0, column=1, padx=5)
+                columns[self.resume_button] = 0
+                columns[self.done_button] = 1
         else:
             # Timer is running - show Pause and Reset
-            self.pause_button.grid(row=0, column=0, padx=5)
-            self.reset_button.grid(row=0, column=1, padx=5)
+            columns[self.pause_button] = 0
+            columns[self.reset_button] = 1
+
+        # Only buttons whose placement actually changed are re-gridded
+        for button in [self.start_button, self.pause_button, self.resume_button,
+                      self.reset_button, self.done_button]:
+            if button in columns:
+                self._set_layout(button, "grid", row=0, column=columns[button], padx=5)
+            else:
+                self._set_layout(button, None)
 
     def handle_state_change(self, state):
         """Update UI elements based on timer state."""
         self._debug_log(f"handle_state_change called with {state}")
 
-        total_cycles = self.timer_controller.timer.cycles
+        total_cycles = self.timer_controller.timer.plan.rounds
 
         # Update mode label with a more intuitive display
-        if state["mode"] == "Focus Round":
+        if state["is_focus"]:
             # Show current round number (add 1 since core counts from 0)
             current_round = state["current_focus_rounds"] + 1
-            self.mode_label.configure(text=f"ROUND {current_round}")
+            self._set_props(self.mode_label, text=f"ROUND {current_round}")
             # Show progress on second line
-            self.progress_label.configure(text=f"({current_round}/{total_cycles})")
+            self._set_props(self.progress_label, text=f"({current_round}/{total_cycles})")
         else:
             # During breaks, just show the mode name
-            self.mode_label.configure(text=state["mode"].upper())
-            self.progress_label.configure(text="")
+            self._set_props(self.mode_label, text=state["mode"].upper())
+            self._set_props(self.progress_label, text="")
+
+        # Transitions (start, pause, reset, next phase) always resync the ring
+        self.progress_ring.set_color(self.colors["primary"] if state["is_focus"] else self.colors["success"])
+        self._update_ring(state)
 
         # Update buttons
         self._update_buttons(state)
 
+    def _update_ring(self, state):
+        full_time = self.timer_controller.get_full_time()
+        if full_time > 0:
+            self.progress_ring.set_progress(1 - state["remaining_time"] / full_time)
+
     def update_ui(self):
         """Update the time display and check timer completion."""
         # Get updated state (this also checks for completion)
@@ -174,15 +234,20 @@ class FocusView(BaseView):
         seconds = int(remaining % 60)
         time_text = f"{minutes:02d}:{seconds:02d}"
 
-        self.time_label.configure(text=time_text)
+        # Skipped by the rendering layer when the second hasn't changed
+        self._set_props(self.time_label, text=time_text)
+
+        # Nothing moves while paused; the ring itself skips sub-pixel changes
+        if state["running"]:
+            self._update_ring(state)
+
+    def pack(self, *args, **kwargs):
+        super().pack(*args, **kwargs)
+        # State changes aren't forwarded while another view is showing
+        self.handle_state_change(self.timer_controller.get_state())
 
     def bind_keys(self, root):
         """Bind view-specific keyboard shortcuts."""
         # Don't call super().bind_keys() since Focus view doesn't need Escape
-        root.bind("<Return>", self.on_toggle)
-        root.bind("<space>", self.on_toggle)
-
-    def unbind_keys(self, root):
-        """Unbind view-specific keyboard shortcuts."""
-        root.unbind("<Return>")
-        root.unbind("<space>")
\ No newline at end of file
+        self._bind_key(root, "<Return>", self._on_key_toggle)
+        self._bind_key(root, "<space>", self._on_key_toggle)
\ No newline at end of file
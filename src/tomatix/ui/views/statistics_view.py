@@ -1,10 +1,19 @@
 # src/tomatix/ui/statistics_view.py
 import customtkinter as ctk
+from datetime import date, timedelta
 from tomatix.ui.views.base_view import BaseView
+from tomatix.ui.widgets.calendar_heatmap import CalendarHeatmap
 
 class StatisticsView(BaseView):
     """A minimalist view for displaying Focus Round statistics."""
 
+    # Hour-of-day chart size in pixels
+    HOUR_CHART_WIDTH = 240
+    HOUR_CHART_HEIGHT = 48
+    # Task/project tags listed, over the last PROJECT_DAYS days
+    TOP_PROJECTS = 3
+    PROJECT_DAYS = 30
+
     def __init__(self, root, timer_controller, on_back=None, colors=None, debug=False):
         super().__init__(root, on_back, debug)
         self.timer_controller = timer_controller
@@ -19,6 +28,9 @@ class StatisticsView(BaseView):
         }
         self._setup_ui()
 
+        # Completions update the (write-through cached) totals, so refresh from there
+        self.timer_controller.add_mode_complete_callback(self._on_mode_complete)
+
     def _setup_ui(self):
         """Create and arrange the UI elements."""
         # Center content frame
@@ -46,6 +58,81 @@ class StatisticsView(BaseView):
         )
         self.stats_label.pack()
 
+        # Streak and trend summary
+        self.trend_label = ctk.CTkLabel(
+            stats_frame,
+            text="",
+            font=("SF Pro Display", 14),
+            text_color=self.colors["secondary"]
+        )
+        self.trend_label.pack(pady=(15, 0))
+
+        # Focus time by task/project tag
+        self.projects_label = ctk.CTkLabel(
+            stats_frame,
+            text="",
+            font=("SF Pro Display", 14),
+            text_color=self.colors["secondary"]
+        )
+        self.projects_label.pack(pady=(10, 0))
+
+        # Productivity patterns: focus minutes by hour of day, plus a short summary
+        patterns_frame = ctk.CTkFrame(content, fg_color="transparent")
+        patterns_frame.pack(pady=(0, 20))
+
+        ctk.CTkLabel(
+            patterns_frame,
+            text="Focus by Hour",
+            font=("SF Pro Display", 14),
+            text_color=self.colors["secondary"]
+        ).pack()
+
+        self.hour_canvas = ctk.CTkCanvas(
+            patterns_frame,
+            width=self.HOUR_CHART_WIDTH,
+            height=self.HOUR_CHART_HEIGHT,
+            bg=self.colors["background"],
+            highlightthickness=0
+        )
+        self.hour_canvas.pack(pady=(5, 5))
+
+        # One bar per hour, created once and only resized afterwards
+        bar_width = self.HOUR_CHART_WIDTH / 24
+        self.hour_bars = [
+            self.hour_canvas.create_rectangle(
+                hour * bar_width + 1, self.HOUR_CHART_HEIGHT,
+                (hour + 1) * bar_width - 1, self.HOUR_CHART_HEIGHT,
+                fill=self.colors["primary"], width=0
+            )
+            for hour in range(24)
+        ]
+
+        self.patterns_label = ctk.CTkLabel(
+            patterns_frame,
+            text="",
+            font=("SF Pro Display", 12),
+            text_color=self.colors["secondary"]
+        )
+        self.patterns_label.pack()
+
+        # Year-at-a-glance heatmap
+        heatmap_frame = ctk.CTkFrame(content, fg_color="transparent")
+        heatmap_frame.pack(pady=(0, 20))
+
+        ctk.CTkLabel(
+            heatmap_frame,
+            text="Last 12 Months",
+            font=("SF Pro Display", 14),
+            text_color=self.colors["secondary"]
+        ).pack()
+
+        self.heatmap = CalendarHeatmap(
+            heatmap_frame,
+            background=self.colors["background"],
+            debug=self.debug
+        )
+        self.heatmap.pack(pady=(5, 0))
+
         # Back button
         ctk.CTkButton(
             self,
@@ -61,10 +148,104 @@ class StatisticsView(BaseView):
         ).pack(pady=(0, 20))
 
     def update_statistics(self):
-        """Update the statistics display."""
+        """Update the statistics display from the persistence stats cache."""
         total_focus_rounds, total_minutes = self.timer_controller.persistence_manager.get_today_stats()
         stats_text = f"{total_focus_rounds} Focus Rounds\n{total_minutes} Minutes"
         self.stats_label.configure(text=stats_text)
+        self.trend_label.configure(text=self._format_trends(
+            self.timer_controller.persistence_manager.get_analytics_summary()
+        ))
+        self.update_projects()
+        self.update_patterns()
+        self.update_heatmap()
+
+    def update_projects(self):
+        """List the most focused-on tags from the write-through cached per-tag totals."""
+        persistence_manager = self.timer_controller.persistence_manager
+        today = date.fromisoformat(persistence_manager.get_local_date())
+        start = today - timedelta(days=self.PROJECT_DAYS - 1)
+        totals = persistence_manager.get_tag_totals(start.isoformat(), today.isoformat(), limit=self.TOP_PROJECTS)
+        if not totals:
+            self.projects_label.configure(text="")
+            return
+        lines = [f"Last {self.PROJECT_DAYS} days by project:"]
+        lines += [f"{tag} · {rounds} rounds, {minutes} min" for tag, rounds, minutes in totals]
+        self.projects_label.configure(text="\n".join(lines))
+
+    def update_heatmap(self):
+        """
+        Load the heatmap with one aggregated query, but only when its range is
+        stale (first show or a new day); completions keep it current in between.
+        """
+        persistence_manager = self.timer_controller.persistence_manager
+        today = persistence_manager.get_local_date()
+        if self.heatmap.end_date is not None and self.heatmap.end_date.isoformat() == today:
+            return
+
+        start, end = self.heatmap.get_range(today)
+        minutes_by_date = persistence_manager.get_daily_minutes(start.isoformat(), end.isoformat())
+        self.heatmap.set_data(minutes_by_date, today)
+
+    def update_patterns(self):
+        """Redraw the hour chart and pattern summary from the session distributions."""
+        # Deferred so NumPy isn't loaded until the statistics screen is first shown
+        from tomatix.core.distributions import SESSION_LENGTH_EDGES, WEEKDAY_NAMES
+
+        distributions = self.timer_controller.persistence_manager.get_session_distributions()
+        if not distributions["sessions"]:
+            self.patterns_label.configure(text="No sessions yet")
+            return
+
+        by_hour = distributions["minutes_by_hour"]
+        peak = by_hour.max() or 1
+        bar_width = self.HOUR_CHART_WIDTH / 24
+        for hour, bar in enumerate(self.hour_bars):
+            top = self.HOUR_CHART_HEIGHT * (1 - by_hour[hour] / peak)
+            self.hour_canvas.coords(
+                bar,
+                hour * bar_width + 1, top,
+                (hour + 1) * bar_width - 1, self.HOUR_CHART_HEIGHT
+            )
+
+        by_weekday = distributions["minutes_by_weekday"]
+        lengths = distributions["length_counts"]
+        common = int(lengths.argmax())
+        if common + 1 < len(SESSION_LENGTH_EDGES):
+            common_text = f"{SESSION_LENGTH_EDGES[common]}–{SESSION_LENGTH_EDGES[common + 1]} min"
+        else:
+            common_text = f"{SESSION_LENGTH_EDGES[common]}+ min"
+
+        self.patterns_label.configure(text=(
+            f"Peak hour {int(by_hour.argmax()):02d}:00 · Best day {WEEKDAY_NAMES[int(by_weekday.argmax())]}\n"
+            f"Most rounds last {common_text} · "
+            f"{distributions['early_fraction']:.0%} ended early"
+        ))
+
+    def _format_trends(self, summary):
+        """Turn the analytics summary into a few short lines."""
+        lines = [
+            f"{summary['current_streak']}-day streak (best {summary['longest_streak']})",
+            f"7-day avg {summary['avg_7']:.0f} min · 30-day avg {summary['avg_30']:.0f} min",
+        ]
+        change = summary["week_over_week"]
+        if change is not None:
+            arrow = "▲" if change >= 0 else "▼"
+            lines.append(f"{arrow} {abs(change):.0%} vs previous week")
+        return "\n".join(lines)
+
+    def _on_mode_complete(self, ended_mode):
+        """Live update while the view is open; hidden views catch up on pack()."""
+        # The heatmap only needs the cells for the days the batch's rounds ended on
+        persistence_manager = self.timer_controller.persistence_manager
+        days = {
+            persistence_manager.get_local_date(completion["deadline"])
+            for completion in self.timer_controller.last_completions
+        }
+        for day in sorted(days):
+            self.heatmap.update_day(day, persistence_manager.get_stats(day, day)[1])
+
+        if self.winfo_ismapped():
+            self.update_statistics()
 
     def pack(self, *args, **kwargs):
         super().pack(*args, **kwargs)
@@ -0,0 +1,105 @@
+import customtkinter as ctk
+from datetime import date, datetime, timedelta
+
+class CalendarHeatmap(ctk.CTkCanvas):
+    """
+    Year-at-a-glance grid of focus minutes per day (one column per week,
+    Monday on top). Cells are created once; updates only recolour cells
+    whose colour actually changes.
+    """
+
+    WEEKS = 53
+    CELL_SIZE = 9
+    CELL_GAP = 2
+
+    # Upper bounds (minutes) of each colour level; anything above uses the last colour
+    LEVELS = [0, 30, 60, 120]
+    LEVEL_COLORS = ["#3A3A3A", "#6B4A40", "#A0604C", "#C97A62", "#E8927C"]
+
+    def __init__(self, parent, background="#2B2B2B", debug=False):
+        step = self.CELL_SIZE + self.CELL_GAP
+        super().__init__(
+            parent,
+            width=self.WEEKS * step,
+            height=7 * step,
+            bg=background,
+            highlightthickness=0
+        )
+        self.debug = debug
+        self._debug_log("__init__ called")
+
+        self.end_date = None
+        self._minutes = {}
+        self._cell_colors = {}
+        self.recolor_count = 0
+
+        # Every cell is created once, at (week, weekday)
+        self._cells = {}
+        for week in range(self.WEEKS):
+            for weekday in range(7):
+                x, y = week * step, weekday * step
+                self._cells[(week, weekday)] = self.create_rectangle(
+                    x, y, x + self.CELL_SIZE, y + self.CELL_SIZE,
+                    fill=self.LEVEL_COLORS[0], width=0
+                )
+                self._cell_colors[(week, weekday)] = self.LEVEL_COLORS[0]
+
+    def _debug_log(self, message):
+        if self.debug:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            print(f"[DEBUG {self.__class__.__name__}] {now} - {message}")
+
+    def get_range(self, end_date):
+        """First and last day (date objects) shown when the grid ends at `end_date`."""
+        end_date = self._as_date(end_date)
+        last_monday = end_date - timedelta(days=end_date.weekday())
+        return last_monday - timedelta(weeks=self.WEEKS - 1), end_date
+
+    def set_data(self, minutes_by_date, end_date):
+        """
+        Show `minutes_by_date` ({YYYY-MM-DD: minutes}) with the grid ending at `end_date`.
+        Only cells whose colour changed are touched.
+        """
+        self._debug_log(f"set_data called with {len(minutes_by_date)} days ending {end_date}")
+        self.end_date = self._as_date(end_date)
+        self._minutes = dict(minutes_by_date)
+
+        start, _ = self.get_range(self.end_date)
+        for (week, weekday), item in self._cells.items():
+            day = start + timedelta(weeks=week, days=weekday)
+            minutes = self._minutes.get(day.isoformat(), 0)
+            self._recolor((week, weekday), self._color_for(minutes, future=day > self.end_date))
+
+    def update_day(self, day, minutes):
+        """Recolour the single cell for `day` (YYYY-MM-DD) after new rounds were logged."""
+        self._minutes[day] = minutes
+        cell = self._cell_for(self._as_date(day))
+        if cell is not None:
+            self._recolor(cell, self._color_for(minutes))
+
+    def _cell_for(self, day):
+        if self.end_date is None:
+            return None
+        start, end = self.get_range(self.end_date)
+        if not (start <= day <= end):
+            return None
+        offset = (day - start).days
+        return offset // 7, offset % 7
+
+    def _recolor(self, cell, color):
+        if self._cell_colors[cell] != color:
+            self.itemconfigure(self._cells[cell], fill=color)
+            self._cell_colors[cell] = color
+            self.recolor_count += 1
+
+    def _color_for(self, minutes, future=False):
+        if future:
+            return self["bg"]
+        for level, upper in enumerate(self.LEVELS):
+            if minutes <= upper:
+                return self.LEVEL_COLORS[level]
+        return self.LEVEL_COLORS[-1]
+
+    @staticmethod
+    def _as_date(day):
+        return date.fromisoformat(day) if isinstance(day, str) else day
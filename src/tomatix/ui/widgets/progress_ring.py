@@ -0,0 +1,72 @@
+import math
+import customtkinter as ctk
+from datetime import datetime
+
+class ProgressRing(ctk.CTkCanvas):
+    """
+    Circular progress indicator. The track and the progress arc are created
+    once; a redraw is a single itemconfigure of the arc's extent, and only
+    when the arc's end has moved by at least one pixel along the ring.
+    """
+
+    SIZE = 120
+    THICKNESS = 6
+
+    def __init__(self, parent, color="#E8927C", track_color="#3A3A3A", background="#2B2B2B", debug=False):
+        super().__init__(
+            parent,
+            width=self.SIZE,
+            height=self.SIZE,
+            bg=background,
+            highlightthickness=0
+        )
+        self.debug = debug
+        self._debug_log("__init__ called")
+
+        inset = self.THICKNESS / 2 + 1
+        bounds = (inset, inset, self.SIZE - inset, self.SIZE - inset)
+        self._track = self.create_oval(*bounds, outline=track_color, width=self.THICKNESS)
+        # Starts at 12 o'clock and grows clockwise (negative extent)
+        self._arc = self.create_arc(
+            *bounds, start=90, extent=0, style="arc",
+            outline=color, width=self.THICKNESS
+        )
+
+        # Number of distinct arc positions: one per pixel of circumference
+        self.steps = max(1, int(math.pi * (self.SIZE - 2 * inset)))
+        self._drawn_step = 0
+        self._color = color
+        self.redraw_stats = {
+            "requested": 0,
+            "drawn": 0,
+            "skipped": 0,
+        }
+
+    def _debug_log(self, message):
+        if self.debug:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            print(f"[DEBUG {self.__class__.__name__}] {now} - {message}")
+
+    def set_progress(self, fraction):
+        """
+        Show `fraction` (0..1) of the ring filled. Returns True if the arc was
+        redrawn, False when the change is below one pixel and Tk was left alone.
+        """
+        self.redraw_stats["requested"] += 1
+        step = round(min(max(fraction, 0.0), 1.0) * self.steps)
+        if step == self._drawn_step:
+            self.redraw_stats["skipped"] += 1
+            return False
+
+        self.itemconfigure(self._arc, extent=-360.0 * step / self.steps)
+        self._drawn_step = step
+        self.redraw_stats["drawn"] += 1
+        return True
+
+    def set_color(self, color):
+        if color != self._color:
+            self.itemconfigure(self._arc, outline=color)
+            self._color = color
+
+    def get_redraw_stats(self):
+        return dict(self.redraw_stats)
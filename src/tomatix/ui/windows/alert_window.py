@@ -1,17 +1,24 @@
 import customtkinter as ctk
+import time
+from collections import deque
 from datetime import datetime
-import threading
-import importlib.resources
-from playsound import playsound
+from tomatix.core.metrics import summarize_latencies
 
 class AlertWindow(ctk.CTkToplevel):
-    """Fullscreen alert window shown when a timer cycle completes."""
+    """
+    Fullscreen alert window shown when a timer cycle completes.
+    The window is built once and kept withdrawn; show() only swaps the
+    message and maps it again, so nothing is constructed at completion time.
+    """
 
-    def __init__(self, parent, message, on_close=None, colors=None, debug=False):
+    NOTIFICATION_SOUND = "notification.wav"
+    AUTO_CLOSE_MS = 30000
+
+    def __init__(self, parent, on_close=None, colors=None, audio_engine=None, debug=False):
         super().__init__(parent)
         self.debug = debug
         self.on_close = on_close
-        self.message = message
+        self.audio_engine = audio_engine
         self.colors = colors or {  # Fallback colors if none provided
             "primary": "#FF7F50",
             "secondary": "#95A5A6",
@@ -23,45 +30,90 @@ class AlertWindow(ctk.CTkToplevel):
         }
         self._debug_log("__init__ called")
 
-        # Play notification sound
-        self._play_notification()
-
-        # Wait for the window to be ready before configuring it
-        self.after(10, self._initialize_window)
-
-    def _initialize_window(self):
-        """Initialize window after it's fully created."""
-        self._debug_log("_initialize_window called")
+        self.visible = False
+        self._auto_close_id = None
+        # Deadline of the alert being shown, consumed once the window is mapped
+        self._pending_deadline = None
+        # Time from phase deadline to visible alert, in seconds
+        self._display_latencies = deque(maxlen=100)
 
         self.title("Timer Complete")
-        self._make_fullscreen()
-        self._setup_ui(self.message)
-
-        # Make window modal
-        self.transient(self.master)
-        self.grab_set()
+        self._setup_ui()
 
         # Bind keys to close
         self.bind("<Escape>", lambda e: self.close())
         self.bind("<Return>", lambda e: self.close())
         self.bind("<space>", lambda e: self.close())
+        self.bind("<Map>", self._on_map)
+
+        # Closing through the window manager should hide, not destroy, the pooled window
+        self.protocol("WM_DELETE_WINDOW", self.close)
 
-        self.after(30000, self.close)
+        # Stay hidden until the first completion
+        self.withdraw()
 
     def _debug_log(self, message):
         if self.debug:
             now = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
             print(f"[DEBUG {self.__class__.__name__}] {now} - {message}")
 
+    def show(self, message, deadline=None):
+        """
+        Re-populate the pre-built window and bring it up fullscreen.
+        `deadline` is the wall-clock end of the phase, used to measure display latency.
+        """
+        self._debug_log(f"show called with {message=}")
+        already_visible = self.visible
+        self.message_label.configure(text=message)
+        self._pending_deadline = deadline
+
+        # Play notification sound
+        self._play_notification()
+
+        self.deiconify()
+        self._make_fullscreen()
+
+        # Make window modal
+        self.transient(self.master)
+        self.grab_set()
+        self.focus_force()
+        self.visible = True
+
+        # No <Map> event will follow if the alert was already up
+        if already_visible:
+            self._record_display_latency()
+
+        # Restart the auto-close countdown for this alert
+        if self._auto_close_id is not None:
+            self.after_cancel(self._auto_close_id)
+        self._auto_close_id = self.after(self.AUTO_CLOSE_MS, self.close)
+
+    def get_display_latency_stats(self):
+        """
+        Returns a dict with the time from phase deadline to visible alert in milliseconds.
+        """
+        return summarize_latencies(self._display_latencies)
+
+    def _on_map(self, event):
+        """Record deadline-to-visible latency the first time the alert is mapped."""
+        if event.widget is self:
+            self._record_display_latency()
+
+    def _record_display_latency(self):
+        if self._pending_deadline is None:
+            return
+        latency = time.time() - self._pending_deadline
+        self._pending_deadline = None
+        self._display_latencies.append(latency)
+        self._debug_log(f"alert visible {latency * 1000:.1f} ms after deadline")
+
     def _play_notification(self):
-        """Play the notification sound in a separate thread."""
+        """Queue the notification sound on the shared audio engine."""
+        if self.audio_engine is None:
+            self._debug_log("No audio engine, skipping notification sound")
+            return
         try:
-            with importlib.resources.files('tomatix.resources').joinpath('notification.wav') as sound_path:
-                if sound_path.exists():
-                    threading.Thread(
-                        target=lambda: playsound(str(sound_path)),
-                        daemon=True
-                    ).start()
+            self.audio_engine.play(self.NOTIFICATION_SOUND)
         except Exception as e:
             self._debug_log(f"Error playing sound: {e}")
 
@@ -72,7 +124,7 @@ class AlertWindow(ctk.CTkToplevel):
         self.attributes('-topmost', True)
         self.attributes('-fullscreen', True)
 
-    def _setup_ui(self, message):
+    def _setup_ui(self):
         """Create and arrange the UI elements."""
         # Center container
         container = ctk.CTkFrame(self, fg_color="#2B2B2B")
@@ -91,14 +143,14 @@ class AlertWindow(ctk.CTkToplevel):
         )
         timer_label.pack(pady=(0, 20))
 
-        # Message
-        message_label = ctk.CTkLabel(
+        # Message (filled in by show())
+        self.message_label = ctk.CTkLabel(
             message_frame,
-            text=message,
+            text="",
             font=("SF Pro Display", 24),
             text_color="#FFFFFF"
         )
-        message_label.pack()
+        self.message_label.pack()
 
         # Subtitle
         subtitle = ctk.CTkLabel(
@@ -129,8 +181,16 @@ class AlertWindow(ctk.CTkToplevel):
         continue_button.pack()
 
     def close(self, event=None):
-        """Close the alert window."""
+        """Hide the alert window so it can be shown again on the next completion."""
         self._debug_log("close called")
+        if self._auto_close_id is not None:
+            self.after_cancel(self._auto_close_id)
+            self._auto_close_id = None
+        if not self.visible:
+            return
+        self.visible = False
+        self.grab_release()
+        self.attributes('-fullscreen', False)
+        self.withdraw()
         if self.on_close:
             self.on_close("Focus")
-        self.destroy()
\ No newline at end of file
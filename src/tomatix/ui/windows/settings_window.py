@@ -1,5 +1,6 @@
 import customtkinter as ctk
 from datetime import datetime
+from tomatix.core.flow_score import calculate_flow_score, explore_schedules, pareto_suggestions
 
 class SettingsWindow(ctk.CTkToplevel):
     """Configuration window for timer durations."""
@@ -10,6 +11,12 @@ class SettingsWindow(ctk.CTkToplevel):
     MAX_BIG_RECHARGE_MINUTES = 240  # 4 hours
     MAX_CYCLES = 10  # Maximum number of focus rounds before extended recharge
 
+    # Wait this long after the last keystroke before rescoring
+    RATIO_DEBOUNCE_MS = 250
+
+    # Scored schedule grid, shared by every settings window
+    _schedule_grid = None
+
     def __init__(self, parent, timer_controller, colors=None, debug=False):
         super().__init__(parent)
         self.debug = debug
@@ -24,9 +31,10 @@ class SettingsWindow(ctk.CTkToplevel):
             "accent": "#E67E22"
         }
         self._debug_log("__init__ called")
+        self._ratio_update_id = None
 
         self.title("Settings")
-        self.geometry("300x600")  # Increased height to fit all content
+        self.geometry("320x780")  # Room for suggestions and the custom sequence
 
         # Bind Escape key to close
         self.bind("<Escape>", lambda e: self.destroy())
@@ -47,34 +55,46 @@ class SettingsWindow(ctk.CTkToplevel):
         Calculate normalized flow score based on work-to-rest ratio.
         Returns tuple of (score, total_work_mins, total_rest_mins)
         """
-        try:
-            # Convert all inputs to integers
-            focus_mins = int(focus_mins)
-            recharge_mins = int(recharge_mins)
-            big_recharge_mins = int(big_recharge_mins)
-            cycles = int(cycles)
-
-            # Calculate total work and rest minutes
-            total_work_mins = focus_mins * cycles
-            total_rest_mins = (recharge_mins * (cycles - 1)) + big_recharge_mins
-
-            # Calculate ratio (work:rest)
-            current_ratio = total_work_mins / total_rest_mins
-
-            # Calculate baseline ratio (25/5/15/4 pattern)
-            baseline_work = 25 * 4  # 100 minutes of work
-            baseline_rest = (5 * 3) + 15  # 30 minutes of rest
-            baseline_ratio = baseline_work / baseline_rest
-
-            # Normalize the score (1.0 = baseline ratio)
-            score = round(current_ratio / baseline_ratio, 2)
-
-            return score, total_work_mins, total_rest_mins
-        except (ValueError, ZeroDivisionError):
-            return None, 0, 0
+        return calculate_flow_score(focus_mins, recharge_mins, big_recharge_mins, cycles)
+
+    def _get_schedule_grid(self):
+        """Score the whole settings grid once and reuse it for suggestions."""
+        if SettingsWindow._schedule_grid is None:
+            self._debug_log("_get_schedule_grid computing grid")
+            SettingsWindow._schedule_grid = explore_schedules()
+        return SettingsWindow._schedule_grid
+
+    def _schedule_ratio_update(self, *args):
+        """Debounce entry changes so scoring runs once the user stops typing."""
+        if self._ratio_update_id is not None:
+            self.after_cancel(self._ratio_update_id)
+        self._ratio_update_id = self.after(self.RATIO_DEBOUNCE_MS, self._update_ratio_label)
+
+    def destroy(self):
+        # A pending rescore would otherwise fire on the destroyed window
+        if self._ratio_update_id is not None:
+            self.after_cancel(self._ratio_update_id)
+            self._ratio_update_id = None
+        super().destroy()
+
+    def _update_suggestions(self, score, work_mins):
+        """Show Pareto-optimal schedules with a similar flow score."""
+        suggestions = pareto_suggestions(self._get_schedule_grid(), score, total_work=work_mins)
+        if not suggestions:
+            self.suggestions_label.pack_forget()
+            return
+
+        lines = [
+            f"{s['focus']}/{s['recharge']}/{s['big_recharge']} × {s['cycles']}"
+            f"  ({s['total_work']}m work, {s['total_rest']}m rest)"
+            for s in suggestions
+        ]
+        self.suggestions_label.configure(text="Try: " + "\n".join(lines))
+        self.suggestions_label.pack(after=self.ratio_label, pady=(0, 20))
 
     def _update_ratio_label(self, *args):
         """Update the flow score label whenever settings change."""
+        self._ratio_update_id = None
         try:
             focus = int(self.focus_round_entry.get())
             recharge = int(self.recharge_entry.get())
@@ -96,11 +116,14 @@ class SettingsWindow(ctk.CTkToplevel):
                     text=f"Flow Score: {score:.2f} ({description})"
                 )
                 self.ratio_label.pack()
+                self._update_suggestions(score, work_mins)
             else:
                 self.ratio_label.pack_forget()
+                self.suggestions_label.pack_forget()
 
         except ValueError:
             self.ratio_label.pack_forget()
+            self.suggestions_label.pack_forget()
 
     def _setup_ui(self):
         """Create and arrange the UI elements."""
@@ -125,6 +148,15 @@ class SettingsWindow(ctk.CTkToplevel):
         )
         self.ratio_label.pack(pady=(0, 20))  # Added padding below score
 
+        # Alternative schedules with a similar flow score (shown when available)
+        self.suggestions_label = ctk.CTkLabel(
+            container,
+            text="",
+            font=("SF Pro Display", 11),
+            text_color="#666666",
+            justify="left"
+        )
+
         # Settings frame
         settings_frame = ctk.CTkFrame(container, fg_color="transparent")
         settings_frame.pack(fill="x", pady=(0, 10))
@@ -158,10 +190,41 @@ class SettingsWindow(ctk.CTkToplevel):
             self.timer_controller.timer.cycles
         )
 
+        # Optional custom sequence, overrides the durations above when set
+        sequence_frame = ctk.CTkFrame(settings_frame, fg_color="transparent")
+        sequence_frame.pack(fill="x", pady=(0, 15))
+
+        ctk.CTkLabel(
+            sequence_frame,
+            text="Custom Sequence (optional)",
+            font=("SF Pro Display", 16),
+            text_color="#FFFFFF"
+        ).pack(anchor="w")
+
+        self.sequence_entry = ctk.CTkEntry(
+            sequence_frame,
+            height=32,
+            font=("SF Pro Display", 14),
+            corner_radius=16,
+            placeholder_text="e.g. f50 r10 x3 e30 e60"
+        )
+        self.sequence_entry.pack(fill="x", pady=(5, 0))
+        saved_sequence = self.timer_controller.persistence_manager.load_sequence()
+        if saved_sequence:
+            self.sequence_entry.insert(0, saved_sequence)
+
+        ctk.CTkLabel(
+            sequence_frame,
+            text="f/r/m/e = focus/recharge/micro/extended minutes,\nx = rounds per cycle, + = starts automatically",
+            font=("SF Pro Display", 11),
+            text_color="#666666",
+            justify="left"
+        ).pack(anchor="w", pady=(5, 0))
+
         # Bind entry changes to update ratio
         for entry_name in ['focus_round_entry', 'recharge_entry', 'extended_recharge_entry', 'cycles_entry']:
             entry = getattr(self, entry_name)
-            entry.bind('<KeyRelease>', self._update_ratio_label)
+            entry.bind('<KeyRelease>', self._schedule_ratio_update)
 
         # Initial ratio calculation
         self._update_ratio_label()
@@ -260,6 +323,7 @@ class SettingsWindow(ctk.CTkToplevel):
             recharge = int(self.recharge_entry.get())
             big_recharge = int(self.extended_recharge_entry.get())
             cycles = int(self.cycles_entry.get())
+            sequence = self.sequence_entry.get().strip() or None
 
             # Validate ranges
             if not (1 <= focus <= self.MAX_FOCUS_MINUTES):
@@ -276,7 +340,8 @@ class SettingsWindow(ctk.CTkToplevel):
                 focus * 60,
                 recharge * 60,
                 big_recharge * 60,
-                cycles
+                cycles,
+                sequence=sequence
             )
             self.destroy()
         except ValueError as e:
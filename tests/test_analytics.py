@@ -0,0 +1,90 @@
+# tests/test_analytics.py
+"""
+The incremental FocusAnalytics path (add() round by round, windows slid by
+get_summary()) must always agree with a full recompute over the same rows.
+"""
+import random
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from tomatix.core.analytics import FocusAnalytics
+from tomatix.core.persistence import PersistenceManager
+
+
+def rows_of(daily):
+    return [(day.isoformat(), rounds, minutes) for day, (rounds, minutes) in sorted(daily.items())]
+
+
+def recomputed_summary(daily, today, min_rounds):
+    analytics = FocusAnalytics(min_rounds=min_rounds)
+    analytics.recompute(rows_of(daily), today)
+    return analytics.get_summary(today)
+
+
+@pytest.mark.parametrize("min_rounds", [1, 2])
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_matches_recompute(seed, min_rounds):
+    rng = random.Random(seed)
+    today = date(2024, 1, 1) + timedelta(days=rng.randrange(365))
+    daily = {}
+    # Some history before the incremental path takes over, as after a restart
+    for offset in range(rng.randrange(60)):
+        if rng.random() < 0.6:
+            daily[today - timedelta(days=offset + 1)] = (rng.randint(1, 6), rng.randint(5, 200))
+
+    analytics = FocusAnalytics(min_rounds=min_rounds)
+    analytics.recompute(rows_of(daily), today)
+
+    for _ in range(400):
+        action = rng.random()
+        if action < 0.15:
+            # Day rollover, sometimes skipping whole days or weeks
+            today += timedelta(days=rng.choice([1, 1, 1, 2, 3, 8, 40]))
+        elif action < 0.75:
+            day = today
+        elif action < 0.95:
+            # Backfill, e.g. rounds that ended while the app was closed
+            day = today - timedelta(days=rng.randrange(1, 45))
+        else:
+            day = today - timedelta(days=rng.randrange(45, 400))
+
+        if action >= 0.15:
+            minutes = rng.randint(1, 90)
+            previous = daily.get(day, (0, 0))
+            daily[day] = (previous[0] + 1, previous[1] + minutes)
+            analytics.add(day, 1, minutes)
+
+        # Not every round is followed by a summary, so rollovers also happen between adds
+        if rng.random() < 0.5:
+            if analytics.needs_recompute:
+                # As PersistenceManager.get_analytics_summary does
+                analytics.recompute(rows_of(daily), today)
+            assert analytics.get_summary(today) == recomputed_summary(daily, today, min_rounds)
+
+
+def test_backfill_joining_streaks_is_recomputed():
+    analytics = FocusAnalytics()
+    analytics.recompute([("2024-03-01", 1, 25), ("2024-03-03", 1, 25)], "2024-03-03")
+    assert analytics.get_summary("2024-03-03")["longest_streak"] == 1
+
+    analytics.add("2024-03-02", 1, 25)
+    assert analytics.needs_recompute
+
+
+def test_persistence_summary_matches_recompute(tmp_path):
+    persistence_manager = PersistenceManager(db_path=str(tmp_path / "stats.db"))
+    rng = random.Random(0)
+    now = time.time()
+    # Prime the incremental state, then log rounds out of order across 60 days
+    persistence_manager.get_analytics_summary()
+    for _ in range(50):
+        batch = [
+            (rng.randint(5, 50), now - rng.randrange(60) * 86400 - rng.randrange(3600), None, False)
+            for _ in range(rng.randint(1, 4))
+        ]
+        persistence_manager.log_focus_rounds(batch)
+        today = persistence_manager.get_local_date()
+        expected = persistence_manager._recompute_analytics(today).get_summary(today)
+        assert persistence_manager.get_analytics_summary() == expected
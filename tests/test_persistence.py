@@ -0,0 +1,28 @@
+# tests/test_persistence.py
+"""Write-through caches must match what a fresh query returns."""
+import random
+import time
+from datetime import date, timedelta
+
+from tomatix.core.persistence import PersistenceManager
+
+
+def test_cached_tag_totals_match_fresh_query(tmp_path):
+    db_path = str(tmp_path / "stats.db")
+    persistence_manager = PersistenceManager(db_path=db_path)
+    today = date.fromisoformat(persistence_manager.get_local_date())
+    ranges = [(today - timedelta(days=days - 1)).isoformat() for days in (1, 7, 30)]
+    for start in ranges:
+        persistence_manager.get_tag_totals(start, today.isoformat())
+
+    rng = random.Random(0)
+    now = time.time()
+    for _ in range(40):
+        rounds = [(rng.randint(5, 50), now - rng.randrange(40) * 86400, None, False)]
+        persistence_manager.log_focus_rounds(rounds, tag=rng.choice(["api", "docs", "taxes", None]))
+
+    fresh = PersistenceManager(db_path=db_path)
+    for start in ranges:
+        for limit in (None, 2):
+            assert (persistence_manager.get_tag_totals(start, today.isoformat(), limit)
+                    == fresh.get_tag_totals(start, today.isoformat(), limit))
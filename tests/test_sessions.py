@@ -0,0 +1,54 @@
+# tests/test_sessions.py
+"""Named API timers keep their own state apart from each other and from the desktop app."""
+import asyncio
+
+import pytest
+
+from tomatix.core.persistence import PersistenceManager
+from tomatix.core.timer_controller import TimerController
+from tomatix.server.sessions import SessionManager
+
+
+@pytest.fixture
+def persistence_manager(tmp_path):
+    return PersistenceManager(db_path=str(tmp_path / "stats.db"))
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def complete_focus_round(perform):
+    perform("start")
+    perform("mark_done")
+
+
+def test_sessions_and_app_keep_separate_tags(persistence_manager, loop):
+    app = TimerController(persistence_manager=persistence_manager)
+    app.set_tag("client-project")
+    sessions = SessionManager(persistence_manager, loop)
+    sessions.create("writing", {"tag": "novel"})
+    sessions.create("reading")
+
+    assert sessions.describe("writing")["tag"] == "novel"
+    assert sessions.describe("reading")["tag"] is None
+    complete_focus_round(lambda action: sessions.perform("writing", action))
+    complete_focus_round(lambda action: sessions.perform("reading", action))
+    complete_focus_round(lambda action: getattr(app, action)())
+
+    tags = sorted(row[0] or "" for row in persistence_manager.db_conn.execute("SELECT tag FROM focus_sessions"))
+    assert tags == ["", "client-project", "novel"]
+    assert persistence_manager.load_current_tag() == "client-project"
+    sessions.close()
+
+    # Tags survive a restart, and saving settings again keeps them
+    sessions = SessionManager(persistence_manager, loop)
+    sessions.load_all()
+    sessions.update_settings("writing", {"cycles": 2})
+    assert sessions.describe("writing")["tag"] == "novel"
+    assert sessions.describe("reading")["tag"] is None
+    assert TimerController(persistence_manager=persistence_manager).current_tag == "client-project"
+    sessions.close()
@@ -0,0 +1,23 @@
+# tests/test_timer_controller.py
+"""Catching up after the process slept through several deadlines."""
+from tomatix.core.persistence import PersistenceManager
+from tomatix.core.timer_controller import TimerController
+
+
+def test_catch_up_notifies_once_and_logs_every_round(tmp_path):
+    persistence_manager = PersistenceManager(db_path=str(tmp_path / "stats.db"))
+    controller = TimerController(persistence_manager=persistence_manager)
+    # One-minute phases, each starting on its own once the previous one ends
+    controller.save_settings(60, 60, 60, 4, "f1+ r1+ x4 e1+")
+    ended = []
+    controller.add_mode_complete_callback(ended.append)
+
+    controller.start()
+    # Asleep for five deadlines: focus, break, focus, break, focus
+    controller.timer.start_time -= 5 * 60 + 30
+    controller.update()
+
+    assert len(controller.last_completions) == 5
+    assert ended == [controller.last_completions[-1]["mode"]]
+    assert controller.last_deadline == controller.last_completions[-1]["deadline"]
+    assert persistence_manager.db_conn.execute("SELECT COUNT(*) FROM focus_sessions").fetchone()[0] == 3